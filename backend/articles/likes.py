@@ -0,0 +1,62 @@
+"""
+파일명: articles/likes.py
+설명: 게시글/댓글 좋아요 토글 및 좋아요 수(likes_count) 관리
+
+기능:
+    - toggle_like: 좋아요 추가/취소와 likes_count 증감을 한 트랜잭션에서 처리
+    - reconcile_like_counts: like_users 실제 개수와 다른 likes_count 복구
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from .models import Article, Comment
+
+
+def toggle_like(model, pk: int, user) -> tuple:
+    """
+    좋아요 토글 (model: Article 또는 Comment)
+    반환: (liked, likes_count)
+    """
+    through = model.like_users.through
+    field = f"{model._meta.model_name}_id"  # article_id / comment_id
+    row = {field: pk, "user_id": user.pk}
+
+    with transaction.atomic():
+        deleted, _ = through.objects.filter(**row).delete()
+        if deleted:
+            liked, delta = False, -1
+        else:
+            try:
+                with transaction.atomic():
+                    through.objects.create(**row)
+                liked, delta = True, 1
+            except IntegrityError:
+                # 동시에 들어온 같은 요청이 먼저 추가함
+                liked, delta = True, 0
+
+        if delta:
+            model.objects.filter(pk=pk).update(likes_count=F("likes_count") + delta)
+        likes_count = model.objects.filter(pk=pk).values_list("likes_count", flat=True).get()
+
+    return liked, likes_count
+
+
+def reconcile_like_counts(dry_run: bool = False) -> dict:
+    """
+    likes_count를 like_users 실제 개수로 다시 맞춤
+    반환: {"articles": 고친 개수, "comments": 고친 개수}
+    """
+    fixed = {}
+    for key, model in (("articles", Article), ("comments", Comment)):
+        drifted = list(
+            model.objects.annotate(actual=Count("like_users"))
+            .exclude(likes_count=F("actual"))
+            .only("id", "likes_count")
+        )
+        if not dry_run:
+            for obj in drifted:
+                obj.likes_count = obj.actual
+            model.objects.bulk_update(drifted, ["likes_count"], batch_size=500)
+        fixed[key] = len(drifted)
+    return fixed
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:51
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_likes_count(apps, schema_editor):
+    for name in ("Article", "Comment"):
+        model = apps.get_model("articles", name)
+        rows = list(model.objects.annotate(actual=Count("like_users")).filter(actual__gt=0).only("id"))
+        for row in rows:
+            row.likes_count = row.actual
+        model.objects.bulk_update(rows, ["likes_count"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0004_article_like_users_comment_like_users'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_likes_count, migrations.RunPython.noop),
+    ]
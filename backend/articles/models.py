@@ -10,6 +10,7 @@
 - 게시글/댓글 CRUD
 - 조회수 카운트
 - 좋아요 기능 (ManyToMany)
+- 좋아요 수 저장 (likes_count, 토글 시 함께 갱신)
 """
 
 from django.db import models
@@ -30,6 +31,7 @@ class Article(models.Model):
         created_at: 작성일
         updated_at: 수정일
         like_users: 좋아요한 사용자들 (ManyToMany)
+        likes_count: 좋아요 수 (like_users 개수를 미리 저장)
     """
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="articles"
@@ -44,6 +46,7 @@ class Article(models.Model):
     like_users = models.ManyToManyField(
         settings.AUTH_USER_MODEL, blank=True, related_name="liked_articles"
     )
+    likes_count = models.PositiveIntegerField(default=0)
 
 
 class Comment(models.Model):
@@ -59,6 +62,7 @@ class Comment(models.Model):
         created_at: 작성일
         updated_at: 수정일
         like_users: 좋아요한 사용자들 (ManyToMany)
+        likes_count: 좋아요 수 (like_users 개수를 미리 저장)
     """
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="comments"
@@ -71,4 +75,5 @@ class Comment(models.Model):
     like_users = models.ManyToManyField(
         settings.AUTH_USER_MODEL, blank=True, related_name="liked_comments"
     )
+    likes_count = models.PositiveIntegerField(default=0)
 
@@ -9,10 +9,11 @@
     - CommentSerializer: 댓글 시리얼라이저
 
 주요 기능:
-    - 좋아요 수(likes_count) 자동 계산
+    - 좋아요 수(likes_count)는 모델에 저장된 값 사용
     - 현재 사용자 좋아요 여부(is_liked) 확인
     - 댓글 수(comments_count) 자동 계산
     - 작성자 닉네임(author_nickname) 자동 포함
+    - 댓글 수/좋아요 여부는 뷰 쿼리셋에서 annotate한 값 우선 사용 (없으면 직접 조회)
 """
 
 from rest_framework import serializers
@@ -29,21 +30,20 @@ class ArticleCreateSerializer(serializers.ModelSerializer):
 # 댓글 시리얼라이저
 class CommentSerializer(serializers.ModelSerializer):
     author_nickname = serializers.CharField(source='user.nickname', read_only=True)
-    likes_count = serializers.SerializerMethodField()
     is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = Comment
         fields = ('id', 'content', 'author_nickname', 'created_at', 'updated_at',"likes_count", "is_liked")
-        read_only_fields = ('id', 'author_nickname', 'created_at', 'updated_at')
-    def get_likes_count(self, obj):
-        return obj.like_users.count()
+        read_only_fields = ('id', 'author_nickname', 'created_at', 'updated_at', 'likes_count')
 
     def get_is_liked(self, obj):
         request = self.context.get("request")
         # request가 없거나 로그인 안 했으면 False
         if not request or not request.user.is_authenticated:
             return False
+        if hasattr(obj, "is_liked"):
+            return obj.is_liked
         # 로그인 했으면 내가 좋아요 눌렀는지 체크
         return obj.like_users.filter(pk=request.user.pk).exists()
 
@@ -53,7 +53,6 @@ class ArticleSerializer(serializers.ModelSerializer):
     author_nickname = serializers.CharField(source='user.nickname', read_only=True)
     comment_set = CommentSerializer(many=True, read_only=True)
     comments_count = serializers.SerializerMethodField()
-    likes_count = serializers.SerializerMethodField()
     is_liked = serializers.SerializerMethodField()
 
     class Meta:
@@ -63,17 +62,19 @@ class ArticleSerializer(serializers.ModelSerializer):
             'author_nickname', 'created_at', 'updated_at',
             'comment_set', 'comments_count', "likes_count", "is_liked"
         ) 
-        read_only_fields = ("user",)
+        read_only_fields = ("user", "likes_count")
 
     def get_comments_count(self, obj):
+        if hasattr(obj, "comments_count"):
+            return obj.comments_count
         return obj.comment_set.count()
-    def get_likes_count(self, obj):
-        return obj.like_users.count()
 
     def get_is_liked(self, obj):
         request = self.context.get("request")
         if not request or request.user.is_anonymous:
             return False
+        if hasattr(obj, "is_liked"):
+            return obj.is_liked
         return obj.like_users.filter(pk=request.user.pk).exists()
 
 # 게시글 목록용
@@ -83,7 +84,9 @@ class ArticleListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Article
-        fields = ('id', 'title', 'author_nickname', 'views', 'created_at', 'comments_count')
+        fields = ('id', 'title', 'author_nickname', 'views', 'created_at', 'comments_count', 'likes_count')
 
     def get_comments_count(self, obj):
+        if hasattr(obj, "comments_count"):
+            return obj.comments_count
         return obj.comment_set.count()
@@ -1,3 +1,187 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .likes import reconcile_like_counts, toggle_like
+from .models import Article, Comment
+from .view_counter import ViewCounter, get_counter
+
+
+class ArticleQueryCountTests(TestCase):
+    """목록/상세/댓글 조회 쿼리 수가 게시글·댓글·좋아요 개수와 무관하게 고정인지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.users = [
+            User.objects.create_user(username=f"user{i}", password="pw", nickname=f"닉네임{i}")
+            for i in range(3)
+        ]
+        cls.articles = []
+        for i in range(12):
+            article = Article.objects.create(user=cls.users[i % 3], title=f"제목 {i}", content="내용")
+            for j in range(i % 4):
+                comment = Comment.objects.create(user=cls.users[j % 3], article=article, content=f"댓글 {j}")
+                comment.like_users.add(*cls.users[: j + 1])
+            article.like_users.add(*cls.users[: i % 3])
+            cls.articles.append(article)
+
+        # 댓글/좋아요가 많은 게시글
+        cls.busy = cls.articles[-1]
+        for j in range(30):
+            comment = Comment.objects.create(user=cls.users[j % 3], article=cls.busy, content=f"추가 댓글 {j}")
+            comment.like_users.add(*cls.users[: j % 3 + 1])
+
+        # like_users.add()로 직접 넣은 좋아요 → 저장된 좋아요 수 맞추기
+        reconcile_like_counts()
+
+    def setUp(self):
+        self.client = APIClient()
+        self.addCleanup(get_counter().reset)
+
+    def login(self, user):
+        self.client.force_authenticate(user=user)
+
+    def test_article_list(self):
+        # 개수 조회 + 페이지 조회
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/v1/articles/", {"page_size": 50})
+        self.assertEqual(response.status_code, 200)
+
+        results = {row["id"]: row for row in response.data["results"]}
+        for article in self.articles:
+            self.assertEqual(results[article.pk]["comments_count"], article.comment_set.count())
+            self.assertEqual(results[article.pk]["author_nickname"], article.user.nickname)
+
+    def test_article_detail(self):
+        # 게시글(작성자/개수/좋아요 여부 포함) + 댓글(작성자/좋아요 포함), 조회수는 지연 반영
+        self.login(self.users[0])
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/api/v1/articles/{self.busy.pk}/")
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(response.data["comments_count"], self.busy.comment_set.count())
+        self.assertEqual(response.data["likes_count"], self.busy.like_users.count())
+        self.assertEqual(
+            response.data["is_liked"], self.busy.like_users.filter(pk=self.users[0].pk).exists()
+        )
+        for row in response.data["comment_set"]:
+            comment = Comment.objects.get(pk=row["id"])
+            self.assertEqual(row["likes_count"], comment.like_users.count())
+            self.assertEqual(row["is_liked"], comment.like_users.filter(pk=self.users[0].pk).exists())
+            self.assertEqual(row["author_nickname"], comment.user.nickname)
+
+    def test_article_detail_anonymous(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/api/v1/articles/{self.busy.pk}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data["is_liked"])
+        self.assertFalse(any(row["is_liked"] for row in response.data["comment_set"]))
+
+    def test_comment_list(self):
+        # 게시글 확인 + 댓글 조회
+        self.login(self.users[1])
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/api/v1/articles/{self.busy.pk}/comments/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), self.busy.comment_set.count())
+
+        liked = set(self.users[1].liked_comments.values_list("pk", flat=True))
+        for row in response.data:
+            self.assertEqual(row["is_liked"], row["id"] in liked)
+
+    def test_comment_detail(self):
+        comment = self.busy.comment_set.first()
+        self.login(self.users[0])
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/v1/comments/{comment.pk}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["likes_count"], comment.like_users.count())
+        self.assertTrue(response.data["is_liked"])
+
+
+class ViewCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.user = User.objects.create_user(username="writer", password="pw")
+        cls.hot = Article.objects.create(user=cls.user, title="인기글", content="내용", views=5)
+        cls.cold = Article.objects.create(user=cls.user, title="일반글", content="내용")
+
+    def test_flush_applies_buffered_views(self):
+        counter = ViewCounter(flush_interval=3600, dedupe_window=0)
+        for _ in range(3):
+            counter.record(self.hot.pk)
+        counter.record(self.cold.pk)
+        self.assertEqual(counter.pending(self.hot.pk), 3)
+
+        # 증가분(3, 1)별 UPDATE 1번씩
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(counter.flush(), 2)
+        updates = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 2)
+
+        self.hot.refresh_from_db()
+        self.cold.refresh_from_db()
+        self.assertEqual((self.hot.views, self.cold.views), (8, 1))
+        self.assertEqual(counter.pending(self.hot.pk), 0)
+        with self.assertNumQueries(0):
+            self.assertEqual(counter.flush(), 0)
+
+    def test_dedupe_window(self):
+        counter = ViewCounter(flush_interval=3600, dedupe_window=60)
+        self.assertTrue(counter.record(self.hot.pk, "user:1"))
+        self.assertFalse(counter.record(self.hot.pk, "user:1"))
+        self.assertTrue(counter.record(self.hot.pk, "user:2"))
+        self.assertTrue(counter.record(self.cold.pk, "user:1"))
+        self.assertEqual(counter.pending(self.hot.pk), 2)
+
+    def test_detail_response_includes_pending_views(self):
+        client = APIClient()
+        self.addCleanup(get_counter().reset)
+        for expected in (6, 7):
+            response = client.get(f"/api/v1/articles/{self.hot.pk}/")
+            self.assertEqual(response.data["views"], expected)
+        self.hot.refresh_from_db()
+        self.assertEqual(self.hot.views, 5)
+
+
+class LikeCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.users = [User.objects.create_user(username=f"liker{i}", password="pw") for i in range(3)]
+        cls.article = Article.objects.create(user=cls.users[0], title="제목", content="내용")
+        cls.comment = Comment.objects.create(user=cls.users[0], article=cls.article, content="댓글")
+
+    def test_toggle_updates_stored_count(self):
+        client = APIClient()
+        for user in self.users:
+            client.force_authenticate(user=user)
+            response = client.post(f"/api/v1/articles/{self.article.pk}/like/")
+            self.assertTrue(response.data["liked"])
+        self.assertEqual(response.data["likes_count"], 3)
+
+        response = client.post(f"/api/v1/articles/{self.article.pk}/like/")
+        self.assertEqual((response.data["liked"], response.data["likes_count"]), (False, 2))
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.likes_count, self.article.like_users.count())
+
+        response = client.post(f"/api/v1/comments/{self.comment.pk}/like/")
+        self.assertEqual((response.data["liked"], response.data["likes_count"]), (True, 1))
+
+    def test_reconcile_repairs_drift(self):
+        toggle_like(Comment, self.comment.pk, self.users[0])
+        self.article.like_users.add(*self.users)  # 카운터를 거치지 않은 변경
+        Comment.objects.filter(pk=self.comment.pk).update(likes_count=7)
+
+        self.assertEqual(reconcile_like_counts(dry_run=True), {"articles": 1, "comments": 1})
+        self.assertEqual(reconcile_like_counts(), {"articles": 1, "comments": 1})
+        self.assertEqual(reconcile_like_counts(), {"articles": 0, "comments": 0})
+
+        self.article.refresh_from_db()
+        self.comment.refresh_from_db()
+        self.assertEqual((self.article.likes_count, self.comment.likes_count), (3, 1))
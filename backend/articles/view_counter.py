@@ -0,0 +1,146 @@
+"""
+파일명: articles/view_counter.py
+설명: 게시글 조회수 지연 반영 (write-behind)
+
+기능:
+    - 상세 조회 시 DB에 바로 쓰지 않고 프로세스 메모리에 증가분만 모아둠
+    - settings.ARTICLE_VIEW_FLUSH_INTERVAL초마다 백그라운드 스레드가 한 번에 반영
+      (views = F("views") + n, 증가분이 같은 게시글끼리 UPDATE 1번)
+    - 같은 사용자/IP의 반복 조회는 settings.ARTICLE_VIEW_DEDUPE_WINDOW초 동안 1번만 집계 (0이면 끔)
+    - 프로세스 종료 시 남은 증가분 반영 (atexit)
+
+사용법:
+    counter = get_counter()
+    counter.record(article.pk, viewer_key(request))
+    article.views += counter.pending(article.pk)  # 응답에는 아직 반영 안 된 증가분 포함
+"""
+
+import atexit
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+
+from .models import Article
+
+
+def viewer_key(request) -> str:
+    """중복 조회 판단 기준 (로그인 사용자는 user id, 아니면 IP)"""
+    if request.user.is_authenticated:
+        return f"user:{request.user.pk}"
+    return f"ip:{request.META.get('REMOTE_ADDR', '')}"
+
+
+class ViewCounter:
+    def __init__(self, flush_interval: float, dedupe_window: float):
+        self.flush_interval = flush_interval
+        self.dedupe_window = dedupe_window
+        self._pending = defaultdict(int)  # article_id -> 아직 반영 안 된 조회수
+        self._seen = {}  # (article_id, viewer) -> 만료 시각
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------
+    # 집계
+    # ------------------------------------------------------------
+    def record(self, article_id: int, viewer: str = None) -> bool:
+        """조회 1회 기록, 반환: 집계 여부 (중복 조회면 False)"""
+        now = time.monotonic()
+        with self._lock:
+            if self.dedupe_window > 0 and viewer:
+                key = (article_id, viewer)
+                if self._seen.get(key, 0) > now:
+                    return False
+                self._seen[key] = now + self.dedupe_window
+            self._pending[article_id] += 1
+        self._ensure_thread()
+        return True
+
+    def pending(self, article_id: int) -> int:
+        with self._lock:
+            return self._pending.get(article_id, 0)
+
+    # ------------------------------------------------------------
+    # 반영
+    # ------------------------------------------------------------
+    def flush(self) -> int:
+        """모아둔 증가분을 DB에 반영, 반환: 반영한 게시글 수"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, defaultdict(int)
+                self._prune_seen()
+            if not pending:
+                return 0
+
+            # 증가분이 같은 게시글끼리 묶어서 UPDATE
+            by_delta = defaultdict(list)
+            for article_id, delta in pending.items():
+                by_delta[delta].append(article_id)
+
+            try:
+                with transaction.atomic():
+                    for delta, article_ids in by_delta.items():
+                        Article.objects.filter(pk__in=article_ids).update(views=F("views") + delta)
+            except Exception as e:
+                print(f"[조회수] 반영 실패, 다음 주기에 재시도: {e}")
+                with self._lock:
+                    for article_id, delta in pending.items():
+                        self._pending[article_id] += delta
+                return 0
+            return len(pending)
+
+    def _prune_seen(self) -> None:
+        now = time.monotonic()
+        self._seen = {key: expires for key, expires in self._seen.items() if expires > now}
+
+    def reset(self) -> None:
+        """반영하지 않고 버림 (테스트용)"""
+        with self._lock:
+            self._pending.clear()
+            self._seen.clear()
+
+    # ------------------------------------------------------------
+    # 백그라운드 반영 스레드
+    # ------------------------------------------------------------
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="article-view-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            close_old_connections()
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+    def close(self) -> None:
+        self._stop.set()
+        self.flush()
+
+
+_counter = None
+_counter_lock = threading.Lock()
+
+
+def get_counter() -> ViewCounter:
+    global _counter
+    if _counter is None:
+        with _counter_lock:
+            if _counter is None:
+                _counter = ViewCounter(
+                    flush_interval=getattr(settings, "ARTICLE_VIEW_FLUSH_INTERVAL", 10.0),
+                    dedupe_window=getattr(settings, "ARTICLE_VIEW_DEDUPE_WINDOW", 0),
+                )
+                atexit.register(_counter.close)
+    return _counter
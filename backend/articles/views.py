@@ -7,6 +7,9 @@
     - 댓글 CRUD (생성, 조회, 수정, 삭제)
     - 게시글/댓글 좋아요 기능
     - 페이지네이션 지원
+    - 조회수는 메모리에 모았다가 주기적으로 반영 (articles/view_counter.py)
+    - 목록/상세/댓글 조회는 댓글 수·내 좋아요 여부를 쿼리에서 함께 계산 (행마다 추가 쿼리 없음)
+    - 좋아요 수는 likes_count 컬럼에 저장 (토글 시 함께 갱신, articles/likes.py)
 
 API 엔드포인트:
     게시글:
@@ -26,9 +29,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
+from django.db.models import Count, Exists, IntegerField, OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
 
+from .likes import toggle_like
 from .models import Article, Comment
+from .view_counter import get_counter, viewer_key
 from .serializers import (
     ArticleListSerializer,
     ArticleSerializer,
@@ -44,6 +51,47 @@ class ArticlePagination(PageNumberPagination):
     max_page_size = 50
 
 
+# --------------------------------------------------
+# 조회용 쿼리셋 (작성자 JOIN + 개수/좋아요 여부 annotate)
+# --------------------------------------------------
+def _count_subquery(queryset, field):
+    """OuterRef("pk") 기준 행 개수 서브쿼리 (없으면 0)"""
+    counts = queryset.filter(**{field: OuterRef("pk")}).values(field).annotate(count=Count("pk")).values("count")
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def _is_liked(model, user):
+    """내 좋아요 여부 (좋아요 M2M 중간 테이블 EXISTS 서브쿼리)"""
+    if not user.is_authenticated:
+        return Value(False)
+    through = model.like_users.through
+    field = f"{model._meta.model_name}_id"  # article_id / comment_id
+    return Exists(through.objects.filter(**{field: OuterRef("pk")}, user_id=user.pk))
+
+
+def article_list_queryset():
+    return (
+        Article.objects.select_related("user")
+        .annotate(comments_count=_count_subquery(Comment.objects.all(), "article_id"))
+        .order_by("-created_at")
+    )
+
+
+def comment_queryset(user):
+    return Comment.objects.select_related("user").annotate(is_liked=_is_liked(Comment, user))
+
+
+def article_detail_queryset(user):
+    return (
+        Article.objects.select_related("user")
+        .annotate(
+            comments_count=_count_subquery(Comment.objects.all(), "article_id"),
+            is_liked=_is_liked(Article, user),
+        )
+        .prefetch_related(Prefetch("comment_set", queryset=comment_queryset(user).order_by("id")))
+    )
+
+
 # --------------------------------------------------
 # 게시글 목록 / 생성
 # GET    /api/v1/articles/
@@ -52,7 +100,7 @@ class ArticlePagination(PageNumberPagination):
 @api_view(["GET", "POST"])
 def article_list(request):
     if request.method == "GET":
-        articles = Article.objects.all().order_by("-created_at")
+        articles = article_list_queryset()
 
         paginator = ArticlePagination()
         paginated = paginator.paginate_queryset(articles, request)
@@ -90,18 +138,21 @@ def article_list(request):
 # --------------------------------------------------
 @api_view(["GET", "DELETE", "PATCH"])
 def article_detail(request, article_pk):
-    article = get_object_or_404(Article, pk=article_pk)
-
     if request.method == "GET":
-        # 조회수 증가
-        article.views += 1
-        article.save(update_fields=["views"])
+        article = get_object_or_404(article_detail_queryset(request.user), pk=article_pk)
+
+        # 조회수 증가 (DB 반영은 백그라운드에서 모아서, 응답에는 미반영분 포함)
+        counter = get_counter()
+        counter.record(article.pk, viewer_key(request))
+        article.views += counter.pending(article.pk)
 
         # is_liked 계산하려면 request context 필수
         serializer = ArticleSerializer(article, context={"request": request})
         return Response(serializer.data)
 
-    elif request.method == "DELETE":
+    article = get_object_or_404(Article, pk=article_pk)
+
+    if request.method == "DELETE":
         # 작성자만 삭제 가능
         if article.user != request.user:
             return Response(
@@ -122,6 +173,7 @@ def article_detail(request, article_pk):
         serializer.save()
 
         # 수정 후 반환도 context 포함해서 (is_liked/likes_count 등 일관성 유지)
+        article = article_detail_queryset(request.user).get(pk=article.pk)
         return Response(ArticleSerializer(article, context={"request": request}).data)
 
 
@@ -132,7 +184,7 @@ def article_detail(request, article_pk):
 @api_view(["GET"])
 def comment_list(request, article_pk):
     article = get_object_or_404(Article, pk=article_pk)
-    qs = article.comment_set.all().order_by("-id")
+    qs = comment_queryset(request.user).filter(article=article).order_by("-id")
 
     # 댓글도 is_liked 계산하려면 request context 필수
     serializer = CommentSerializer(qs, many=True, context={"request": request})
@@ -147,7 +199,7 @@ def comment_list(request, article_pk):
 # --------------------------------------------------
 @api_view(["GET", "PATCH", "DELETE"])
 def comment_detail(request, comment_pk):
-    comment = get_object_or_404(Comment, pk=comment_pk)
+    comment = get_object_or_404(comment_queryset(request.user), pk=comment_pk)
 
     if request.method == "GET":
         # 단건 조회도 context 포함
@@ -206,17 +258,10 @@ def toggle_article_like(request, article_pk):
     응답: liked(현재상태), likes_count
     """
     article = get_object_or_404(Article, pk=article_pk)
-    user = request.user
-
-    if article.like_users.filter(pk=user.pk).exists():
-        article.like_users.remove(user)
-        liked = False
-    else:
-        article.like_users.add(user)
-        liked = True
+    liked, likes_count = toggle_like(Article, article.pk, request.user)
 
     return Response(
-        {"liked": liked, "likes_count": article.like_users.count()},
+        {"liked": liked, "likes_count": likes_count},
         status=status.HTTP_200_OK,
     )
 
@@ -229,16 +274,9 @@ def toggle_article_like(request, article_pk):
 def toggle_comment_like(request, comment_pk):
     """댓글 좋아요 토글"""
     comment = get_object_or_404(Comment, pk=comment_pk)
-    user = request.user
-
-    if comment.like_users.filter(pk=user.pk).exists():
-        comment.like_users.remove(user)
-        liked = False
-    else:
-        comment.like_users.add(user)
-        liked = True
+    liked, likes_count = toggle_like(Comment, comment.pk, request.user)
 
     return Response(
-        {"liked": liked, "likes_count": comment.like_users.count()},
+        {"liked": liked, "likes_count": likes_count},
         status=status.HTTP_200_OK,
     )
@@ -0,0 +1,209 @@
+"""
+파일명: chatbot/browser_pool.py
+설명: 헤드리스 Chrome 드라이버 풀 (토스증권 크롤링용)
+
+기능:
+    - 프로세스당 최대 settings.TOSS_BROWSER_POOL_SIZE개의 드라이버를 띄워두고 재사용
+    - 빌려줄 때 상태 확인 (응답 없는 드라이버는 종료 후 새로 생성)
+    - settings.TOSS_BROWSER_MAX_USES번 사용한 드라이버는 종료 후 교체 (메모리 누수 방지)
+    - 첫 사용 시 나머지 드라이버를 백그라운드에서 미리 띄움
+    - ChromeDriver 경로는 프로세스당 1번만 확인 (ChromeDriverManager().install())
+
+사용법:
+    with get_pool().driver() as driver:
+        driver.get("https://www.tossinvest.com/")
+"""
+
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+class BrowserPoolTimeout(RuntimeError):
+    """대기 시간 안에 사용할 수 있는 드라이버가 없음"""
+
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def get_driver_path() -> str:
+    """ChromeDriver 경로 (webdriver-manager로 1번만 설치/확인)"""
+    global _driver_path
+    if _driver_path is None:
+        with _driver_path_lock:
+            if _driver_path is None:
+                _driver_path = ChromeDriverManager().install()
+    return _driver_path
+
+
+def create_chrome_driver():
+    """Chrome WebDriver 설정 및 반환"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # 서버에서 GUI 없이 실행
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")  # 이미지 로딩 비활성화 (속도 향상)
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+    return webdriver.Chrome(service=Service(get_driver_path()), options=chrome_options)
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class BrowserPool:
+    def __init__(self, size: int, max_uses: int, factory=create_chrome_driver):
+        self.size = size
+        self.max_uses = max_uses
+        self.factory = factory
+        self._idle = queue.LifoQueue()  # 최근에 쓴 드라이버부터 (캐시가 따뜻함)
+        self._slots = threading.BoundedSemaphore(size)  # 빌려준 드라이버 + 생성 중인 드라이버 수 제한
+        self._lock = threading.Lock()
+        self._live = 0
+        self._warming = False
+
+    # ------------------------------------------------------------
+    # 생성 / 종료 / 상태 확인
+    # ------------------------------------------------------------
+    def _create(self) -> _PooledDriver:
+        driver = self.factory()
+        with self._lock:
+            self._live += 1
+        return _PooledDriver(driver)
+
+    def _discard(self, pooled: _PooledDriver) -> None:
+        with self._lock:
+            self._live -= 1
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _healthy(pooled: _PooledDriver) -> bool:
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    # ------------------------------------------------------------
+    # 대여 / 반납
+    # ------------------------------------------------------------
+    def _acquire(self, timeout: float) -> _PooledDriver:
+        if not self._slots.acquire(timeout=timeout):
+            raise BrowserPoolTimeout("사용 가능한 브라우저가 없습니다.")
+        try:
+            while True:
+                try:
+                    pooled = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._create()
+                if self._healthy(pooled):
+                    return pooled
+                print("[브라우저 풀] 응답 없는 드라이버 교체")
+                self._discard(pooled)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, pooled: _PooledDriver, ok: bool) -> None:
+        try:
+            pooled.uses += 1
+            if not ok or pooled.uses >= self.max_uses:
+                self._discard(pooled)
+                return
+            try:
+                # 다음 요청 전에 페이지 메모리 정리
+                pooled.driver.get("about:blank")
+            except Exception:
+                self._discard(pooled)
+                return
+            self._idle.put(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout: float = None):
+        """드라이버 대여 (블록 안에서 예외가 나면 그 드라이버는 폐기)"""
+        if timeout is None:
+            timeout = getattr(settings, "TOSS_BROWSER_ACQUIRE_TIMEOUT", 30.0)
+        pooled = self._acquire(timeout)
+        self.warm_async()
+        ok = False
+        try:
+            yield pooled.driver
+            ok = True
+        finally:
+            self._release(pooled, ok)
+
+    # ------------------------------------------------------------
+    # 미리 띄우기 / 종료
+    # ------------------------------------------------------------
+    def warm(self) -> None:
+        """풀 크기까지 드라이버를 미리 생성"""
+        while True:
+            with self._lock:
+                if self._live >= self.size:
+                    return
+            if not self._slots.acquire(blocking=False):
+                return
+            try:
+                self._idle.put(self._create())
+            except Exception as e:
+                print(f"[브라우저 풀] 드라이버 생성 실패: {e}")
+                return
+            finally:
+                self._slots.release()
+
+    def warm_async(self) -> None:
+        with self._lock:
+            if self._warming or self._live >= self.size:
+                return
+            self._warming = True
+
+        def _run():
+            try:
+                self.warm()
+            finally:
+                with self._lock:
+                    self._warming = False
+
+        threading.Thread(target=_run, name="browser-pool-warm", daemon=True).start()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> BrowserPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool(
+                    size=getattr(settings, "TOSS_BROWSER_POOL_SIZE", 2),
+                    max_uses=getattr(settings, "TOSS_BROWSER_MAX_USES", 30),
+                )
+                atexit.register(_pool.close)
+    return _pool
@@ -0,0 +1,417 @@
+"""
+파일명: chatbot/intent.py
+설명: 로컬 의도 분류기 (LLM 호출 전 빠른 경로)
+
+기능:
+    - 키워드/정규식 규칙: 은행 위치, 상품 검색, 여행, 뉴스, 종목 의견, 투자 조언, 일상 대화
+      (자산/은행 약칭은 어절 단위로 조사를 떼고 비교 → "지금"의 "금", "우리 집"의 "우리" 오인 방지)
+    - 엔티티 추출: 은행명, 기간(개월), 예금/적금, 여행지, 뉴스 주제, 종목명, 키워드
+    - 로컬 모델: 문자 n-gram TF-IDF + 소프트맥스 회귀 (numpy)
+      · 학습 데이터: 기본 예문(SEED_EXAMPLES) + LLM이 분류한 기록(ChatIntentLog, source=llm)
+      · python manage.py train_intent_model 로 학습 → settings.CHATBOT_INTENT_MODEL_PATH
+    - classify_local: 규칙/모델 중 신뢰도가 높은 결과 반환
+      (views.resolve_intent에서 settings.CHATBOT_INTENT_THRESHOLD 미만이면 LLM 분류)
+
+반환 형식 (LLM 분류와 동일 + source):
+    {"intent": str, "entities": dict, "confidence": float, "source": "rule" | "model"}
+"""
+
+import json
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+from .models import ChatIntentLog
+
+
+INTENTS = [
+    "bank_location",
+    "product_search",
+    "travel_budget",
+    "news_search",
+    "investment_advice",
+    "stock_sentiment",
+    "general_chat",
+]
+
+BANKS = [
+    "국민은행", "신한은행", "우리은행", "하나은행", "농협", "기업은행", "SC제일은행", "씨티은행",
+    "카카오뱅크", "토스뱅크", "케이뱅크", "새마을금고", "우체국", "수협", "부산은행", "대구은행",
+]
+# "국민", "신한" 처럼 줄여 말한 경우 (어절 단위로 비교)
+BANK_ALIASES = {bank.replace("은행", ""): bank for bank in BANKS if bank.endswith("은행")}
+# 일상어/지명과 겹치는 약칭 → 은행 관련 단어가 같이 있을 때만 은행으로 인식
+AMBIGUOUS_BANK_ALIASES = {"우리", "하나", "기업", "부산", "대구"}
+BANK_CONTEXT = r"(은행|지점|영업점|ATM|atm|계좌|창구)"
+
+DESTINATIONS = [
+    "일본", "태국", "베트남", "미국", "유럽", "중국", "대만", "홍콩", "싱가포르", "호주",
+    "필리핀", "괌", "사이판", "하와이", "발리", "오사카", "도쿄", "후쿠오카", "방콕", "다낭", "파리", "런던",
+]
+
+LOCATION_WORDS = r"(가까운|근처|주변|지점|어디|위치|찾아|ATM|atm|영업점)"
+PRODUCT_WORDS = r"(금리|이자|추천|상품|최고|높은|비교|가입|이율)"
+TRAVEL_WORDS = r"(여행|호캉스|경비|비용|예산|환전|얼마)"
+NEWS_WORDS = r"(뉴스|소식|시황|헤드라인|기사)"
+# "N년"을 기간으로 볼 최대 연수 (2025년 같은 연도는 기간이 아님)
+MAX_TERM_YEARS = 5
+SENTIMENT_VERBS = r"(사야|살까|사도|팔아|팔까|팔아야|매수|매도|전망|들어가도|손절|물타기)"
+# 자산 단어 (어절 단위로 비교, 2글자 이상은 "주식투자"처럼 앞부분 일치도 허용)
+ASSET_WORDS = ("집", "금", "금값", "아파트", "부동산", "주식", "코인", "비트코인", "채권", "ETF", "etf", "펀드", "청약")
+ADVICE_WORDS = r"(투자|사는|살까|사도|어때|전망|좋아|해도|할까|괜찮)"
+GREETING = r"^(안녕|하이|hi|hello|헬로|고마워|감사|반가워|넌 누구|너는 누구|뭐 할 수 있|뭘 할 수 있)"
+SMALL_TALK = r"(점심|저녁|아침|날씨|심심|배고파|졸려|뭐 먹)"
+
+# 어절 끝에서 떼어낼 조사 (긴 것부터)
+PARTICLES = (
+    "에서는", "으로는", "이랑", "에서", "으로", "에게", "한테", "까지", "부터", "이나", "처럼",
+    "은", "는", "이", "가", "을", "를", "에", "로", "의", "도", "만", "랑", "과", "와", "나",
+)
+
+# 종목 의견 패턴에서 종목명이 될 수 없는 단어
+GENERIC_WORDS = {
+    "지금", "주식", "주가", "코인", "비트코인", "이더리움", "집", "아파트", "부동산", "금", "금값", "은", "달러", "엔화",
+    "채권", "펀드", "ETF", "etf", "이거", "그거", "뭐", "어떤", "요즘", "오늘",
+}
+
+STOCK_PATTERN = re.compile(
+    r"([가-힣A-Za-z0-9&.]{2,})\s*(?:주식|주가|종목)?\s*(?:지금|오늘|요즘)?\s*(?:은|는|을|를|이|가)?\s*" + SENTIMENT_VERBS
+)
+
+# 학습 데이터가 없을 때도 모델을 만들 수 있도록 의도별 기본 예문
+SEED_EXAMPLES = [
+    ("가까운 국민은행 어디야", "bank_location"),
+    ("근처 신한은행 지점 찾아줘", "bank_location"),
+    ("주변 은행 어디 있어", "bank_location"),
+    ("우리은행 영업점 위치 알려줘", "bank_location"),
+    ("12개월 적금 최고 금리 상품은?", "product_search"),
+    ("6개월 예금 추천해줘", "product_search"),
+    ("적금 상품 비교해줘", "product_search"),
+    ("이자 제일 높은 예금 뭐야", "product_search"),
+    ("일본 여행 비용 얼마나 들어", "travel_budget"),
+    ("태국 호캉스 예산 알려줘", "travel_budget"),
+    ("해외여행 준비 얼마나 해야 해", "travel_budget"),
+    ("유럽 여행 경비", "travel_budget"),
+    ("오늘 증시 뉴스 알려줘", "news_search"),
+    ("경제 뉴스 보여줘", "news_search"),
+    ("부동산 관련 소식", "news_search"),
+    ("해외 증시 시황", "news_search"),
+    ("지금 집 사는게 좋아?", "investment_advice"),
+    ("주식 투자 어때?", "investment_advice"),
+    ("부동산 전망 어때", "investment_advice"),
+    ("코인 투자해도 될까", "investment_advice"),
+    ("삼성전자 사야할까?", "stock_sentiment"),
+    ("테슬라 팔아야해?", "stock_sentiment"),
+    ("애플 지금 매수?", "stock_sentiment"),
+    ("카카오 전망 어때?", "stock_sentiment"),
+    ("오늘 날씨 어때?", "general_chat"),
+    ("점심 뭐 먹을까", "general_chat"),
+    ("안녕", "general_chat"),
+    ("넌 뭐 할 수 있어?", "general_chat"),
+]
+
+
+# ============================================================
+# 엔티티 추출
+# ============================================================
+def _tokens(text: str) -> set:
+    """어절 + 조사를 뗀 형태 ("금은" → {"금은", "금"}, "지금" → {"지금"})"""
+    tokens = set()
+    for word in re.findall(r"[가-힣A-Za-z0-9]+", text):
+        tokens.add(word)
+        for particle in PARTICLES:
+            if word.endswith(particle) and len(word) > len(particle):
+                tokens.add(word[: -len(particle)])
+                break
+    return tokens
+
+
+def _has_asset(tokens: set) -> bool:
+    for token in tokens:
+        for word in ASSET_WORDS:
+            if token == word or (len(word) >= 2 and token.startswith(word)):
+                return True
+    return False
+
+
+def _find_bank_alias(text: str, tokens: set):
+    has_context = re.search(BANK_CONTEXT, text) is not None
+    for alias, bank in BANK_ALIASES.items():
+        if alias in tokens and (has_context or alias not in AMBIGUOUS_BANK_ALIASES):
+            return bank
+    return None
+
+
+def _keywords(text: str) -> list:
+    words = re.findall(r"[가-힣A-Za-z0-9]+", text)
+    return [w for w in words if len(w) >= 2][:10]
+
+
+def _find_stock(text: str):
+    """종목 의견 문장에서 종목명 후보 추출"""
+    for match in STOCK_PATTERN.finditer(text):
+        # "금은"처럼 조사가 붙은 일반 단어도 제외
+        if not _tokens(match.group(1)) & GENERIC_WORDS:
+            return match.group(1)
+    return None
+
+
+def _is_known_stock(name: str) -> bool:
+    """DB 종목 (stocks 검색 인덱스의 이름/코드/심볼 정확 일치) 여부"""
+    from stocks import search_index
+
+    try:
+        return bool(search_index.get_index().exact(name))
+    except Exception:
+        return False
+
+
+def extract_entities(text: str) -> dict:
+    entities = {"keywords": _keywords(text)}
+
+    for bank in BANKS:
+        if bank in text:
+            entities["bank_name"] = bank
+            break
+    else:
+        entities["bank_name"] = _find_bank_alias(text, _tokens(text))
+
+    months = re.search(r"(\d+)\s*개월", text)
+    years = [
+        int(n) for n in re.findall(r"(?<!\d)(\d+)\s*년", text) if 1 <= int(n) <= MAX_TERM_YEARS
+    ]
+    if months:
+        entities["term_months"] = months.group(1)
+    elif years:
+        entities["term_months"] = str(years[0] * 12)
+
+    if "적금" in text:
+        entities["product_type"] = "saving"
+    elif "예금" in text:
+        entities["product_type"] = "deposit"
+
+    for destination in DESTINATIONS:
+        if destination in text:
+            entities["destination"] = destination
+            break
+
+    if re.search(NEWS_WORDS, text):
+        topic = re.sub(NEWS_WORDS + r"|알려줘|보여줘|찾아줘|관련|좀", " ", text)
+        entities["news_topic"] = " ".join(topic.split()).strip(" ?!.") or None
+
+    entities["stock_name"] = _find_stock(text)
+
+    return {key: value for key, value in entities.items() if value}
+
+
+# ============================================================
+# 규칙
+# ============================================================
+def classify_rules(text: str, entities: dict):
+    """(의도, 신뢰도) 또는 None"""
+    candidates = []
+
+    if re.search(NEWS_WORDS, text):
+        candidates.append(("news_search", 0.92))
+
+    if re.search(LOCATION_WORDS, text) and (entities.get("bank_name") or "은행" in text):
+        candidates.append(("bank_location", 0.95 if entities.get("bank_name") else 0.9))
+
+    if re.search(r"(예금|적금)", text) and re.search(PRODUCT_WORDS, text):
+        candidates.append(("product_search", 0.95))
+
+    if (entities.get("destination") and re.search(TRAVEL_WORDS, text)) or "해외여행" in text:
+        candidates.append(("travel_budget", 0.93))
+
+    stock_name = entities.get("stock_name")
+    if stock_name:
+        # DB에 있는 종목이면 확실, 아니면 (해외 종목 한글명 등) 모델/LLM에 맡김
+        candidates.append(("stock_sentiment", 0.95 if _is_known_stock(stock_name) else 0.75))
+    elif _has_asset(_tokens(text)) and re.search(ADVICE_WORDS, text):
+        # "집 근처 ..."처럼 위치를 묻는 문장이면 확신하지 않고 모델/LLM에 맡김
+        candidates.append(("investment_advice", 0.7 if re.search(LOCATION_WORDS, text) else 0.85))
+
+    if re.search(GREETING, text.strip()):
+        candidates.append(("general_chat", 0.9))
+    elif re.search(SMALL_TALK, text) and not candidates:
+        candidates.append(("general_chat", 0.85))
+
+    if not candidates:
+        return None
+    # 여러 규칙이 걸리면 신뢰도가 가장 높은 의도
+    return max(candidates, key=lambda c: c[1])
+
+
+# ============================================================
+# 로컬 모델 (문자 n-gram TF-IDF + 소프트맥스 회귀)
+# ============================================================
+def _ngrams(text: str) -> list:
+    text = " ".join(text.lower().split())
+    padded = f" {text} "
+    return [padded[i:i + n] for n in (1, 2, 3) for i in range(len(padded) - n + 1)]
+
+
+class IntentModel:
+    def __init__(self, vocab: dict, idf: np.ndarray, weights: np.ndarray, bias: np.ndarray, labels: list):
+        self.vocab, self.idf, self.weights, self.bias, self.labels = vocab, idf, weights, bias, labels
+
+    @staticmethod
+    def _tf(texts: list, vocab: dict) -> np.ndarray:
+        matrix = np.zeros((len(texts), len(vocab)), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for gram, count in Counter(_ngrams(text)).items():
+                col = vocab.get(gram)
+                if col is not None:
+                    matrix[row, col] = 1.0 + np.log(count)
+        return matrix
+
+    def _features(self, texts: list) -> np.ndarray:
+        x = self._tf(texts, self.vocab) * self.idf
+        norms = np.linalg.norm(x, axis=1, keepdims=True)
+        return x / np.where(norms == 0, 1.0, norms)
+
+    @classmethod
+    def fit(cls, texts: list, labels: list, max_features: int = 5000, epochs: int = 300,
+            lr: float = 2.0, l2: float = 1e-4) -> "IntentModel":
+        label_names = sorted(set(labels))
+        df = Counter(gram for text in texts for gram in set(_ngrams(text)))
+        vocab = {gram: i for i, (gram, _) in enumerate(df.most_common(max_features))}
+        idf = np.array(
+            [np.log((1 + len(texts)) / (1 + df[gram])) + 1 for gram in vocab], dtype=np.float32
+        )
+
+        model = cls(vocab, idf, None, None, label_names)
+        x = model._features(texts)
+        y = np.zeros((len(texts), len(label_names)), dtype=np.float32)
+        y[np.arange(len(texts)), [label_names.index(label) for label in labels]] = 1.0
+
+        weights = np.zeros((x.shape[1], len(label_names)), dtype=np.float32)
+        bias = np.zeros(len(label_names), dtype=np.float32)
+        for _ in range(epochs):
+            probs = _softmax(x @ weights + bias)
+            grad = (probs - y) / len(texts)
+            weights -= lr * (x.T @ grad + l2 * weights)
+            bias -= lr * grad.sum(axis=0)
+
+        model.weights, model.bias = weights, bias
+        return model
+
+    def predict(self, text: str) -> tuple:
+        """(의도, 확률)"""
+        probs = _softmax(self._features([text]) @ self.weights + self.bias)[0]
+        best = int(np.argmax(probs))
+        return self.labels[best], float(probs[best])
+
+    def save(self, path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(
+            tmp, idf=self.idf, weights=self.weights, bias=self.bias,
+            meta=np.array(json.dumps({"vocab": list(self.vocab), "labels": self.labels}, ensure_ascii=False)),
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path) -> "IntentModel":
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            vocab = {gram: i for i, gram in enumerate(meta["vocab"])}
+            return cls(vocab, data["idf"], data["weights"], data["bias"], meta["labels"])
+
+
+def _softmax(z: np.ndarray) -> np.ndarray:
+    z = z - z.max(axis=1, keepdims=True)
+    e = np.exp(z)
+    return e / e.sum(axis=1, keepdims=True)
+
+
+def training_data(limit: int = 5000, exclude_ids=()) -> tuple:
+    """(문장 목록, 라벨 목록) - 기본 예문 + 최근 LLM 분류 기록 limit개 (같은 문장은 최신 라벨)"""
+    data = dict(SEED_EXAMPLES)
+    logs = (
+        ChatIntentLog.objects.filter(source="llm", intent__in=INTENTS)
+        .exclude(id__in=exclude_ids)
+        .order_by("-created_at", "-id")
+        .values_list("message", "intent")
+    )
+    # 최신순으로 limit개 → 오래된 것부터 덮어써서 최신 라벨이 남도록
+    for message, intent in reversed(list(logs[:limit])):
+        data[message] = intent
+    return list(data), list(data.values())
+
+
+# 프로세스별 모델 (파일이 바뀌면 다시 읽음)
+_model = None
+_model_mtime = None
+_model_lock = threading.Lock()
+
+
+def get_model():
+    """학습된 모델 또는 None"""
+    global _model, _model_mtime
+    path = getattr(settings, "CHATBOT_INTENT_MODEL_PATH", None)
+    if not path:
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    if mtime != _model_mtime:
+        with _model_lock:
+            if mtime != _model_mtime:
+                try:
+                    _model = IntentModel.load(path)
+                except Exception as e:
+                    print(f"[INTENT] 모델 로드 실패: {e}")
+                    _model = None
+                _model_mtime = mtime
+    return _model
+
+
+# ============================================================
+# 진입점
+# ============================================================
+def classify_local(text: str, model=None) -> dict:
+    """
+    규칙과 로컬 모델 중 신뢰도가 높은 결과
+    (둘 다 없으면 general_chat, 신뢰도 0 → LLM 분류 대상)
+    """
+    entities = extract_entities(text)
+    result = {"intent": "general_chat", "entities": entities, "confidence": 0.0, "source": "rule"}
+
+    rule = classify_rules(text, entities)
+    if rule:
+        result.update(intent=rule[0], confidence=rule[1], source="rule")
+
+    model = model or get_model()
+    if model is not None and result["confidence"] < 0.95:
+        intent, prob = model.predict(text)
+        # 규칙과 같은 의도면 신뢰도를 합쳐서 올림 (규칙이 걸리지 않은 기본값 general_chat은 제외)
+        if rule and intent == result["intent"]:
+            result["confidence"] = round(1 - (1 - result["confidence"]) * (1 - prob), 3)
+        elif prob > result["confidence"]:
+            result.update(intent=intent, confidence=round(prob, 3), source="model")
+
+    return result
+
+
+def log_intent(message: str, result: dict, latency_ms: float) -> None:
+    if not getattr(settings, "CHATBOT_INTENT_LOG", True):
+        return
+    try:
+        ChatIntentLog.objects.create(
+            message=message[:2000],
+            intent=result.get("intent", "general_chat"),
+            entities=result.get("entities") or {},
+            confidence=float(result.get("confidence") or 0.0),
+            source=result.get("source", "llm"),
+            latency_ms=latency_ms,
+        )
+    except Exception as e:
+        print(f"[INTENT] 분류 기록 저장 실패: {e}")
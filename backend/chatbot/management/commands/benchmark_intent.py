@@ -0,0 +1,106 @@
+"""
+파일명: chatbot/management/commands/benchmark_intent.py
+설명: 로컬 의도 분류기 vs LLM 분류 벤치마크
+
+LLM이 분류한 기록(ChatIntentLog, source=llm)을 정답으로 보고,
+일부(--holdout)를 떼어 나머지로 학습한 로컬 모델로 평가합니다.
+
+출력:
+    - 로컬 분류 정확도 (전체 / 신뢰도 기준 이상만)
+    - 로컬 처리 비율 (LLM 호출을 건너뛴 비율)
+    - 지연 시간 p50/p95: 로컬, LLM(기록된 값 또는 --live 실측), 로컬 + LLM 혼합
+
+사용법:
+    python manage.py benchmark_intent
+    python manage.py benchmark_intent --holdout 0.3 --live 20
+"""
+
+import random
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from chatbot.intent import SEED_EXAMPLES, IntentModel, classify_local, training_data
+from chatbot.models import ChatIntentLog
+
+
+def _percentiles(values: list) -> str:
+    if not values:
+        return "-"
+    p50, p95 = np.percentile(values, [50, 95])
+    return f"p50 {p50:.2f}ms / p95 {p95:.2f}ms"
+
+
+class Command(BaseCommand):
+    help = "로컬 의도 분류기의 정확도와 지연 시간을 LLM 분류와 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=2000, help="평가에 사용할 최대 기록 수")
+        parser.add_argument("--holdout", type=float, default=0.2, help="평가용으로 떼어낼 비율")
+        parser.add_argument("--live", type=int, default=0, help="LLM 분류를 실제로 호출해 지연 시간을 잴 문장 수")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        from chatbot.views import classify_intent
+
+        threshold = getattr(settings, "CHATBOT_INTENT_THRESHOLD", 0.8)
+        logs = list(
+            ChatIntentLog.objects.filter(source="llm")
+            .values_list("id", "message", "intent", "latency_ms")[: options["limit"]]
+        )
+
+        if logs:
+            random.Random(options["seed"]).shuffle(logs)
+            cut = max(1, int(len(logs) * options["holdout"]))
+            evaluation = logs[:cut]
+            texts, labels = training_data(exclude_ids=[row[0] for row in evaluation])
+        else:
+            self.stdout.write("LLM 분류 기록이 없어 기본 예문으로만 평가합니다 (학습/평가 동일).")
+            evaluation = [(None, text, intent, None) for text, intent in SEED_EXAMPLES]
+            texts, labels = zip(*SEED_EXAMPLES)
+
+        model = IntentModel.fit(list(texts), list(labels))
+
+        correct = covered = covered_correct = 0
+        local_ms, hybrid_ms = [], []
+        llm_ms = [row[3] for row in evaluation if row[3]]
+        fallback_ms = float(np.median(llm_ms)) if llm_ms else None
+
+        for _, message, intent, logged_ms in evaluation:
+            started = time.perf_counter()
+            result = classify_local(message, model=model)
+            elapsed = (time.perf_counter() - started) * 1000
+            local_ms.append(elapsed)
+
+            hit = result["intent"] == intent
+            correct += hit
+            if result["confidence"] >= threshold:
+                covered += 1
+                covered_correct += hit
+                hybrid_ms.append(elapsed)
+            elif logged_ms or fallback_ms:
+                hybrid_ms.append(elapsed + (logged_ms or fallback_ms))
+
+        if options["live"]:
+            llm_ms = []
+            for _, message, _, _ in evaluation[: options["live"]]:
+                started = time.perf_counter()
+                classify_intent(message)
+                llm_ms.append((time.perf_counter() - started) * 1000)
+
+        total = len(evaluation)
+        self.stdout.write(f"평가 문장 {total}개 (학습 {len(texts)}개), 신뢰도 기준 {threshold}")
+        self.stdout.write(f"로컬 정확도 (전체): {correct / total:.1%}")
+        if covered:
+            self.stdout.write(
+                f"로컬 처리 비율: {covered / total:.1%}, 그중 정확도 {covered_correct / covered:.1%}"
+            )
+        else:
+            self.stdout.write("로컬 처리 비율: 0%")
+        # 혼합 경로: 로컬 처리분은 로컬 결과, 나머지는 LLM 결과(정답) 사용
+        self.stdout.write(f"혼합 경로 정확도: {(covered_correct + total - covered) / total:.1%}")
+        self.stdout.write(f"지연 시간 - 로컬: {_percentiles(local_ms)}")
+        self.stdout.write(f"지연 시간 - LLM: {_percentiles(llm_ms)}")
+        self.stdout.write(f"지연 시간 - 로컬 + LLM 혼합: {_percentiles(hybrid_ms)}")
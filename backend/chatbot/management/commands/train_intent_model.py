@@ -0,0 +1,36 @@
+"""
+파일명: chatbot/management/commands/train_intent_model.py
+설명: 로컬 의도 분류 모델 학습 (기본 예문 + LLM 분류 기록)
+
+사용법:
+    python manage.py train_intent_model
+    python manage.py train_intent_model --limit 10000 --output /path/intent_model.npz
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from chatbot.intent import IntentModel, training_data
+
+
+class Command(BaseCommand):
+    help = "LLM이 분류한 챗봇 메시지로 로컬 의도 분류 모델을 학습합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=5000, help="사용할 최대 기록 수")
+        parser.add_argument("--output", default=None, help="모델 파일 경로 (기본: CHATBOT_INTENT_MODEL_PATH)")
+
+    def handle(self, *args, **options):
+        path = options["output"] or getattr(settings, "CHATBOT_INTENT_MODEL_PATH", None)
+        if not path:
+            raise CommandError("CHATBOT_INTENT_MODEL_PATH가 설정되지 않았습니다.")
+
+        texts, labels = training_data(options["limit"])
+        model = IntentModel.fit(texts, labels)
+        model.save(path)
+
+        correct = sum(model.predict(text)[0] == label for text, label in zip(texts, labels))
+        self.stdout.write(
+            f"학습 완료: 문장 {len(texts)}개, 어휘 {len(model.vocab)}개, "
+            f"학습 정확도 {correct / len(texts):.1%} → {path}"
+        )
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChatIntentLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('message', models.TextField()),
+                ('intent', models.CharField(db_index=True, max_length=30)),
+                ('entities', models.JSONField(blank=True, default=dict)),
+                ('confidence', models.FloatField(default=0.0)),
+                ('source', models.CharField(choices=[('rule', '규칙'), ('model', '로컬 모델'), ('llm', 'LLM')], db_index=True, max_length=10)),
+                ('latency_ms', models.FloatField(default=0.0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -1,3 +1,39 @@
+"""
+파일명: chatbot/models.py
+설명: 챗봇 관련 모델 정의
+
+모델 목록:
+- ChatIntentLog: 메시지별 의도 분류 기록 (로컬 분류기 학습/벤치마크용)
+"""
+
 from django.db import models
 
-# Create your models here.
+
+class ChatIntentLog(models.Model):
+    """
+    의도 분류 기록
+
+    source:
+    - rule: 키워드/정규식 규칙
+    - model: 로컬 TF-IDF 분류기
+    - llm: GPT 분류 (로컬 신뢰도가 기준 미만일 때) → 로컬 분류기 학습 라벨로 사용
+    """
+    SOURCE_CHOICES = [
+        ("rule", "규칙"),
+        ("model", "로컬 모델"),
+        ("llm", "LLM"),
+    ]
+
+    message = models.TextField()
+    intent = models.CharField(max_length=30, db_index=True)
+    entities = models.JSONField(default=dict, blank=True)
+    confidence = models.FloatField(default=0.0)
+    source = models.CharField(max_length=10, choices=SOURCE_CHOICES, db_index=True)
+    latency_ms = models.FloatField(default=0.0)  # 의도 분류에 걸린 시간
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"[{self.source}] {self.intent} - {self.message[:30]}"
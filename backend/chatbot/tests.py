@@ -1,3 +1,76 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+
+from .intent import SEED_EXAMPLES, classify_local, classify_rules, extract_entities, training_data
+from .models import ChatIntentLog
+from .views import resolve_intent
+
+
+def rule_intent(text):
+    rule = classify_rules(text, extract_entities(text))
+    return rule and rule[0]
+
+
+class IntentRuleTests(TestCase):
+    def test_seed_examples_never_get_a_wrong_rule(self):
+        for text, intent in SEED_EXAMPLES:
+            with self.subTest(text=text):
+                self.assertIn(rule_intent(text), (None, intent))
+
+    def test_gold_is_not_matched_inside_other_words(self):
+        # "지금", "적금", "예금" 안의 "금"
+        self.assertEqual(rule_intent("지금 날씨 어때?"), "general_chat")
+        self.assertNotEqual(rule_intent("적금 들어도 괜찮을까?"), "investment_advice")
+        self.assertNotEqual(rule_intent("예금 들어도 괜찮을까?"), "investment_advice")
+        self.assertEqual(rule_intent("금 사도 괜찮을까"), "investment_advice")
+        self.assertEqual(rule_intent("금은 지금 사도 돼?"), "investment_advice")
+
+    def test_common_words_are_not_bank_aliases(self):
+        text = "우리 집 근처 맛집 괜찮아?"
+        self.assertNotIn("bank_name", extract_entities(text))
+        rule = classify_rules(text, extract_entities(text))
+        self.assertTrue(rule is None or rule[1] < 0.8)
+
+        self.assertNotIn("bank_name", extract_entities("하나만 골라줘"))
+        self.assertNotIn("bank_name", extract_entities("국민연금 얼마 받아?"))
+        self.assertEqual(extract_entities("하나 지점 어디야")["bank_name"], "하나은행")
+        self.assertEqual(extract_entities("신한 근처 ATM")["bank_name"], "신한은행")
+        self.assertEqual(extract_entities("국민은행 근처")["bank_name"], "국민은행")
+
+    def test_calendar_year_is_not_a_term(self):
+        self.assertNotIn("term_months", extract_entities("2025년 적금 금리 추천"))
+        self.assertEqual(extract_entities("2025년에 3년 적금 추천")["term_months"], "36")
+        self.assertEqual(extract_entities("1년 예금 금리")["term_months"], "12")
+        self.assertEqual(extract_entities("18개월 적금")["term_months"], "18")
+
+    def test_model_result_without_rule_is_labelled_model(self):
+        model = mock.Mock()
+        model.predict.return_value = ("general_chat", 0.718)
+        text = "오늘 뭐하지"
+        self.assertIsNone(classify_rules(text, extract_entities(text)))
+
+        result = classify_local(text, model=model)
+        self.assertEqual((result["intent"], result["source"], result["confidence"]), ("general_chat", "model", 0.718))
+
+
+@override_settings(CHATBOT_INTENT_MODEL_PATH=None, CHATBOT_INTENT_THRESHOLD=0.8)
+class ResolveIntentTests(TestCase):
+    def test_llm_failure_is_not_logged_as_llm_label(self):
+        with mock.patch("chatbot.views.llm_gateway.chat_completion", side_effect=RuntimeError("down")):
+            result = resolve_intent("그냥 궁금한게 있어")
+
+        self.assertNotIn("failed", result)
+        self.assertFalse(ChatIntentLog.objects.filter(source="llm").exists())
+        self.assertEqual(ChatIntentLog.objects.get().source, "rule")
+
+    def test_training_data_keeps_most_recent_logs(self):
+        for i in range(5):
+            ChatIntentLog.objects.create(message=f"문장 {i}", intent="news_search", source="llm")
+        ChatIntentLog.objects.create(message="문장 0", intent="travel_budget", source="llm")
+
+        texts, labels = training_data(limit=3)
+        data = dict(zip(texts, labels))
+        self.assertEqual(data["문장 0"], "travel_budget")
+        self.assertIn("문장 4", data)
+        self.assertNotIn("문장 1", data)
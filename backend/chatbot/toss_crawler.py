@@ -5,41 +5,190 @@
 기능:
     - Selenium을 사용한 토스증권 커뮤니티 댓글 크롤링
     - 종목 검색 및 댓글 수집
-    - 크롤링 결과 캐싱 (DB)
+    - 브라우저는 드라이버 풀에서 빌려 씀 (chatbot/browser_pool.py)
+    - 고정 sleep 대신 조건 대기 (검색 결과 표시, 댓글 표시, 스크롤 후 새 댓글 로딩)
+    - 크롤링 결과 캐싱 (메모리, 종목 코드 + limit/max_scroll별 settings.TOSS_COMMENTS_TTL초)
+      → 같은 종목을 다시 물어보면 브라우저를 띄우지 않음
+    - 처음 보는 검색어도 같은 검색어 동시 요청은 검색+크롤링 1번만 (single-flight)
+    - 검색 결과가 없던 검색어는 settings.TOSS_NOT_FOUND_TTL초 동안 바로 "없음" 응답
+    - 검색어가 자유 입력이라 캐시마다 최대 항목 수 제한 (settings.TOSS_CACHE_MAX_ENTRIES)
 
 주의사항:
     - webdriver-manager가 자동으로 ChromeDriver를 관리합니다
     - Chrome 브라우저만 설치되어 있으면 됩니다
 """
 
-import time
 from django.conf import settings
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-
-
-def get_chrome_driver():
-    """Chrome WebDriver 설정 및 반환 (webdriver-manager 사용으로 자동 설치)"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # 서버에서 GUI 없이 실행
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--blink-settings=imagesEnabled=false")  # 이미지 로딩 비활성화 (속도 향상)
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    
-    # webdriver-manager가 자동으로 ChromeDriver 다운로드 및 관리
-    service = Service(ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=chrome_options)
+from selenium.common.exceptions import TimeoutException
+
+from finance import llm_gateway
+from stocks.ttl_cache import TTLCache
+
+from .browser_pool import get_pool
+
+
+COMMENT_SELECTORS = [
+    "article.comment span.tw-1r5dc8g0._60z0ev1",
+    "[class*='comment'] span",  # 대체 선택자 (클래스명이 바뀐 경우)
+]
+
+_MAX_ENTRIES = getattr(settings, "TOSS_CACHE_MAX_ENTRIES", 500)
+
+# (종목 코드, limit, max_scroll)별 댓글 캐시 (같은 종목 동시 요청은 크롤링 1번만)
+_comments_cache = TTLCache(ttl=getattr(settings, "TOSS_COMMENTS_TTL", 600), max_entries=_MAX_ENTRIES)
+
+# (검색어, limit, max_scroll)별 처음 검색 결과 (종목 코드를 모르는 동안의 동시 요청용)
+_search_cache = TTLCache(ttl=getattr(settings, "TOSS_COMMENTS_TTL", 600), max_entries=_MAX_ENTRIES)
+
+# 검색어 → 토스증권 종목 코드 (종목 코드는 바뀌지 않으므로 만료 없음, 개수만 제한)
+_stock_codes = TTLCache(ttl=float("inf"), max_entries=_MAX_ENTRIES)
+
+# 검색 결과가 없던 검색어 (짧게 기억해서 같은 검색어로 브라우저를 다시 쓰지 않음)
+_not_found = TTLCache(ttl=getattr(settings, "TOSS_NOT_FOUND_TTL", 300), max_entries=_MAX_ENTRIES)
+
+
+class _NotFound(Exception):
+    pass
+
+
+def _xpath_literal(text: str) -> str:
+    """XPath 문자열 리터럴 (작은따옴표가 있으면 concat으로 이어붙임)"""
+    if "'" not in text:
+        return f"'{text}'"
+    return 'concat(' + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ')'
+
+
+def _find_comment_elements(driver):
+    for selector in COMMENT_SELECTORS:
+        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+        if elements:
+            return elements
+    return []
+
+
+def _search_stock_code(driver, company_name: str) -> str:
+    """검색창으로 종목 페이지에 들어가서 종목 코드 반환 (찾지 못하면 _NotFound)"""
+    # 1) 토스증권 메인 페이지 접속
+    print(f"[크롤링] 토스증권 접속 시작: {company_name}")
+    driver.get("https://www.tossinvest.com/")
+    WebDriverWait(driver, 10).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+    # 2) 검색창 활성화 ('/' 키로 검색창 열기)
+    driver.find_element(By.TAG_NAME, "body").send_keys("/")
+    search_input = WebDriverWait(driver, 10).until(
+        EC.element_to_be_clickable(
+            (By.XPATH, "//input[@placeholder='검색어를 입력해주세요']")
+        )
+    )
+
+    # 3) 종목 검색 (자동완성 결과가 뜰 때까지 대기 후 Enter)
+    search_input.click()
+    search_input.clear()
+    search_input.send_keys(company_name)
+    try:
+        WebDriverWait(driver, 3).until(
+            EC.presence_of_element_located(
+                (By.XPATH, f"//*[text()[contains(., {_xpath_literal(company_name)})]]")
+            )
+        )
+    except TimeoutException:
+        pass
+    search_input.send_keys(Keys.ENTER)
+    print(f"[크롤링] 검색어 입력 완료: {company_name}")
+
+    # 4) /order 페이지 로딩 대기 (종목 상세 페이지)
+    try:
+        WebDriverWait(driver, 15).until(EC.url_contains("/order"))
+    except TimeoutException:
+        # 검색 결과가 없거나 다른 페이지로 이동한 경우
+        raise _NotFound(company_name)
+
+    current_url = driver.current_url
+    print(f"[크롤링] 종목 페이지 진입: {current_url}")
+
+    # 5) URL에서 종목 코드 추출
+    parts = current_url.split("/")
+    if "stocks" in parts:
+        idx = parts.index("stocks")
+        if idx + 1 < len(parts):
+            return parts[idx + 1]
+    raise _NotFound(company_name)
+
+
+def _collect_comments(driver, stock_code: str, limit: int, max_scroll: int) -> list:
+    """커뮤니티 페이지에서 스크롤하면서 댓글 수집"""
+    community_url = f"https://www.tossinvest.com/stocks/{stock_code}/community"
+    driver.get(community_url)
+    print(f"[크롤링] 커뮤니티 페이지 이동: {community_url}")
+
+    # 댓글 영역 + 댓글 본문 로딩 대기
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "main article"))
+        )
+        WebDriverWait(driver, 5).until(_find_comment_elements)
+    except TimeoutException:
+        return []
+
+    comments = []
+    for _ in range(max_scroll):
+        # 현재 화면의 댓글 추출
+        elements = _find_comment_elements(driver)
+        for elem in elements:
+            try:
+                text = elem.text.strip()
+                if text and text not in comments and len(text) > 5:
+                    comments.append(text)
+            except Exception:
+                continue
+
+        # 목표 개수 도달 시 종료
+        if len(comments) >= limit:
+            break
+
+        # 스크롤 다운 후 새 댓글이 붙을 때까지 대기 (안 붙으면 마지막 페이지)
+        seen = len(elements)
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(driver, 3).until(lambda d: len(_find_comment_elements(d)) > seen)
+        except TimeoutException:
+            break
+
+    return comments[:limit]
+
+
+def _crawl(company_name: str, stock_code: str, limit: int, max_scroll: int) -> dict:
+    with get_pool().driver() as driver:
+        if stock_code is None:
+            try:
+                stock_code = _search_stock_code(driver, company_name)
+            except _NotFound:
+                # 검색 결과 없음은 드라이버 문제가 아님 → 블록 밖에서 올려서 드라이버는 반납
+                stock_code = None
+        comments = _collect_comments(driver, stock_code, limit, max_scroll) if stock_code else []
+
+    if stock_code is None:
+        raise _NotFound(company_name)
+    print(f"[크롤링] 댓글 {len(comments)}개 수집 완료")
+    return {"stock_code": stock_code, "comments": comments}
+
+
+def _crawl_new(company_name: str, limit: int, max_scroll: int) -> dict:
+    """처음 보는 검색어: 종목 코드를 찾은 뒤 같은 브라우저로 댓글까지 수집"""
+    try:
+        crawled = _crawl(company_name, None, limit, max_scroll)
+    except _NotFound:
+        _not_found.set(company_name, True)
+        raise
+    _stock_codes.set(company_name, crawled["stock_code"])
+    _comments_cache.set((crawled["stock_code"], limit, max_scroll), crawled["comments"])
+    return crawled
 
 
 def fetch_toss_comments(company_name: str, limit: int = 20, max_scroll: int = 10) -> dict:
@@ -60,136 +209,33 @@ def fetch_toss_comments(company_name: str, limit: int = 20, max_scroll: int = 10
             "error": str (실패 시)
         }
     """
-    driver = None
-    
+    company_name = company_name.strip()
+    known = _stock_codes.peek(company_name)
+    stock_code = known[0] if known else None
+
     try:
-        driver = get_chrome_driver()
-        
-        # 1) 토스증권 메인 페이지 접속
-        print(f"[크롤링] 토스증권 접속 시작: {company_name}")
-        driver.get("https://www.tossinvest.com/")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(1)
-        
-        # 2) 검색창 활성화 ('/' 키로 검색창 열기)
-        body = driver.find_element(By.TAG_NAME, "body")
-        body.send_keys("/")
-        
-        search_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located(
-                (By.XPATH, "//input[@placeholder='검색어를 입력해주세요']")
+        missing = _not_found.peek(company_name)
+        if stock_code is None and missing and missing[1] < _not_found.ttl:
+            raise _NotFound(company_name)
+        if stock_code is None:
+            crawled, age = _search_cache.get(
+                (company_name, limit, max_scroll), lambda: _crawl_new(company_name, limit, max_scroll)
             )
-        )
-        
-        # 3) 종목 검색
-        search_input.click()
-        search_input.clear()
-        search_input.send_keys(company_name)
-        time.sleep(1)
-        search_input.send_keys(Keys.ENTER)
-        print(f"[크롤링] 검색어 입력 완료: {company_name}")
-        
-        # 4) /order 페이지 로딩 대기 (종목 상세 페이지)
-        try:
-            WebDriverWait(driver, 15).until(EC.url_contains("/order"))
-        except TimeoutException:
-            # 검색 결과가 없거나 다른 페이지로 이동한 경우
-            return {
-                "success": False,
-                "error": f"'{company_name}' 종목을 찾을 수 없습니다.",
-                "comments": []
-            }
-        
-        current_url = driver.current_url
-        print(f"[크롤링] 종목 페이지 진입: {current_url}")
-        
-        # 5) URL에서 종목 코드 추출
-        stock_code = None
-        parts = current_url.split("/")
-        if "stocks" in parts:
-            idx = parts.index("stocks")
-            if idx + 1 < len(parts):
-                stock_code = parts[idx + 1]
-        
-        # 6) 커뮤니티 페이지로 이동
-        if stock_code:
-            community_url = f"https://www.tossinvest.com/stocks/{stock_code}/community"
+            stock_code, comments = crawled["stock_code"], crawled["comments"]
         else:
-            community_url = current_url.replace("/order", "/community")
-        
-        driver.get(community_url)
-        print(f"[크롤링] 커뮤니티 페이지 이동: {community_url}")
-        
-        # 7) 댓글 영역 로딩 대기
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "main article"))
+            comments, age = _comments_cache.get(
+                (stock_code, limit, max_scroll),
+                lambda: _crawl(company_name, stock_code, limit, max_scroll)["comments"],
             )
-        except TimeoutException:
-            return {
-                "success": True,
-                "stock_code": stock_code,
-                "company_name": company_name,
-                "comments": [],
-                "message": "커뮤니티에 댓글이 없습니다."
-            }
-        
-        time.sleep(1)
-        
-        # 8) 댓글 수집 (스크롤하면서 누적)
-        comments = []
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        
-        for scroll_count in range(max_scroll):
-            # 현재 화면의 댓글 추출
-            # 토스증권 댓글 CSS 선택자 (변경될 수 있음)
-            try:
-                comment_elements = driver.find_elements(
-                    By.CSS_SELECTOR, "article.comment span.tw-1r5dc8g0._60z0ev1"
-                )
-                
-                # 대체 선택자들 시도
-                if not comment_elements:
-                    comment_elements = driver.find_elements(
-                        By.CSS_SELECTOR, "[class*='comment'] span"
-                    )
-                
-                for elem in comment_elements:
-                    try:
-                        text = elem.text.strip()
-                        if text and text not in comments and len(text) > 5:
-                            comments.append(text)
-                    except:
-                        continue
-                        
-            except Exception as e:
-                print(f"[크롤링] 댓글 추출 오류: {e}")
-            
-            # 목표 개수 도달 시 종료
-            if len(comments) >= limit:
-                break
-            
-            # 스크롤 다운
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-            
-            # 더 이상 스크롤할 내용이 없으면 종료
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
-        
-        print(f"[크롤링] 댓글 {len(comments)}개 수집 완료")
-        
+        if age:
+            print(f"[크롤링] 캐시 사용: {company_name} ({stock_code}, {age:.0f}초 전)")
+
+    except _NotFound:
         return {
-            "success": True,
-            "stock_code": stock_code,
-            "company_name": company_name,
-            "comments": comments[:limit]
+            "success": False,
+            "error": f"'{company_name}' 종목을 찾을 수 없습니다.",
+            "comments": []
         }
-        
     except Exception as e:
         import traceback
         print(f"[크롤링 오류] {traceback.format_exc()}")
@@ -198,20 +244,25 @@ def fetch_toss_comments(company_name: str, limit: int = 20, max_scroll: int = 10
             "error": f"크롤링 중 오류 발생: {str(e)}",
             "comments": []
         }
-        
-    finally:
-        if driver:
-            driver.quit()
+
+    result = {
+        "success": True,
+        "stock_code": stock_code,
+        "company_name": company_name,
+        "comments": comments[:limit],
+    }
+    if not comments:
+        result["message"] = "커뮤니티에 댓글이 없습니다."
+    return result
 
 
-def analyze_stock_sentiment(comments: list, company_name: str, client) -> dict:
+def analyze_stock_sentiment(comments: list, company_name: str) -> dict:
     """
     OpenAI를 사용하여 댓글들의 감성을 분석하고 매수/매도 의견을 제시합니다.
     
     Args:
         comments: 크롤링된 댓글 목록
         company_name: 종목명
-        client: OpenAI 클라이언트
     
     Returns:
         {
@@ -260,8 +311,8 @@ def analyze_stock_sentiment(comments: list, company_name: str, client) -> dict:
 """
 
     try:
-        response = client.chat.completions.create(
-            model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
+        response = llm_gateway.chat_completion(
+            cache="stock_sentiment",
             messages=[
                 {
                     "role": "system",
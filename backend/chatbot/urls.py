@@ -4,8 +4,10 @@
 
 URL 패턴:
 - POST /api/chatbot/ : 챗봇 메시지 전송/응답
+- POST /api/chatbot/stream/ : 챗봇 메시지 전송/응답 (Server-Sent Events 스트리밍)
 - GET /api/chatbot/suggestions/ : 추천 질문 목록
 - POST /api/chatbot/bank-search/ : 위치 기반 은행 검색
+- GET /api/chatbot/llm-cache/stats/ : LLM 응답 캐시 적중/미스 통계 (관리자)
 
 AI 모델: OpenAI GPT (GMS 프록시 사용)
 """
@@ -16,6 +18,8 @@ from . import views
 urlpatterns = [
     # AI 챗봇 대화 API
     path("", views.chat, name="chat"),
+    # AI 챗봇 대화 API (스트리밍)
+    path("stream/", views.chat_stream, name="chat_stream"),
     # 추천 질문 목록
     path("suggestions/", views.chat_suggestions, name="chat_suggestions"),
     # 위치 기반 은행 검색
@@ -24,4 +28,6 @@ urlpatterns = [
         views.search_bank_with_location,
         name="search_bank_with_location",
     ),
+    # LLM 응답 캐시 통계 (관리자)
+    path("llm-cache/stats/", views.llm_cache_stats, name="llm_cache_stats"),
 ]
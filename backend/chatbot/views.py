@@ -3,13 +3,16 @@
 설명: AI 챗봇 API 뷰
 
 기능:
-    - OpenAI GPT를 활용한 의도 분류 및 응답 생성
+    - 로컬 분류기(chatbot/intent.py) 우선, 신뢰도가 낮을 때만 OpenAI GPT로 의도 분류
+    - OpenAI GPT를 활용한 응답 생성
     - 다양한 의도 처리 (은행 위치, 상품 검색, 여행 예산, 뉴스, 투자 조언)
     - 카카오맵 API 연동 (은행 위치 검색)
     - 네이버 뉴스 API 연동 (뉴스 검색)
 
 API 엔드포인트:
     - POST /chatbot/chat/ : AI 채팅 메시지 처리
+    - POST /chatbot/stream/ : AI 채팅 메시지 처리 (Server-Sent Events 스트리밍)
+    - GET /chatbot/llm-cache/stats/ : LLM 응답 캐시 통계 (관리자)
 
 외부 API:
     - OpenAI GPT API: 의도 분류 및 응답 생성
@@ -29,24 +32,20 @@ import json
 import re
 import requests
 import os
+import time
 from html import unescape
 from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.utils.html import strip_tags
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from rest_framework.response import Response
 from rest_framework import status
-from openai import OpenAI
 
+from finance import llm_gateway
 from products.models import DepositProduct, DepositOption, SavingProduct, SavingOption
 
-
-# OpenAI 클라이언트 초기화
-def get_openai_client():
-    return OpenAI(
-        api_key=settings.OPENAI_API_KEY,
-        base_url=getattr(settings, "OPENAI_BASE_URL", None),
-    )
+from .intent import classify_local, log_intent
 
 
 # 의도 분류 시스템 프롬프트
@@ -79,12 +78,13 @@ INTENT_CLASSIFICATION_PROMPT = """당신은 사용자의 질문을 분류하는
 
 
 def classify_intent(user_message: str) -> dict:
-    """사용자 메시지의 의도를 분류합니다."""
-    client = get_openai_client()
-
+    """
+    사용자 메시지의 의도를 분류합니다.
+    (LLM 호출/파싱 실패 시 general_chat 기본값 + "failed": True)
+    """
     try:
-        response = client.chat.completions.create(
-            model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
+        response = llm_gateway.chat_completion(
+            cache="classify_intent",
             messages=[
                 {"role": "system", "content": INTENT_CLASSIFICATION_PROMPT},
                 {"role": "user", "content": user_message},
@@ -109,9 +109,29 @@ def classify_intent(user_message: str) -> dict:
             "intent": "general_chat",
             "entities": {"keywords": []},
             "confidence": 0.5,
+            "failed": True,
         }
 
 
+def resolve_intent(user_message: str) -> dict:
+    """
+    로컬 분류기(규칙 + TF-IDF 모델) 먼저, 신뢰도가 기준 미만일 때만 LLM 분류
+    결과는 ChatIntentLog에 기록 (LLM 결과는 로컬 모델 학습 데이터)
+    LLM 분류가 실패하면 로컬 결과를 그대로 사용 (source=llm으로 기록하지 않음 → 학습에서 제외)
+    """
+    started = time.perf_counter()
+    result = classify_local(user_message)
+
+    if result["confidence"] < getattr(settings, "CHATBOT_INTENT_THRESHOLD", 0.8):
+        llm_result = classify_intent(user_message)
+        if not llm_result.pop("failed", False):
+            result = llm_result
+            result["source"] = "llm"
+
+    log_intent(user_message, result, (time.perf_counter() - started) * 1000)
+    return result
+
+
 # ==================== 카카오맵 API로 은행 검색 ====================
 def search_nearby_bank(bank_name: str, lat: float, lng: float) -> dict:
     """카카오맵 API로 현재 위치에서 가장 가까운 은행을 검색합니다."""
@@ -314,9 +334,8 @@ def search_news(query: str, display: int = 5) -> list:
         return []
 
 
-def generate_news_response(entities: dict, user_message: str) -> dict:
-    """뉴스 검색 결과로 응답을 생성합니다."""
-    client = get_openai_client()
+def prepare_news_response(entities: dict, user_message: str) -> tuple:
+    """뉴스를 검색하고 (응답 데이터, 요약용 LLM 요청)을 반환합니다."""
     keywords = entities.get("keywords", [])
     news_topic = entities.get("news_topic", "")
 
@@ -353,38 +372,35 @@ def generate_news_response(entities: dict, user_message: str) -> dict:
             "type": "news_search",
             "message": "죄송해요, 관련 뉴스를 찾지 못했어요. 다른 키워드로 검색해 보시겠어요? 📰",
             "news": [],
-        }
+        }, None
 
     # AI로 뉴스 요약 생성
     news_summary = "\n".join(
         [f"- {n['title']}: {n['description']}" for n in unique_news[:3]]
     )
 
-    try:
-        response = client.chat.completions.create(
-            model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 금융 뉴스 전문가입니다. 제공된 뉴스를 바탕으로 사용자에게 친절하게 요약해서 알려주세요. 이모지를 적절히 사용하세요.",
-                },
-                {
-                    "role": "user",
-                    "content": f"사용자 질문: {user_message}\n\n관련 뉴스:\n{news_summary}\n\n위 뉴스들을 바탕으로 간단히 요약해서 알려주세요.",
-                },
-            ],
-            max_tokens=400,
-            temperature=0.7,
-        )
-        ai_message = response.choices[0].message.content.strip()
-    except Exception as e:
-        ai_message = f"📰 '{search_query}' 관련 최신 뉴스를 찾았어요!"
+    llm_request = {
+        "cache": "news_response",
+        "messages": [
+            {
+                "role": "system",
+                "content": "당신은 금융 뉴스 전문가입니다. 제공된 뉴스를 바탕으로 사용자에게 친절하게 요약해서 알려주세요. 이모지를 적절히 사용하세요.",
+            },
+            {
+                "role": "user",
+                "content": f"사용자 질문: {user_message}\n\n관련 뉴스:\n{news_summary}\n\n위 뉴스들을 바탕으로 간단히 요약해서 알려주세요.",
+            },
+        ],
+        "max_tokens": 400,
+        "temperature": 0.7,
+        "fallback": f"📰 '{search_query}' 관련 최신 뉴스를 찾았어요!",
+    }
 
     return {
         "type": "news_search",
-        "message": ai_message,
+        "message": "",
         "news": unique_news,
-    }
+    }, llm_request
 
 
 # ==================== 투자/부동산 조언 ====================
@@ -427,9 +443,8 @@ def search_youtube(query: str, max_results: int = 3) -> list:
         return []
 
 
-def generate_investment_advice_response(entities: dict, user_message: str) -> dict:
-    """투자/부동산 조언 응답을 생성합니다."""
-    client = get_openai_client()
+def prepare_investment_advice_response(entities: dict, user_message: str) -> tuple:
+    """관련 뉴스/영상을 검색하고 (응답 데이터, 조언용 LLM 요청)을 반환합니다."""
     keywords = entities.get("keywords", [])
 
     # 뉴스 검색
@@ -462,48 +477,45 @@ def generate_investment_advice_response(entities: dict, user_message: str) -> di
             [f"- {n['title']}" for n in all_news[:3]]
         )
 
-    try:
-        response = client.chat.completions.create(
-            model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
-            messages=[
-                {
-                    "role": "system",
-                    "content": """당신은 금융 전문가입니다. 사용자의 투자/부동산 관련 질문에 대해:
+    llm_request = {
+        "cache": "investment_advice",
+        "messages": [
+            {
+                "role": "system",
+                "content": """당신은 금융 전문가입니다. 사용자의 투자/부동산 관련 질문에 대해:
 1. 현재 시장 상황을 객관적으로 설명하세요
 2. 장단점을 균형있게 제시하세요
 3. "투자는 본인의 판단"이라는 점을 언급하세요
 4. 이모지를 적절히 사용하세요
 5. 최근 뉴스 트렌드를 참고하세요""",
-                },
-                {
-                    "role": "user",
-                    "content": f"사용자 질문: {user_message}\n\n{news_summary}\n\n이 정보를 바탕으로 조언해주세요.",
-                },
-            ],
-            max_tokens=600,
-            temperature=0.7,
-        )
-        ai_message = response.choices[0].message.content.strip()
-    except Exception as e:
-        ai_message = "투자에 대한 조언을 드리기 어렵습니다. 전문가와 상담해 보시는 것을 추천드려요."
+            },
+            {
+                "role": "user",
+                "content": f"사용자 질문: {user_message}\n\n{news_summary}\n\n이 정보를 바탕으로 조언해주세요.",
+            },
+        ],
+        "max_tokens": 600,
+        "temperature": 0.7,
+        "fallback": "투자에 대한 조언을 드리기 어렵습니다. 전문가와 상담해 보시는 것을 추천드려요.",
+    }
 
     return {
         "type": "investment_advice",
-        "message": ai_message,
+        "message": "",
         "news": all_news,
         "youtube_videos": youtube_videos,
-    }
+    }, llm_request
 
 
 # ==================== 종목 여론 분석 (토스증권 크롤링) ====================
-def generate_stock_sentiment_response(entities: dict, user_message: str) -> dict:
+def prepare_stock_sentiment_response(entities: dict, user_message: str) -> tuple:
     """
     토스증권 커뮤니티를 크롤링하여 종목에 대한 여론을 분석하고
     매수/매도 의견을 제시합니다.
+    크롤링에 실패하면 뉴스 기반 의견용 LLM 요청을 함께 반환합니다.
     """
     from .toss_crawler import fetch_toss_comments, analyze_stock_sentiment
     
-    client = get_openai_client()
     stock_name = entities.get("stock_name", "")
     keywords = entities.get("keywords", [])
     
@@ -520,7 +532,7 @@ def generate_stock_sentiment_response(entities: dict, user_message: str) -> dict
             "type": "stock_sentiment",
             "message": "어떤 종목에 대해 분석해 드릴까요? 종목명을 말씀해 주세요! 📊\n\n예: '삼성전자 사야할까?', '테슬라 전망 어때?'",
             "need_stock_name": True
-        }
+        }, None
     
     # 사용자에게 분석 중임을 알리기 위한 초기 응답 (실제로는 크롤링 후 반환)
     print(f"[종목 분석] 분석 시작: {stock_name}")
@@ -540,31 +552,28 @@ def generate_stock_sentiment_response(entities: dict, user_message: str) -> dict
         # AI로 뉴스 기반 분석
         news_summary = "\n".join([f"- {n['title']}" for n in news[:5]]) if news else "관련 뉴스 없음"
         
-        try:
-            response = client.chat.completions.create(
-                model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """당신은 주식 투자 전문가입니다. 
+        llm_request = {
+            "cache": "stock_sentiment",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": """당신은 주식 투자 전문가입니다. 
 뉴스를 바탕으로 종목에 대한 의견을 제시하세요.
 매수/매도/보유 중 하나를 추천하되, 투자는 본인 판단이라는 점을 언급하세요."""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"종목: {stock_name}\n\n관련 뉴스:\n{news_summary}\n\n이 종목에 대한 의견을 말해주세요."
-                    }
-                ],
-                max_tokens=500,
-                temperature=0.7
-            )
-            ai_message = response.choices[0].message.content.strip()
-        except:
-            ai_message = f"'{stock_name}'에 대한 커뮤니티 여론을 수집하지 못했습니다. 관련 뉴스와 영상을 참고해 주세요."
+                },
+                {
+                    "role": "user",
+                    "content": f"종목: {stock_name}\n\n관련 뉴스:\n{news_summary}\n\n이 종목에 대한 의견을 말해주세요."
+                }
+            ],
+            "max_tokens": 500,
+            "temperature": 0.7,
+            "fallback": f"'{stock_name}'에 대한 커뮤니티 여론을 수집하지 못했습니다. 관련 뉴스와 영상을 참고해 주세요.",
+        }
         
         return {
             "type": "stock_sentiment",
-            "message": ai_message,
+            "message": "",
             "stock_name": stock_name,
             "crawling_failed": True,
             "news": news,
@@ -573,11 +582,11 @@ def generate_stock_sentiment_response(entities: dict, user_message: str) -> dict
             "confidence": 30,
             "comments_count": 0,
             "analysis": "커뮤니티 데이터를 수집하지 못해 뉴스 기반으로 분석했습니다."
-        }
+        }, llm_request
     
     # 2. 댓글 감성 분석
     comments = crawl_result.get("comments", [])
-    analysis = analyze_stock_sentiment(comments, stock_name, client)
+    analysis = analyze_stock_sentiment(comments, stock_name)
     
     # 3. 관련 뉴스 검색
     news = search_news(f"{stock_name} 주식", display=5)
@@ -647,7 +656,7 @@ def generate_stock_sentiment_response(entities: dict, user_message: str) -> dict
         "analysis": summary,
         "news": news,
         "youtube_videos": youtube_videos
-    }
+    }, None
 
 
 # ==================== 금융 상품 검색 ====================
@@ -736,10 +745,8 @@ def search_products(entities: dict) -> dict:
     return results
 
 
-def generate_product_response(entities: dict, search_results: dict) -> dict:
-    """금융 상품 검색 결과로 응답을 생성합니다."""
-    client = get_openai_client()
-
+def prepare_product_response(entities: dict, search_results: dict) -> tuple:
+    """금융 상품 검색 결과로 (응답 데이터, 설명용 LLM 요청)을 반환합니다."""
     term = entities.get("term_months", "")
     product_type = entities.get("product_type", "")
 
@@ -765,29 +772,26 @@ def generate_product_response(entities: dict, search_results: dict) -> dict:
 - 최고금리: {best_deposit['max_rate']}%
 """
 
-    try:
-        response = client.chat.completions.create(
-            model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 친절한 금융 상담사입니다. 제공된 상품 정보를 바탕으로 사용자에게 친근하고 이해하기 쉽게 설명해주세요. 이모지를 적절히 사용하세요.",
-                },
-                {
-                    "role": "user",
-                    "content": f"사용자 질문: {term}개월 {product_type or '예적금'} 상품 추천\n\n검색 결과:\n{product_info}",
-                },
-            ],
-            max_tokens=500,
-            temperature=0.7,
-        )
-        ai_message = response.choices[0].message.content.strip()
-    except Exception as e:
-        ai_message = f"금융 상품을 검색했습니다. {product_info}"
+    llm_request = {
+        "cache": "product_response",
+        "messages": [
+            {
+                "role": "system",
+                "content": "당신은 친절한 금융 상담사입니다. 제공된 상품 정보를 바탕으로 사용자에게 친근하고 이해하기 쉽게 설명해주세요. 이모지를 적절히 사용하세요.",
+            },
+            {
+                "role": "user",
+                "content": f"사용자 질문: {term}개월 {product_type or '예적금'} 상품 추천\n\n검색 결과:\n{product_info}",
+            },
+        ],
+        "max_tokens": 500,
+        "temperature": 0.7,
+        "fallback": f"금융 상품을 검색했습니다. {product_info}",
+    }
 
     return {
         "type": "product_search",
-        "message": ai_message,
+        "message": "",
         "products": {
             "best_saving": best_saving,
             "best_deposit": best_deposit,
@@ -795,7 +799,7 @@ def generate_product_response(entities: dict, search_results: dict) -> dict:
             "deposits": search_results.get("deposits", [])[:5],
         },
         "action": {"type": "view_products", "link": "/products"},
-    }
+    }, llm_request
 
 
 # ==================== 여행 예산 ====================
@@ -851,9 +855,8 @@ def search_youtube_for_travel(destination: str) -> list:
     return all_videos[:6]
 
 
-def generate_travel_response(entities: dict, youtube_results: list) -> dict:
-    """여행 예산 관련 응답을 생성합니다."""
-    client = get_openai_client()
+def prepare_travel_response(entities: dict, youtube_results: list) -> tuple:
+    """여행 예산 관련 (응답 데이터, 예산 안내용 LLM 요청)을 반환합니다."""
     destination = entities.get("destination", "")
     keywords = entities.get("keywords", [])
 
@@ -876,52 +879,46 @@ def generate_travel_response(entities: dict, youtube_results: list) -> dict:
                     destination = tk
                     break
 
-    try:
-        response = client.chat.completions.create(
-            model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
-            messages=[
-                {
-                    "role": "system",
-                    "content": """당신은 여행 전문가이자 금융 상담사입니다. 
+    llm_request = {
+        "cache": "travel_response",
+        "messages": [
+            {
+                "role": "system",
+                "content": """당신은 여행 전문가이자 금융 상담사입니다. 
 여행 예산에 대해 물어보면:
 1. 대략적인 예산 범위를 알려주세요 (항공, 숙박, 식비, 기타)
 2. 호캉스/럭셔리 여행의 경우 더 높은 예산을 제시하세요
 3. 적금을 통한 여행 자금 마련 팁도 제공하세요
 4. 이모지를 사용해서 친근하게 설명하세요""",
-                },
-                {
-                    "role": "user",
-                    "content": f"{destination or '해외'} 여행 예산과 준비에 대해 알려주세요.",
-                },
-            ],
-            max_tokens=600,
-            temperature=0.7,
-        )
-        ai_message = response.choices[0].message.content.strip()
-    except Exception as e:
-        ai_message = f"{destination or '해외'} 여행을 계획하고 계시군요! 여행 예산은 스타일에 따라 달라질 수 있어요."
+            },
+            {
+                "role": "user",
+                "content": f"{destination or '해외'} 여행 예산과 준비에 대해 알려주세요.",
+            },
+        ],
+        "max_tokens": 600,
+        "temperature": 0.7,
+        "fallback": f"{destination or '해외'} 여행을 계획하고 계시군요! 여행 예산은 스타일에 따라 달라질 수 있어요.",
+    }
 
     return {
         "type": "travel_budget",
         "destination": destination,
-        "message": ai_message,
+        "message": "",
         "youtube_videos": youtube_results,
         "action": {"type": "view_analysis", "link": "/analysis"},
-    }
+    }, llm_request
 
 
 # ==================== 일반 대화 (LLM 직접 응답) ====================
-def generate_general_chat_response(user_message: str) -> dict:
+def prepare_general_chat_response(user_message: str) -> tuple:
     """일반적인 대화에 대해 LLM이 직접 응답합니다."""
-    client = get_openai_client()
-
-    try:
-        response = client.chat.completions.create(
-            model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
-            messages=[
-                {
-                    "role": "system",
-                    "content": """당신의 이름은 "핑프"이고, F!NK 금융 서비스의 친근한 AI 챗봇입니다.
+    llm_request = {
+        "cache": "general_chat",
+        "messages": [
+            {
+                "role": "system",
+                "content": """당신의 이름은 "핑프"이고, F!NK 금융 서비스의 친근한 AI 챗봇입니다.
 사용자와 자연스럽게 대화하세요. 일상적인 질문(날씨, 음식, 인사 등)에도 친절하게 답변합니다.
 
 성격:
@@ -935,20 +932,92 @@ F!NK 기능:
 - 은행 지점 찾기
 - 금융 뉴스
 - 환율/금시세 정보""",
-                },
-                {"role": "user", "content": user_message},
-            ],
-            max_tokens=500,
-            temperature=0.8,
-        )
-        ai_message = response.choices[0].message.content.strip()
-    except Exception as e:
-        ai_message = "음... 잠깐 생각이 멈췄어요! 😅 다시 한번 말씀해 주시겠어요?"
+            },
+            {"role": "user", "content": user_message},
+        ],
+        "max_tokens": 500,
+        "temperature": 0.8,
+        "fallback": "음... 잠깐 생각이 멈췄어요! 😅 다시 한번 말씀해 주시겠어요?",
+    }
 
     return {
         "type": "general_chat",
-        "message": ai_message,
-    }
+        "message": "",
+    }, llm_request
+
+
+# ==================== LLM 응답 (일반 / 스트리밍 공용) ====================
+def complete_message(llm_request: dict) -> str:
+    """prepare_* 가 만든 LLM 요청으로 응답 메시지를 생성합니다. (실패 시 fallback)"""
+    params = dict(llm_request)
+    fallback = params.pop("fallback")
+    try:
+        response = llm_gateway.chat_completion(**params)
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        print(f"응답 생성 오류: {e}")
+        return fallback
+
+
+def stream_message(llm_request: dict):
+    """complete_message의 스트리밍 버전 (응답 조각을 yield, 첫 조각 전에 실패하면 fallback)"""
+    params = dict(llm_request)
+    fallback = params.pop("fallback")
+    sent = False
+    try:
+        for delta in llm_gateway.stream_chat_completion(**params):
+            sent = True
+            yield delta
+    except Exception as e:
+        print(f"응답 스트리밍 오류: {e}")
+        if not sent:
+            yield fallback
+
+
+def prepare_response(intent: str, entities: dict, user_message: str, user_location: dict = None) -> tuple:
+    """의도별 검색/분석을 수행하고 (응답 데이터, LLM 요청 또는 None)을 반환합니다."""
+    if intent == "bank_location":
+        return generate_bank_location_response(entities, user_location), None
+
+    if intent == "product_search":
+        search_results = search_products(entities)
+        return prepare_product_response(entities, search_results)
+
+    if intent == "travel_budget":
+        destination = entities.get("destination", "")
+        if not destination:
+            for kw in entities.get("keywords", []):
+                if kw in [
+                    "일본",
+                    "태국",
+                    "베트남",
+                    "미국",
+                    "유럽",
+                    "중국",
+                    "대만",
+                    "홍콩",
+                    "싱가포르",
+                    "호주",
+                ]:
+                    destination = kw
+                    break
+        youtube_results = search_youtube_for_travel(destination or "해외")
+        return prepare_travel_response(entities, youtube_results)
+
+    if intent == "news_search":
+        return prepare_news_response(entities, user_message)
+
+    if intent == "investment_advice":
+        return prepare_investment_advice_response(entities, user_message)
+
+    if intent == "stock_sentiment":
+        return prepare_stock_sentiment_response(entities, user_message)
+
+    # general_chat
+    return prepare_general_chat_response(user_message)
+
+
+CHAT_ERROR_MESSAGE = "죄송합니다. 처리 중 오류가 발생했어요. 다시 시도해 주세요. 🙏"
 
 
 # ==================== 메인 API ====================
@@ -967,54 +1036,18 @@ def chat(request):
         )
 
     try:
-        # 1. 의도 분류
-        intent_result = classify_intent(user_message)
+        # 1. 의도 분류 (로컬 분류기 → 필요할 때만 LLM)
+        intent_result = resolve_intent(user_message)
         intent = intent_result.get("intent", "general_chat")
         entities = intent_result.get("entities", {})
 
-        print(f"🤖 의도 분류: {intent}")
+        print(f"🤖 의도 분류: {intent} ({intent_result.get('source')})")
         print(f"📦 엔티티: {entities}")
 
         # 2. 의도별 처리
-        if intent == "bank_location":
-            response_data = generate_bank_location_response(entities, user_location)
-
-        elif intent == "product_search":
-            search_results = search_products(entities)
-            response_data = generate_product_response(entities, search_results)
-
-        elif intent == "travel_budget":
-            destination = entities.get("destination", "")
-            if not destination:
-                for kw in entities.get("keywords", []):
-                    if kw in [
-                        "일본",
-                        "태국",
-                        "베트남",
-                        "미국",
-                        "유럽",
-                        "중국",
-                        "대만",
-                        "홍콩",
-                        "싱가포르",
-                        "호주",
-                    ]:
-                        destination = kw
-                        break
-            youtube_results = search_youtube_for_travel(destination or "해외")
-            response_data = generate_travel_response(entities, youtube_results)
-
-        elif intent == "news_search":
-            response_data = generate_news_response(entities, user_message)
-
-        elif intent == "investment_advice":
-            response_data = generate_investment_advice_response(entities, user_message)
-
-        elif intent == "stock_sentiment":
-            response_data = generate_stock_sentiment_response(entities, user_message)
-
-        else:  # general_chat
-            response_data = generate_general_chat_response(user_message)
+        response_data, llm_request = prepare_response(intent, entities, user_message, user_location)
+        if llm_request is not None:
+            response_data["message"] = complete_message(llm_request)
 
         # 공통 필드 추가
         response_data["intent"] = intent
@@ -1031,13 +1064,80 @@ def chat(request):
         return Response(
             {
                 "type": "error",
-                "message": "죄송합니다. 처리 중 오류가 발생했어요. 다시 시도해 주세요. 🙏",
+                "message": CHAT_ERROR_MESSAGE,
                 "error": str(e),
             },
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
 
+def _sse(event: str, data) -> str:
+    """Server-Sent Events 메시지 1개"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _chat_events(user_message: str, user_location: dict = None):
+    """chat_stream 이벤트 제너레이터"""
+    # 첫 바이트를 바로 보내서 프록시/브라우저가 연결을 열어두게 함
+    yield ": connected\n\n"
+
+    try:
+        # 1. 의도 분류
+        intent_result = resolve_intent(user_message)
+        intent = intent_result.get("intent", "general_chat")
+        entities = intent_result.get("entities", {})
+        print(f"🤖 의도 분류: {intent} ({intent_result.get('source')})")
+        yield _sse("intent", {"intent": intent, "entities": entities, "source": intent_result.get("source")})
+
+        # 2. 검색/분석 결과 (message 제외)
+        response_data, llm_request = prepare_response(intent, entities, user_message, user_location)
+        yield _sse("context", {key: value for key, value in response_data.items() if key != "message"})
+
+        # 3. 모델 응답 조각
+        if llm_request is not None:
+            parts = []
+            for delta in stream_message(llm_request):
+                parts.append(delta)
+                yield _sse("token", {"delta": delta})
+            response_data["message"] = "".join(parts).strip()
+
+        # 4. 최종 응답 (POST /chatbot/ 응답과 같은 형식)
+        response_data["intent"] = intent
+        response_data["original_message"] = user_message
+        yield _sse("done", response_data)
+
+    except Exception as e:
+        print(f"❌ 챗봇 스트리밍 오류: {e}")
+        import traceback
+
+        traceback.print_exc()
+        yield _sse("error", {"type": "error", "message": CHAT_ERROR_MESSAGE, "error": str(e)})
+
+
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def chat_stream(request):
+    """
+    챗봇 스트리밍 엔드포인트 (Server-Sent Events)
+    이벤트 순서: intent → context(검색 결과) → token(응답 조각, 여러 번) → done(최종 응답)
+    처리 중 오류가 나면 error 이벤트로 끝남
+    """
+    user_message = request.data.get("message", "").strip()
+    user_location = request.data.get("location")  # {lat, lng}
+
+    if not user_message:
+        return Response(
+            {"error": "메시지를 입력해주세요."}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    response = StreamingHttpResponse(
+        _chat_events(user_message, user_location), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx 버퍼링 끄기
+    return response
+
+
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def search_bank_with_location(request):
@@ -1149,3 +1249,12 @@ def chat_suggestions(request):
     ]
 
     return Response({"suggestions": suggestions}, status=status.HTTP_200_OK)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def llm_cache_stats(request):
+    """
+    LLM 응답 캐시 적중/미스 통계 (관리자용, 현재 프로세스 기준)
+    """
+    return Response(llm_gateway.cache_stats(), status=status.HTTP_200_OK)
@@ -1,4 +1,4 @@
 from django.contrib import admin
-from .models import ExchangeRate
+from .models import ExchangeRateHistory
 
-# Register your models here.
\ No newline at end of file
+# Register your models here.
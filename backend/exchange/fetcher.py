@@ -0,0 +1,146 @@
+"""
+파일명: exchange/fetcher.py
+설명: 한국수출입은행 환율 API → ExchangeRateHistory 일괄 반영
+
+기능:
+    - 최근 N일 중 DB에 없는 영업일(월~금)만 골라 조회 (이미 저장된 날은 요청 안 함)
+    - 날짜별 조회를 병렬 실행 (settings.EXCHANGE_FETCH_WORKERS)
+    - 문자열 환율("1,234.5")을 숫자로 변환해서 bulk_create(update_conflicts) 1번에 저장
+    - 빈 응답(공휴일, 오늘 고시 전)은 저장 없이 건너뜀 → 다음 실행 때 다시 시도
+
+사용법:
+    backfill(days=14)                  # 관리 커맨드 fetch_exchange_rates, POST /api/exchange/fetch/
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import requests
+from django.conf import settings
+from django.utils import timezone
+
+from .models import ExchangeRateHistory
+
+
+BASE_URL = "https://www.koreaexim.go.kr/site/program/financial/exchangeJSON"
+
+# 주요 통화 리스트 (API에서 실제 제공하는 통화)
+CURRENCIES = ["USD", "EUR", "JPY(100)", "CNH", "GBP", "THB", "SGD", "HKD"]
+
+RATE_FIELDS = ["ttb", "tts", "deal_bas_r", "bkpr", "kftc_deal_bas_r", "kftc_bkpr"]
+
+
+def parse_rate(value) -> float | None:
+    """API 환율 문자열 → float ("1,234.5" → 1234.5, 빈 값 → None)"""
+    value = str(value or "").replace(",", "").strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def business_days(end: date, days: int) -> list:
+    """end 포함 최근 days일 중 월~금 (공휴일은 API 빈 응답으로 걸러짐)"""
+    return [
+        end - timedelta(days=offset)
+        for offset in range(days)
+        if (end - timedelta(days=offset)).weekday() < 5
+    ]
+
+
+def last_business_day(today: date = None) -> date:
+    today = today or timezone.localdate()
+    while today.weekday() >= 5:
+        today -= timedelta(days=1)
+    return today
+
+
+def missing_days(days: int, end: date = None) -> list:
+    """최근 days일 중 DB에 환율이 없는 영업일 (최근 날짜부터)"""
+    end = end or timezone.localdate()
+    candidates = business_days(end, days)
+    if not candidates:
+        return []
+    stored = set(
+        ExchangeRateHistory.objects.filter(date__gte=min(candidates), date__lte=end)
+        .values_list("date", flat=True)
+        .distinct()
+    )
+    return [day for day in candidates if day not in stored]
+
+
+def fetch_day(session: requests.Session, day: date) -> list:
+    """
+    하루치 환율 조회
+    반환: ExchangeRateHistory 목록 (주요 통화만, 비영업일이면 빈 목록)
+    """
+    params = {"authkey": settings.EXCHANGE_API_KEY, "searchdate": day.strftime("%Y%m%d"), "data": "AP01"}
+    # verify=certifi.where() :  작동 안되서 개발때는 verify=false로 설정
+    response = session.get(
+        BASE_URL, params=params, timeout=getattr(settings, "EXCHANGE_FETCH_TIMEOUT", 10.0), verify=False
+    )
+    response.raise_for_status()
+
+    rows = []
+    for item in response.json() or []:
+        cur_unit = item.get("cur_unit", "")
+        deal_bas_r = parse_rate(item.get("deal_bas_r"))
+        if cur_unit not in CURRENCIES or deal_bas_r is None:
+            continue
+        rates = {field: parse_rate(item.get(field)) for field in RATE_FIELDS}
+        rows.append(
+            ExchangeRateHistory(cur_unit=cur_unit, cur_nm=item.get("cur_nm", ""), date=day, **rates)
+        )
+    return rows
+
+
+def backfill(days: int = None, end: date = None) -> dict:
+    """
+    최근 days일 중 빠진 영업일 환율을 한 번에 채움
+    반환: {"requested": 조회한 날 수, "filled": 저장된 날 수, "rows": 저장 행 수, "failed": 실패한 날 수}
+    """
+    days = days or getattr(settings, "EXCHANGE_BACKFILL_DAYS", 14)
+    targets = missing_days(days, end)
+    if not targets:
+        return {"requested": 0, "filled": 0, "rows": 0, "failed": 0}
+
+    session = requests.Session()
+    failed = 0
+
+    def fetch(day):
+        try:
+            return fetch_day(session, day)
+        except (requests.RequestException, ValueError) as e:
+            print(f"❌ 환율 조회 실패 ({day}): {e}")
+            return None
+
+    workers = max(1, min(getattr(settings, "EXCHANGE_FETCH_WORKERS", 4), len(targets)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(fetch, targets))
+    session.close()
+
+    rows = []
+    filled = 0
+    for day_rows in results:
+        if day_rows is None:
+            failed += 1
+        elif day_rows:
+            filled += 1
+            rows.extend(day_rows)
+
+    if rows:
+        ExchangeRateHistory.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["cur_unit", "date"],
+            update_fields=["cur_nm", *RATE_FIELDS, "updated_at"],
+            batch_size=500,
+        )
+
+        from .rates import invalidate_rate_book
+
+        invalidate_rate_book()
+
+    return {"requested": len(targets), "filled": filled, "rows": len(rows), "failed": failed}
@@ -0,0 +1,42 @@
+"""
+exchange/management/commands/fetch_exchange_rates.py
+환율 이력 수집 (빠진 영업일만 한국수출입은행 API 조회)
+
+사용법:
+    python manage.py fetch_exchange_rates                  # 최근 EXCHANGE_BACKFILL_DAYS일 1번 (cron용)
+    python manage.py fetch_exchange_rates --days 365       # 최근 1년 채우기
+    python manage.py fetch_exchange_rates --loop           # interval초마다 계속 실행
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from exchange.fetcher import backfill
+
+
+class Command(BaseCommand):
+    help = "최근 영업일 중 DB에 없는 날의 환율을 한국수출입은행 API에서 가져와 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None, help='확인할 최근 일수 (기본: EXCHANGE_BACKFILL_DAYS)')
+        parser.add_argument('--loop', action='store_true', help='interval초마다 계속 실행')
+        parser.add_argument('--interval', type=float, default=3600.0, help='--loop 실행 간격(초)')
+
+    def handle(self, *args, **options):
+        days = options['days'] or settings.EXCHANGE_BACKFILL_DAYS
+        while True:
+            close_old_connections()
+            counts = backfill(days=days)
+            self.stdout.write(
+                f"환율 수집: 조회 {counts['requested']}일, 저장 {counts['filled']}일 "
+                f"({counts['rows']}행), 실패 {counts['failed']}일"
+            )
+            if not options['loop']:
+                return
+            try:
+                time.sleep(options['interval'])
+            except KeyboardInterrupt:
+                return
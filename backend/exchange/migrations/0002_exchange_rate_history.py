@@ -0,0 +1,81 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:57
+
+from datetime import datetime
+
+from django.db import migrations, models
+
+
+def _rate(value):
+    value = str(value or "").replace(",", "").strip()
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def copy_latest_rates(apps, schema_editor):
+    """기존 통화별 최신 1행(문자열 환율)을 이력 테이블로 옮김"""
+    ExchangeRate = apps.get_model("exchange", "ExchangeRate")
+    ExchangeRateHistory = apps.get_model("exchange", "ExchangeRateHistory")
+
+    rows = []
+    for old in ExchangeRate.objects.all():
+        deal_bas_r = _rate(old.deal_bas_r)
+        try:
+            day = datetime.strptime(old.search_date, "%Y%m%d").date()
+        except ValueError:
+            continue
+        if deal_bas_r is None:
+            continue
+        rows.append(
+            ExchangeRateHistory(
+                cur_unit=old.cur_unit,
+                cur_nm=old.cur_nm,
+                date=day,
+                ttb=_rate(old.ttb),
+                tts=_rate(old.tts),
+                deal_bas_r=deal_bas_r,
+                bkpr=_rate(old.bkpr),
+                kftc_deal_bas_r=_rate(old.kftc_deal_bas_r),
+                kftc_bkpr=_rate(old.kftc_bkpr),
+            )
+        )
+    ExchangeRateHistory.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exchange', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExchangeRateHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cur_unit', models.CharField(max_length=20)),
+                ('cur_nm', models.CharField(max_length=100)),
+                ('date', models.DateField()),
+                ('ttb', models.FloatField(blank=True, null=True)),
+                ('tts', models.FloatField(blank=True, null=True)),
+                ('deal_bas_r', models.FloatField()),
+                ('bkpr', models.FloatField(blank=True, null=True)),
+                ('kftc_deal_bas_r', models.FloatField(blank=True, null=True)),
+                ('kftc_bkpr', models.FloatField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['cur_unit', '-date'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='exchangeratehistory',
+            constraint=models.UniqueConstraint(fields=('cur_unit', 'date'), name='exchange_rate_cur_unit_date_uniq'),
+        ),
+        migrations.RunPython(copy_latest_rates, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='ExchangeRate',
+        ),
+    ]
@@ -0,0 +1,106 @@
+"""
+파일명: exchange/rates.py
+설명: 최신 환율 인메모리 조회 (환율 API/분석 결과 공용)
+
+기능:
+    - 통화별 가장 최근 영업일 ExchangeRateHistory 1행을 메모리에 보관
+    - 통화 코드 일부로 찾기 (예: "JPY" → "JPY(100)")
+    - 1단위 기준 매매기준율 (JPY(100) 등은 100으로 나눔)
+    - 조회 시 외부 API 호출 없음 (수집은 exchange.fetcher.backfill)
+
+버전 관리:
+    - 버전 = ExchangeRateHistory의 마지막 updated_at
+    - 같은 프로세스에서 backfill하면 바로 무효화, 다른 프로세스 반영은
+      settings.EXCHANGE_RATE_CHECK_INTERVAL(초)마다 1회 버전 확인
+
+사용법:
+    rate = get_rate_book().find("JPY")
+    per_unit = unit_rate(rate)
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Max
+
+from .models import ExchangeRateHistory
+
+
+def unit_rate(rate: ExchangeRateHistory) -> float:
+    """1단위 기준 매매기준율 (JPY(100) → 1엔 기준)"""
+    if "(100)" in rate.cur_unit:
+        return rate.deal_bas_r / 100
+    return rate.deal_bas_r
+
+
+class RateBook:
+    def __init__(self, version, latest: dict):
+        self.version = version
+        self._latest = latest  # cur_unit -> ExchangeRateHistory
+
+    @classmethod
+    def load(cls, version) -> "RateBook":
+        latest = {}
+        # ordering: cur_unit, -date → 통화별 첫 행이 최신
+        for rate in ExchangeRateHistory.objects.filter(date__gte=_oldest_latest_date()):
+            latest.setdefault(rate.cur_unit, rate)
+        return cls(version, latest)
+
+    def latest(self, cur_unit: str):
+        return self._latest.get(cur_unit)
+
+    def find(self, code: str):
+        """통화 코드 일부로 찾기 (정확히 일치하는 통화 우선)"""
+        if code in self._latest:
+            return self._latest[code]
+        for cur_unit in sorted(self._latest):
+            if code and code in cur_unit:
+                return self._latest[cur_unit]
+        return None
+
+    def all(self) -> list:
+        return [self._latest[cur_unit] for cur_unit in sorted(self._latest)]
+
+    @property
+    def latest_date(self):
+        return max((rate.date for rate in self._latest.values()), default=None)
+
+
+def _oldest_latest_date():
+    """통화별 최신 날짜 중 가장 오래된 날 (이 날짜 이후만 읽으면 됨)"""
+    rows = ExchangeRateHistory.objects.values("cur_unit").annotate(latest=Max("date"))
+    return min((row["latest"] for row in rows), default=None) or "1900-01-01"
+
+
+# ------------------------------------------------------------
+# 프로세스 공용 RateBook
+# ------------------------------------------------------------
+_book = None
+_last_checked = 0.0
+_lock = threading.Lock()
+
+
+def get_rate_book() -> RateBook:
+    global _book, _last_checked
+    interval = getattr(settings, "EXCHANGE_RATE_CHECK_INTERVAL", 60)
+    now = time.monotonic()
+    if _book is not None and now - _last_checked < interval:
+        return _book
+
+    with _lock:
+        if _book is not None and now - _last_checked < interval:
+            return _book
+        version = ExchangeRateHistory.objects.aggregate(v=Max("updated_at"))["v"]
+        if _book is None or _book.version != version:
+            _book = RateBook.load(version)
+        _last_checked = now
+        return _book
+
+
+def invalidate_rate_book() -> None:
+    """다음 조회 시 다시 로드 (backfill 직후 호출)"""
+    global _book, _last_checked
+    with _lock:
+        _book = None
+        _last_checked = 0.0
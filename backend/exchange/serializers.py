@@ -3,7 +3,7 @@
 설명: 환율 시리얼라이저
 
 클래스:
-    - ExchangeRateSerializer: 환율 정보 시리얼라이저
+    - ExchangeRateSerializer: 환율 정보 시리얼라이저 (ExchangeRateHistory 1행)
 
 필드:
     - cur_unit: 통화 코드 (USD, EUR, JPY 등)
@@ -11,13 +11,16 @@
     - ttb: 송금 받을 때 환율
     - tts: 송금 보낼 때 환율
     - deal_bas_r: 매매 기준율
+    - date / search_date: 환율 적용일 (search_date는 YYYYMMDD)
 """
 
 from rest_framework import serializers
-from .models import ExchangeRate
+from .models import ExchangeRateHistory
 
 
 class ExchangeRateSerializer(serializers.ModelSerializer):
+    search_date = serializers.DateField(source="date", format="%Y%m%d", read_only=True)
+
     class Meta:
-        model = ExchangeRate
+        model = ExchangeRateHistory
         fields = "__all__"
@@ -3,9 +3,9 @@
 설명: 환율 정보 API URL 패턴
 
 URL 패턴:
-- POST /api/exchange/fetch/ : 한국수출입은행 API에서 환율 가져오기
-- GET /api/exchange/rates/ : DB에서 환율 목록 조회
-- GET /api/exchange/rates/<cur_unit>/ : 특정 통화 환율 조회
+- POST /api/exchange/fetch/ : 한국수출입은행 API에서 빠진 영업일 환율 가져오기
+- GET /api/exchange/rates/ : 통화별 최신 환율 목록 조회 (메모리 조회)
+- GET /api/exchange/rates/<cur_unit>/ : 특정 통화 최신 환율 조회
 
 데이터 출처: 한국수출입은행 환율 API
 """
@@ -0,0 +1,178 @@
+"""
+finance/llm_cache.py
+LLM 응답 캐시 (finance.llm_gateway에서 사용)
+
+주요 기능:
+- 키: (모델, 메시지 전체, 호출 파라미터)의 SHA-256 → 같은 입력이면 같은 키
+- 호출 위치(site)별 유지 시간 (settings.LLM_CACHE_TTLS, 0이면 캐시 안 함)
+- 1단계: 프로세스 메모리 LRU (settings.LLM_CACHE_MAX_ENTRIES개)
+- 2단계: 디스크 (settings.LLM_CACHE_DIR, 여러 프로세스가 공유)
+- 호출 위치별 적중/미스 카운터 (stats)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+
+from django.conf import settings
+
+
+DEFAULT_TTL = 3600
+
+# 디스크에 이만큼 쓸 때마다 만료된 파일 정리
+PRUNE_EVERY = 500
+
+
+def ttl_for(site: str) -> int:
+    return getattr(settings, "LLM_CACHE_TTLS", {}).get(site, DEFAULT_TTL)
+
+
+def make_key(model: str, messages: list, params: dict) -> str:
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params},
+        sort_keys=True, ensure_ascii=False, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    def __init__(self, max_entries: int, cache_dir):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory = OrderedDict()  # key -> (만료 시각, 값)
+        self._counters = defaultdict(lambda: {"memory_hits": 0, "disk_hits": 0, "misses": 0})
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # 메모리 (LRU)
+    # ------------------------------------------------------------
+    def _memory_get(self, key: str):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return entry[1]
+
+    def _memory_set(self, key: str, value, expires_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------
+    # 디스크
+    # ------------------------------------------------------------
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _disk_get(self, key: str):
+        if self.cache_dir is None:
+            return None
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("expires_at", 0) <= time.time():
+            return None
+        return entry
+
+    def _disk_set(self, key: str, value, expires_at: float) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps({"expires_at": expires_at, "value": value}, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[LLM CACHE] 디스크 저장 실패: {e}")
+            return
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % PRUNE_EVERY == 0
+        if prune:
+            self.prune_disk()
+
+    def prune_disk(self) -> int:
+        """만료된 디스크 항목 삭제, 반환: 삭제한 파일 수"""
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return 0
+        removed, now = 0, time.time()
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                if json.loads(path.read_text(encoding="utf-8")).get("expires_at", 0) <= now:
+                    path.unlink()
+                    removed += 1
+            except (OSError, ValueError):
+                continue
+        return removed
+
+    # ------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------
+    def get(self, site: str, key: str):
+        """캐시된 값 또는 None (메모리 → 디스크 순, 디스크 적중 시 메모리에 올림)"""
+        value = self._memory_get(key)
+        if value is not None:
+            self._count(site, "memory_hits")
+            return value
+
+        entry = self._disk_get(key)
+        if entry is not None:
+            self._memory_set(key, entry["value"], entry["expires_at"])
+            self._count(site, "disk_hits")
+            return entry["value"]
+
+        self._count(site, "misses")
+        return None
+
+    def set(self, key: str, value, ttl: int) -> None:
+        expires_at = time.time() + ttl
+        self._memory_set(key, value, expires_at)
+        self._disk_set(key, value, expires_at)
+
+    def _count(self, site: str, name: str) -> None:
+        with self._lock:
+            self._counters[site][name] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            sites = {site: dict(counts) for site, counts in self._counters.items()}
+            memory_entries = len(self._memory)
+        for counts in sites.values():
+            total = counts["memory_hits"] + counts["disk_hits"] + counts["misses"]
+            counts["hit_rate"] = round((total - counts["misses"]) / total, 3) if total else 0.0
+        return {"memory_entries": memory_entries, "max_entries": self.max_entries, "sites": sites}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._counters.clear()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> LLMResponseCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache(
+                    max_entries=getattr(settings, "LLM_CACHE_MAX_ENTRIES", 1000),
+                    cache_dir=getattr(settings, "LLM_CACHE_DIR", None),
+                )
+    return _cache
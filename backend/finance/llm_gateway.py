@@ -0,0 +1,203 @@
+"""
+finance/llm_gateway.py
+OpenAI 호출 공용 게이트웨이 (chatbot / stocks / recommendations 공용)
+
+주요 기능:
+- 프로세스당 OpenAI 클라이언트 1개 재사용 (HTTP 커넥션 풀 + keep-alive 유지)
+- 동시 호출 수 제한 (settings.LLM_MAX_CONCURRENCY)
+- 연결/응답 타임아웃 (settings.LLM_CONNECT_TIMEOUT / LLM_TIMEOUT)
+- 일시적 오류(연결, 타임아웃, 429, 5xx)는 지수 백오프 + 지터로 재시도 (settings.LLM_MAX_RETRIES)
+- cache="호출 위치" 를 넘기면 같은 입력의 응답을 재사용 (finance.llm_cache)
+- 스트리밍 응답 (stream_chat_completion, 캐시는 일반 호출과 공유)
+
+사용법:
+    from finance import llm_gateway
+    response = llm_gateway.chat_completion(messages=[...], max_tokens=300, temperature=0.1)
+    response = llm_gateway.chat_completion(messages=[...], cache="translate_description")
+    for delta in llm_gateway.stream_chat_completion(messages=[...], cache="general_chat"):
+        ...
+"""
+
+import random
+import threading
+import time
+
+import httpx
+import openai
+from django.conf import settings
+from openai import OpenAI
+from openai.types.chat import ChatCompletion
+
+from . import llm_cache
+
+
+RETRYABLE_ERRORS = (
+    openai.APIConnectionError,  # APITimeoutError 포함
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+class LLMBusyError(RuntimeError):
+    """동시 호출 수 제한에 걸려 대기 시간 안에 차례가 오지 않음"""
+
+
+_client = None
+_client_lock = threading.Lock()
+_semaphore = None
+
+
+def get_client() -> OpenAI:
+    """공용 OpenAI 클라이언트 (처음 호출 시 생성)"""
+    global _client, _semaphore
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                max_concurrency = getattr(settings, "LLM_MAX_CONCURRENCY", 8)
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=max_concurrency,
+                        max_keepalive_connections=max_concurrency,
+                        keepalive_expiry=60.0,
+                    ),
+                    timeout=httpx.Timeout(
+                        getattr(settings, "LLM_TIMEOUT", 60.0),
+                        connect=getattr(settings, "LLM_CONNECT_TIMEOUT", 5.0),
+                    ),
+                )
+                _semaphore = threading.BoundedSemaphore(max_concurrency)
+                _client = OpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    base_url=getattr(settings, "OPENAI_BASE_URL", None),
+                    http_client=http_client,
+                    max_retries=0,  # 재시도는 chat_completion에서 직접 처리
+                )
+    return _client
+
+
+def _backoff(attempt: int) -> float:
+    """0.5초, 1초, 2초 ... + 지터 (최대 8초)"""
+    return min(8.0, 0.5 * (2 ** attempt)) + random.uniform(0, 0.5)
+
+
+def chat_completion(messages: list, model: str = None, cache: str = None, **kwargs):
+    """
+    chat.completions.create 래퍼
+    - model 생략 시 settings.OPENAI_MODEL
+    - cache: 호출 위치 이름 (settings.LLM_CACHE_TTLS의 키), None이면 캐시 안 함
+    - 나머지 인자(max_tokens, temperature, response_format 등)는 그대로 전달
+    """
+    model = model or getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini")
+    ttl = llm_cache.ttl_for(cache) if cache else 0
+    if ttl <= 0:
+        return _create(messages, model, kwargs)
+
+    response_cache = llm_cache.get_cache()
+    key = llm_cache.make_key(model, messages, kwargs)
+    cached = response_cache.get(cache, key)
+    if cached is not None:
+        return ChatCompletion.model_validate(cached)
+
+    response = _create(messages, model, kwargs)
+    response_cache.set(key, response.model_dump(mode="json"), ttl)
+    return response
+
+
+def stream_chat_completion(messages: list, model: str = None, cache: str = None, **kwargs):
+    """
+    chat_completion의 스트리밍 버전 (제너레이터, 응답 텍스트 조각을 순서대로 yield)
+    - 캐시 적중 시 저장된 응답 전체를 한 번에 yield
+    - 끝까지 받은 응답은 chat_completion과 같은 키로 캐시에 저장
+    """
+    model = model or getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini")
+    ttl = llm_cache.ttl_for(cache) if cache else 0
+    key = llm_cache.make_key(model, messages, kwargs) if ttl > 0 else None
+
+    if key:
+        cached = llm_cache.get_cache().get(cache, key)
+        if cached is not None:
+            content = ChatCompletion.model_validate(cached).choices[0].message.content or ""
+            if content:
+                yield content
+            return
+
+    parts = []
+    finish_reason = None
+    for chunk in _create_stream(messages, model, kwargs):
+        if not chunk.choices:
+            continue
+        choice = chunk.choices[0]
+        finish_reason = choice.finish_reason or finish_reason
+        if choice.delta.content:
+            parts.append(choice.delta.content)
+            yield choice.delta.content
+
+    if key and finish_reason is not None:
+        llm_cache.get_cache().set(key, {
+            "id": chunk.id,
+            "object": "chat.completion",
+            "created": chunk.created,
+            "model": chunk.model,
+            "choices": [{
+                "index": 0,
+                "finish_reason": finish_reason,
+                "message": {"role": "assistant", "content": "".join(parts)},
+            }],
+        }, ttl)
+
+
+def cache_stats() -> dict:
+    return llm_cache.get_cache().stats()
+
+
+def _create(messages: list, model: str, kwargs: dict):
+    client = get_client()
+    retries = getattr(settings, "LLM_MAX_RETRIES", 2)
+
+    if not _semaphore.acquire(timeout=getattr(settings, "LLM_QUEUE_TIMEOUT", 30.0)):
+        raise LLMBusyError("LLM 동시 호출 한도 초과")
+    try:
+        for attempt in range(retries + 1):
+            try:
+                return client.chat.completions.create(model=model, messages=messages, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == retries:
+                    raise
+                print(f"[LLM] 일시적 오류, 재시도 {attempt + 1}/{retries}: {e}")
+                time.sleep(_backoff(attempt))
+    finally:
+        _semaphore.release()
+
+
+def _create_stream(messages: list, model: str, kwargs: dict):
+    """
+    스트리밍 호출 (동시 호출 슬롯은 스트림이 끝나거나 닫힐 때까지 점유)
+    - 재시도는 첫 조각을 받기 전까지만 (이미 내보낸 조각은 되돌릴 수 없음)
+    """
+    client = get_client()
+    retries = getattr(settings, "LLM_MAX_RETRIES", 2)
+
+    if not _semaphore.acquire(timeout=getattr(settings, "LLM_QUEUE_TIMEOUT", 30.0)):
+        raise LLMBusyError("LLM 동시 호출 한도 초과")
+    try:
+        for attempt in range(retries + 1):
+            stream = None
+            try:
+                stream = client.chat.completions.create(model=model, messages=messages, stream=True, **kwargs)
+                iterator = iter(stream)
+                first = next(iterator, None)
+                break
+            except RETRYABLE_ERRORS as e:
+                if stream is not None:
+                    stream.close()
+                if attempt == retries:
+                    raise
+                print(f"[LLM] 일시적 오류, 재시도 {attempt + 1}/{retries}: {e}")
+                time.sleep(_backoff(attempt))
+
+        with stream:
+            if first is not None:
+                yield first
+            yield from iterator
+    finally:
+        _semaphore.release()
@@ -41,6 +41,129 @@ OPENAI_BASE_URL = env(
 )
 OPENAI_MODEL = env("OPENAI_MODEL", default="gpt-4.1-mini")
 
+# OpenAI 공용 게이트웨이 (finance.llm_gateway)
+# LLM_MAX_CONCURRENCY: 프로세스당 동시 호출 수 (= 커넥션 풀 크기), LLM_QUEUE_TIMEOUT: 차례 대기 최대(초)
+# LLM_TIMEOUT / LLM_CONNECT_TIMEOUT: 응답/연결 타임아웃(초), LLM_MAX_RETRIES: 일시적 오류 재시도 횟수
+LLM_MAX_CONCURRENCY = env.int("LLM_MAX_CONCURRENCY", default=8)
+LLM_QUEUE_TIMEOUT = env.float("LLM_QUEUE_TIMEOUT", default=30.0)
+LLM_TIMEOUT = env.float("LLM_TIMEOUT", default=60.0)
+LLM_CONNECT_TIMEOUT = env.float("LLM_CONNECT_TIMEOUT", default=5.0)
+LLM_MAX_RETRIES = env.int("LLM_MAX_RETRIES", default=2)
+
+# LLM 응답 캐시 (finance.llm_cache) - 메모리 LRU + 디스크
+# LLM_CACHE_TTLS: 호출 위치별 유지 시간(초), 0이면 캐시 안 함 (없는 위치는 1시간)
+LLM_CACHE_MAX_ENTRIES = env.int("LLM_CACHE_MAX_ENTRIES", default=1000)
+LLM_CACHE_DIR = env("LLM_CACHE_DIR", default=str(BASE_DIR / ".cache" / "llm"))
+LLM_CACHE_TTLS = {
+    "classify_intent": 86400,
+    "translate_description": 30 * 86400,  # 같은 기업 설명이 반복해서 들어옴
+    "news_response": 600,
+    "investment_advice": 1800,
+    "stock_sentiment": 1800,
+    "product_response": 3600,
+    "travel_response": 86400,
+    "general_chat": 3600,
+    "recommendation": 86400,
+}
+
+# 챗봇 로컬 의도 분류기 (chatbot.intent)
+# CHATBOT_INTENT_THRESHOLD: 로컬 분류 신뢰도가 이 값 미만이면 LLM으로 분류
+# CHATBOT_INTENT_MODEL_PATH: train_intent_model로 학습한 모델 파일, CHATBOT_INTENT_LOG: 분류 기록 저장 여부
+CHATBOT_INTENT_THRESHOLD = env.float("CHATBOT_INTENT_THRESHOLD", default=0.8)
+CHATBOT_INTENT_MODEL_PATH = env(
+    "CHATBOT_INTENT_MODEL_PATH", default=str(BASE_DIR / ".cache" / "chatbot" / "intent_model.npz")
+)
+CHATBOT_INTENT_LOG = env.bool("CHATBOT_INTENT_LOG", default=True)
+
+# 토스증권 커뮤니티 크롤링 (chatbot.toss_crawler / chatbot.browser_pool)
+# TOSS_BROWSER_POOL_SIZE: 프로세스당 헤드리스 Chrome 수, TOSS_BROWSER_MAX_USES: 이만큼 쓰면 드라이버 교체
+# TOSS_BROWSER_ACQUIRE_TIMEOUT: 드라이버 대기 최대(초), TOSS_COMMENTS_TTL: 종목별 댓글 캐시(초)
+TOSS_BROWSER_POOL_SIZE = env.int("TOSS_BROWSER_POOL_SIZE", default=2)
+TOSS_BROWSER_MAX_USES = env.int("TOSS_BROWSER_MAX_USES", default=30)
+TOSS_BROWSER_ACQUIRE_TIMEOUT = env.float("TOSS_BROWSER_ACQUIRE_TIMEOUT", default=30.0)
+TOSS_COMMENTS_TTL = env.int("TOSS_COMMENTS_TTL", default=600)
+# TOSS_NOT_FOUND_TTL: 검색 결과가 없던 검색어를 다시 크롤링하지 않는 시간(초)
+# TOSS_CACHE_MAX_ENTRIES: 검색어/종목별 캐시 최대 항목 수 (넘치면 오래된 것부터 삭제)
+TOSS_NOT_FOUND_TTL = env.int("TOSS_NOT_FOUND_TTL", default=300)
+TOSS_CACHE_MAX_ENTRIES = env.int("TOSS_CACHE_MAX_ENTRIES", default=500)
+
+# AI 분석 비동기 작업 (recommendations.jobs)
+# ANALYSIS_JOB_MODE: True면 POST /api/v1/analysis/ 가 항상 작업 등록 후 202 반환
+# ANALYSIS_JOB_BACKEND: "thread"(백그라운드 스레드 풀) | "inline"(테스트용 내부 큐)
+ANALYSIS_JOB_MODE = env.bool("ANALYSIS_JOB_MODE", default=False)
+ANALYSIS_JOB_BACKEND = env("ANALYSIS_JOB_BACKEND", default="thread")
+ANALYSIS_JOB_WORKERS = env.int("ANALYSIS_JOB_WORKERS", default=4)
+# ANALYSIS_JOB_STALE_AFTER: running 상태로 이 시간(초)이 지나면 중단된 작업으로 보고 failed 처리 (recover_jobs)
+ANALYSIS_JOB_STALE_AFTER = env.int("ANALYSIS_JOB_STALE_AFTER", default=1800)
+
+# 분석 결과 외부 연동(환율/뉴스/유튜브) 병렬 조회 (recommendations.enrichment)
+# ANALYSIS_ENRICH_DEADLINE: 전체 마감 시간(초) - 넘기면 해당 소스 없이 partial 응답
+ANALYSIS_ENRICH_WORKERS = env.int("ANALYSIS_ENRICH_WORKERS", default=8)
+ANALYSIS_ENRICH_DEADLINE = env.float("ANALYSIS_ENRICH_DEADLINE", default=8.0)
+
+# 추천 옵션 인메모리 인덱스 (recommendations.option_index)
+# 상품 동기화 버전 확인 주기(초) - 그 사이에는 DB 조회 없이 메모리 인덱스 사용
+OPTION_INDEX_CHECK_INTERVAL = env.int("OPTION_INDEX_CHECK_INTERVAL", default=30)
+
+# 예금/적금 목록 카탈로그 캐시 (products.catalog)
+# PRODUCT_CATALOG_CHECK_INTERVAL: 동기화 버전 확인 주기(초)
+# PRODUCT_PAGE_SIZE / PRODUCT_MAX_PAGE_SIZE: 커서 페이지네이션 기본/최대 개수
+PRODUCT_CATALOG_CHECK_INTERVAL = env.int("PRODUCT_CATALOG_CHECK_INTERVAL", default=30)
+PRODUCT_PAGE_SIZE = env.int("PRODUCT_PAGE_SIZE", default=20)
+PRODUCT_MAX_PAGE_SIZE = env.int("PRODUCT_MAX_PAGE_SIZE", default=100)
+
+# 금감원 상품 동기화 (products.sync)
+# FSS_SYNC_WORKERS: 페이지 병렬 조회 스레드 수, FSS_SYNC_TIMEOUT: 페이지당 요청 타임아웃(초)
+FSS_SYNC_WORKERS = env.int("FSS_SYNC_WORKERS", default=4)
+FSS_SYNC_TIMEOUT = env.float("FSS_SYNC_TIMEOUT", default=10.0)
+
+# 주식 데이터 갱신 스케줄러 (stocks.scheduler)
+# STOCK_REFRESH_BACKEND: "thread"(갱신 요청 시 웹 프로세스 백그라운드 스레드에서 실행)
+#                        | "daemon"(요청은 큐 등록만, run_stock_refresher 커맨드가 실행)
+# STOCK_REFRESH_INTERVAL_*: 시장별 주기 갱신 간격(초), STOCK_REFRESH_LOCK_TIMEOUT: 갱신 잠금 만료(초)
+STOCK_REFRESH_BACKEND = env("STOCK_REFRESH_BACKEND", default="thread")
+STOCK_REFRESH_INTERVAL_KR = env.int("STOCK_REFRESH_INTERVAL_KR", default=1800)
+STOCK_REFRESH_INTERVAL_US = env.int("STOCK_REFRESH_INTERVAL_US", default=1800)
+STOCK_REFRESH_LOCK_TIMEOUT = env.int("STOCK_REFRESH_LOCK_TIMEOUT", default=1800)
+# STOCK_REFRESH_RETRY_BACKOFF: 갱신 실패 후 주기 갱신을 다시 시도하기까지 대기(초)
+STOCK_REFRESH_RETRY_BACKOFF = env.int("STOCK_REFRESH_RETRY_BACKOFF", default=300)
+
+# 해외 주식 시세 일괄 조회 (stocks.refresh)
+# STOCK_QUOTE_BATCH_SIZE: 요청 1번에 묶는 종목 수, STOCK_QUOTE_WORKERS: 동시 요청 수
+# STOCK_QUOTE_RETRIES: 배치별 재시도 횟수 (지수 백오프)
+STOCK_QUOTE_BATCH_SIZE = env.int("STOCK_QUOTE_BATCH_SIZE", default=100)
+STOCK_QUOTE_WORKERS = env.int("STOCK_QUOTE_WORKERS", default=4)
+STOCK_QUOTE_RETRIES = env.int("STOCK_QUOTE_RETRIES", default=3)
+# STOCK_QUOTE_MIN_COVERAGE: 해외 갱신 성공으로 볼 최소 시세 수신 비율 (미만이면 실패 → 재시도 백오프)
+STOCK_QUOTE_MIN_COVERAGE = env.float("STOCK_QUOTE_MIN_COVERAGE", default=0.5)
+
+# 주식 관련 디스크 캐시 (S&P 500 구성 종목 등)
+STOCK_CACHE_DIR = env("STOCK_CACHE_DIR", default=str(BASE_DIR / ".cache" / "stocks"))
+STOCK_SP500_CACHE_TTL = env.int("STOCK_SP500_CACHE_TTL", default=86400)
+
+# 게시글 조회수 지연 반영 (articles.view_counter)
+# ARTICLE_VIEW_FLUSH_INTERVAL: DB 반영 주기(초)
+# ARTICLE_VIEW_DEDUPE_WINDOW: 같은 사용자/IP의 같은 글 반복 조회를 1번으로 치는 시간(초), 0이면 모두 집계
+ARTICLE_VIEW_FLUSH_INTERVAL = env.float("ARTICLE_VIEW_FLUSH_INTERVAL", default=10.0)
+ARTICLE_VIEW_DEDUPE_WINDOW = env.int("ARTICLE_VIEW_DEDUPE_WINDOW", default=0)
+
+# 금/은 시세 캐시 (metals.history) - data/*.xlsx 를 변환한 .npz 저장 위치
+METALS_CACHE_DIR = env("METALS_CACHE_DIR", default=str(BASE_DIR / ".cache" / "metals"))
+
+# 주요 시장 지표 캐시 (stocks.indices)
+# MARKET_INDICES_TTL: (심볼, 기간)별 캐시 유지 시간(초), MARKET_INDICES_WARMER: 5d 백그라운드 갱신 여부
+MARKET_INDICES_TTL = env.int("MARKET_INDICES_TTL", default=60)
+MARKET_INDICES_WARMER = env.bool("MARKET_INDICES_WARMER", default=True)
+
+# 종목 차트 캔들 저장소 (stocks.candles) - 최신 구간 재조회 간격(초)
+CHART_CANDLE_TTL = env.int("CHART_CANDLE_TTL", default=900)
+
+# 종목 상세 스냅샷 (stocks.snapshots) - 필드 그룹별 유지 시간(초)
+# PRICE: 시세, FUNDAMENTALS: PER/EPS/52주 등 지표, PROFILE: 이름/섹터/기업 설명
+STOCK_SNAPSHOT_TTL_PRICE = env.int("STOCK_SNAPSHOT_TTL_PRICE", default=60)
+STOCK_SNAPSHOT_TTL_FUNDAMENTALS = env.int("STOCK_SNAPSHOT_TTL_FUNDAMENTALS", default=86400)
+STOCK_SNAPSHOT_TTL_PROFILE = env.int("STOCK_SNAPSHOT_TTL_PROFILE", default=604800)
+
 # Naver API
 NAVER_CLIENT_ID = env("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = env("NAVER_CLIENT_SECRET")
@@ -53,6 +176,13 @@ KAKAO_REST_API_KEY = env("KAKAO_REST_API_KEY")
 
 # Exchange API
 EXCHANGE_API_KEY = env("EXCHANGE_API_KEY")
+# 환율 이력 수집/조회 (exchange.fetcher, exchange.rates)
+# EXCHANGE_BACKFILL_DAYS: 빠진 영업일을 확인할 최근 일수, EXCHANGE_FETCH_WORKERS: 날짜별 병렬 조회 스레드 수
+# EXCHANGE_FETCH_TIMEOUT: 요청 타임아웃(초), EXCHANGE_RATE_CHECK_INTERVAL: 메모리 환율 버전 확인 주기(초)
+EXCHANGE_BACKFILL_DAYS = env.int("EXCHANGE_BACKFILL_DAYS", default=14)
+EXCHANGE_FETCH_WORKERS = env.int("EXCHANGE_FETCH_WORKERS", default=4)
+EXCHANGE_FETCH_TIMEOUT = env.float("EXCHANGE_FETCH_TIMEOUT", default=10.0)
+EXCHANGE_RATE_CHECK_INTERVAL = env.int("EXCHANGE_RATE_CHECK_INTERVAL", default=60)
 
 # Application definition
 
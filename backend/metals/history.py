@@ -0,0 +1,172 @@
+"""
+파일명: metals/history.py
+설명: 금/은 과거 시세 캐시 (Excel → NumPy 배열)
+
+기능:
+    - data/*.xlsx 를 1번만 파싱해서 날짜순 정렬된 배열(날짜: datetime64[D], 가격: float64)로 보관
+    - 파싱 결과를 settings.METALS_CACHE_DIR 에 .npz 로 저장 (재시작 시 Excel 파싱 생략)
+    - 원본 파일의 수정 시각/크기가 바뀌면 다시 변환
+    - 기간 필터는 이진 탐색 (np.searchsorted)
+    - 다운샘플링: 주/월 단위 마지막 값, 최대 포인트 수 제한
+
+사용법:
+    series = get_series('gold')
+    lo, hi = series.range(start, end)
+    data = series.records(lo, hi, series.resample(lo, hi, interval='1wk', points=200))
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+
+SOURCES = {
+    'gold': 'Gold_prices.xlsx',
+    'silver': 'Silver_prices.xlsx',
+}
+
+DATE_COL = 'Date'
+PRICE_COL = 'Close/Last'
+
+INTERVALS = ('1d', '1wk', '1mo')
+
+
+class MetalSeries:
+    def __init__(self, dates: np.ndarray, prices: np.ndarray):
+        self.dates = dates  # datetime64[D], 오름차순
+        self.prices = prices  # float64
+        # 응답 생성용 (요청마다 strftime/float 변환하지 않도록 미리 변환)
+        self._date_strs = np.datetime_as_string(dates, unit='D').tolist()
+        self._price_list = prices.tolist()
+
+    def __len__(self):
+        return len(self.dates)
+
+    def range(self, start=None, end=None) -> tuple:
+        """[start, end] (양 끝 포함) 에 해당하는 인덱스 구간 (lo, hi)"""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(start, 'D'), side='left'))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, np.datetime64(end, 'D'), side='right'))
+        return lo, max(lo, hi)
+
+    def resample(self, lo: int, hi: int, interval: str = '1d', points: int = None):
+        """
+        구간 [lo, hi) 의 다운샘플링 인덱스 (None이면 구간 전체)
+        - interval: '1wk' / '1mo' 면 기간별 마지막 거래일 값
+        - points: 최대 포인트 수 (균등 간격, 마지막 값은 항상 포함)
+        """
+        index = None
+        if interval != '1d' and hi > lo:
+            dates = self.dates[lo:hi]
+            if interval == '1wk':
+                # 1970-01-01은 목요일 → +3일 해서 월요일 시작 주 번호
+                keys = (dates.astype('int64') + 3) // 7
+            else:
+                keys = dates.astype('datetime64[M]').astype('int64')
+            last = np.flatnonzero(keys[1:] != keys[:-1])
+            index = np.append(last, len(keys) - 1) + lo
+
+        if points:
+            count = (hi - lo) if index is None else len(index)
+            if count > points:
+                picks = np.unique(np.linspace(0, count - 1, points).round().astype('int64'))
+                index = (picks + lo) if index is None else index[picks]
+        return index
+
+    def records(self, lo: int, hi: int, index=None) -> list:
+        """[{'date': 'YYYY-MM-DD', 'price': float}, ...]"""
+        if index is None:
+            return [
+                {'date': d, 'price': p}
+                for d, p in zip(self._date_strs[lo:hi], self._price_list[lo:hi])
+            ]
+        return [{'date': self._date_strs[i], 'price': self._price_list[i]} for i in index.tolist()]
+
+
+# ------------------------------------------------------------
+# Excel 파싱 / .npz 캐시
+# ------------------------------------------------------------
+def _source_path(metal: str) -> Path:
+    return Path(settings.BASE_DIR) / 'data' / SOURCES[metal]
+
+
+def _cache_path(metal: str) -> Path:
+    return Path(getattr(settings, 'METALS_CACHE_DIR', Path(settings.BASE_DIR) / '.cache' / 'metals')) / f'{metal}.npz'
+
+
+def parse_excel(file_path) -> MetalSeries:
+    """Excel 파일 → MetalSeries (날짜/가격 정제, 날짜순 정렬, 같은 날짜는 마지막 값)"""
+    df = pd.read_excel(file_path, usecols=[DATE_COL, PRICE_COL])
+
+    dates = pd.to_datetime(df[DATE_COL], errors='coerce')
+    # 쉼표 제거 → 숫자 변환
+    prices = pd.to_numeric(df[PRICE_COL].astype(str).str.replace(',', '', regex=False), errors='coerce')
+
+    frame = pd.DataFrame({'date': dates.dt.normalize(), 'price': prices}).dropna()
+    frame = frame.sort_values('date', kind='stable').drop_duplicates('date', keep='last')
+
+    return MetalSeries(
+        frame['date'].to_numpy(dtype='datetime64[D]'),
+        frame['price'].to_numpy(dtype='float64'),
+    )
+
+
+def _signature(stat) -> np.ndarray:
+    return np.array([stat.st_mtime_ns, stat.st_size], dtype='int64')
+
+
+def _load_cached(metal: str, signature: np.ndarray):
+    try:
+        with np.load(_cache_path(metal)) as data:
+            if not np.array_equal(data['signature'], signature):
+                return None
+            return MetalSeries(data['dates'].astype('datetime64[D]'), data['prices'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_cached(metal: str, series: MetalSeries, signature: np.ndarray) -> None:
+    path = _cache_path(metal)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.stem}.{os.getpid()}.tmp.npz')
+        np.savez(tmp, signature=signature, dates=series.dates.astype('int64'), prices=series.prices)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f'[METALS] 캐시 저장 실패: {e}')
+
+
+# ------------------------------------------------------------
+# 프로세스 메모리 캐시
+# ------------------------------------------------------------
+_series = {}  # metal -> (signature, MetalSeries)
+_lock = threading.Lock()
+
+
+def get_series(metal: str) -> MetalSeries:
+    """
+    금속별 시세 (메모리 → .npz → Excel 순)
+    원본 파일이 바뀌면 (수정 시각/크기) 다시 변환
+    """
+    signature = _signature(os.stat(_source_path(metal)))
+
+    entry = _series.get(metal)
+    if entry is not None and np.array_equal(entry[0], signature):
+        return entry[1]
+
+    with _lock:
+        entry = _series.get(metal)
+        if entry is not None and np.array_equal(entry[0], signature):
+            return entry[1]
+
+        series = _load_cached(metal, signature)
+        if series is None:
+            print(f'[METALS] {SOURCES[metal]} 변환 중...')
+            series = parse_excel(_source_path(metal))
+            _save_cached(metal, series, signature)
+
+        _series[metal] = (signature, series)
+        return series
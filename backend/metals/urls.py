@@ -8,6 +8,8 @@ URL 패턴:
         - metal: 'gold' 또는 'silver'
         - start: 시작일 (YYYY-MM-DD)
         - end: 종료일 (YYYY-MM-DD)
+        - interval: '1d'(기본) / '1wk' / '1mo' (기간별 마지막 값)
+        - points: 최대 포인트 수 (균등 간격으로 줄임)
 
 데이터 출처: 외부 금속 시세 API
 """
@@ -0,0 +1,186 @@
+"""
+파일명: products/catalog.py
+설명: 예금/적금 상품 목록 인메모리 카탈로그 (목록 API용)
+
+기능:
+    - 상품 + 옵션을 1번만 직렬화해서 (은행명, 상품명, id) 순으로 메모리에 보관
+    - 필터 인덱스: 은행별 위치 목록, 옵션 단위 기간/최고금리 배열
+    - 커서 페이지네이션 (마지막 상품의 정렬 키 기준이라 재동기화 후에도 이어짐)
+    - ETag: 동기화 버전 + 좋아요 수 + 요청 조건으로 계산 → 바뀐 게 없으면 304
+
+버전 관리:
+    - 카탈로그 버전 = ProductSyncStatus의 해당 상품 종류 버전
+    - 금감원 동기화가 돌아 버전이 바뀐 경우에만 다시 직렬화
+    - 버전 확인 쿼리는 settings.PRODUCT_CATALOG_CHECK_INTERVAL(초)마다 1회만 실행
+
+사용법:
+    catalog = get_catalog("deposit")
+    positions = catalog.filter(bank="우리은행", term=12, min_rate=3.0)
+"""
+
+import base64
+import bisect
+import hashlib
+import json
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+
+
+class InvalidCursor(ValueError):
+    """해석할 수 없는 cursor 값"""
+
+
+class Catalog:
+    def __init__(self, product_type: str, version: int, rows: list):
+        self.product_type = product_type
+        self.version = version
+        self.rows = rows  # 직렬화된 상품 (likes_count 제외), 정렬 키 순
+        self.keys = [(r["kor_co_nm"], r["fin_prdt_nm"], r["id"]) for r in rows]
+
+        # 은행명 → 위치 목록 (오름차순)
+        self._by_bank = {}
+        for pos, row in enumerate(rows):
+            self._by_bank.setdefault(row["kor_co_nm"], []).append(pos)
+
+        # 옵션 단위 컬럼 (옵션이 속한 상품 위치, 기간, 최고금리)
+        options = [(pos, o) for pos, row in enumerate(rows) for o in row["options"]]
+        self._opt_pos = np.array([pos for pos, _ in options], dtype=np.int64)
+        self._opt_term = np.array([int(o["save_trm"] or 0) for _, o in options], dtype=np.int64)
+        self._opt_rate = np.array([float(o["intr_rate2"] or 0) for _, o in options], dtype=np.float64)
+
+    @classmethod
+    def build(cls, product_type: str, version: int) -> "Catalog":
+        from .models import DepositProduct, SavingProduct
+        from .serializers import DepositProductSerializer, SavingProductSerializer
+
+        model, serializer_class = {
+            "deposit": (DepositProduct, DepositProductSerializer),
+            "saving": (SavingProduct, SavingProductSerializer),
+        }[product_type]
+
+        products = model.objects.prefetch_related("options").order_by("kor_co_nm", "fin_prdt_nm", "id")
+        rows = serializer_class(products, many=True, context={"likes_counts": {}}).data
+        rows = [dict(row) for row in rows]
+        for row in rows:
+            row.pop("likes_count", None)
+        return cls(product_type, version, rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def banks(self) -> list:
+        return sorted(self._by_bank)
+
+    def filter(self, bank: str = None, term: int = None, min_rate: float = None) -> np.ndarray:
+        """조건에 맞는 상품 위치 (정렬 키 순)"""
+        positions = None
+
+        if term is not None or min_rate is not None:
+            mask = np.ones(len(self._opt_pos), dtype=bool)
+            if term is not None:
+                mask &= self._opt_term == term
+            if min_rate is not None:
+                mask &= self._opt_rate >= min_rate
+            positions = np.unique(self._opt_pos[mask])
+
+        if bank:
+            bank_positions = np.array(self._by_bank.get(bank, []), dtype=np.int64)
+            positions = bank_positions if positions is None else np.intersect1d(positions, bank_positions)
+
+        if positions is None:
+            positions = np.arange(len(self.rows), dtype=np.int64)
+        return positions
+
+    def page(self, positions: np.ndarray, cursor: str = None, size: int = 20) -> tuple:
+        """
+        positions 중 cursor 다음부터 size개
+        반환: (위치 목록, 다음 페이지 cursor 또는 None)
+        """
+        start = 0
+        if cursor:
+            after = bisect.bisect_right(self.keys, decode_cursor(cursor))
+            start = int(np.searchsorted(positions, after, side="left"))
+
+        chosen = positions[start:start + size]
+        next_cursor = None
+        if start + size < len(positions) and len(chosen):
+            next_cursor = encode_cursor(self.keys[int(chosen[-1])])
+        return chosen, next_cursor
+
+    def records(self, positions, likes_counts: dict) -> list:
+        """응답용 상품 목록 (저장된 좋아요 수 포함)"""
+        return [
+            {**self.rows[pos], "likes_count": likes_counts.get(self.rows[pos]["fin_prdt_cd"], 0)}
+            for pos in positions.tolist()
+        ]
+
+
+# ------------------------------------------------------------
+# cursor / ETag
+# ------------------------------------------------------------
+def encode_cursor(key: tuple) -> str:
+    raw = json.dumps(list(key), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        bank, name, pk = json.loads(raw)
+        return (str(bank), str(name), int(pk))
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+
+
+def make_etag(catalog: Catalog, likes_counts: dict, params: dict) -> str:
+    """동기화 버전 + 좋아요 수 + 요청 조건 → 약한 ETag"""
+    payload = json.dumps(
+        [catalog.product_type, catalog.version, sorted(likes_counts.items()), sorted(params.items())],
+        ensure_ascii=False, default=str,
+    )
+    return f'W/"{hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]}"'
+
+
+# ------------------------------------------------------------
+# 프로세스 공용 카탈로그
+# ------------------------------------------------------------
+_catalogs = {}  # product_type -> Catalog
+_last_checked = {}  # product_type -> 마지막 버전 확인 시각
+_lock = threading.Lock()
+
+
+def get_catalog(product_type: str) -> Catalog:
+    """
+    상품 종류별 카탈로그
+    - 버전 확인은 PRODUCT_CATALOG_CHECK_INTERVAL초마다 1회 (그 사이에는 쿼리 없음)
+    """
+    interval = getattr(settings, "PRODUCT_CATALOG_CHECK_INTERVAL", 30)
+    now = time.monotonic()
+    catalog = _catalogs.get(product_type)
+    if catalog is not None and now - _last_checked.get(product_type, 0.0) < interval:
+        return catalog
+
+    with _lock:
+        catalog = _catalogs.get(product_type)
+        if catalog is not None and now - _last_checked.get(product_type, 0.0) < interval:
+            return catalog
+
+        from .models import ProductSyncStatus
+
+        deposit_version, saving_version = ProductSyncStatus.current_versions()
+        version = deposit_version if product_type == "deposit" else saving_version
+        if catalog is None or catalog.version != version:
+            catalog = Catalog.build(product_type, version)
+            _catalogs[product_type] = catalog
+        _last_checked[product_type] = now
+        return catalog
+
+
+def invalidate_catalog() -> None:
+    """다음 조회 시 다시 로드 (테스트/수동 데이터 변경용)"""
+    with _lock:
+        _catalogs.clear()
+        _last_checked.clear()
@@ -0,0 +1,72 @@
+"""
+파일명: products/likes.py
+설명: 상품 좋아요 토글 및 좋아요 수(ProductLikeCount) 관리
+
+기능:
+    - toggle_like: Like 추가/삭제와 ProductLikeCount 증감을 한 트랜잭션에서 처리
+    - reconcile_like_counts: Like 실제 개수와 다른 ProductLikeCount 복구
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count
+
+from .models import Like, ProductLikeCount
+
+
+def toggle_like(user, product_type: str, fin_prdt_cd: str) -> tuple:
+    """
+    상품 좋아요 토글
+    반환: (liked, likes_count)
+    """
+    row = {"user": user, "product_type": product_type, "fin_prdt_cd": fin_prdt_cd}
+
+    with transaction.atomic():
+        deleted, _ = Like.objects.filter(**row).delete()
+        if deleted:
+            liked, delta = False, -1
+        else:
+            try:
+                with transaction.atomic():
+                    Like.objects.create(**row)
+                liked, delta = True, 1
+            except IntegrityError:
+                # 동시에 들어온 같은 요청이 먼저 추가함
+                liked, delta = True, 0
+
+        if delta:
+            ProductLikeCount.add(product_type, fin_prdt_cd, delta)
+        likes_count = ProductLikeCount.count_for(product_type, fin_prdt_cd)
+
+    return liked, likes_count
+
+
+def reconcile_like_counts(dry_run: bool = False) -> int:
+    """
+    ProductLikeCount를 Like 실제 개수로 다시 맞춤
+    반환: 고친 (상품 유형, 상품 코드) 개수
+    """
+    actual = {
+        (row["product_type"], row["fin_prdt_cd"]): row["n"]
+        for row in Like.objects.values("product_type", "fin_prdt_cd").annotate(n=Count("id"))
+    }
+    stored = {
+        (product_type, code): count
+        for product_type, code, count in ProductLikeCount.objects.values_list(
+            "product_type", "fin_prdt_cd", "likes_count"
+        )
+    }
+
+    drifted = [
+        ProductLikeCount(product_type=key[0], fin_prdt_cd=key[1], likes_count=actual.get(key, 0))
+        for key in actual.keys() | stored.keys()
+        if actual.get(key, 0) != stored.get(key, 0)
+    ]
+    if drifted and not dry_run:
+        ProductLikeCount.objects.bulk_create(
+            drifted,
+            update_conflicts=True,
+            unique_fields=["product_type", "fin_prdt_cd"],
+            update_fields=["likes_count"],
+            batch_size=500,
+        )
+    return len(drifted)
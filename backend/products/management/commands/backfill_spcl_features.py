@@ -0,0 +1,49 @@
+"""
+파일명: products/management/commands/backfill_spcl_features.py
+설명: 우대조건(spcl_cnd) 사전 계산 값 백필
+
+사용법:
+    python manage.py backfill_spcl_features          # 미계산(spcl_penalty null) 상품만
+    python manage.py backfill_spcl_features --all    # 전체 상품 다시 계산
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from products.models import DepositProduct, SavingProduct, ProductSyncStatus
+from products.spcl_cnd import spcl_cnd_fields
+
+
+FIELDS = ["spcl_cnd_short", "spcl_easy_kws", "spcl_hard_kws", "spcl_penalty"]
+
+
+class Command(BaseCommand):
+    help = "예금/적금 상품의 우대조건 요약/키워드/감점을 계산해서 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="이미 계산된 상품도 다시 계산",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        for product_type, model in (("deposit", DepositProduct), ("saving", SavingProduct)):
+            qs = model.objects.all()
+            if not options["all"]:
+                qs = qs.filter(spcl_penalty__isnull=True)
+
+            products = list(qs.only("id", "spcl_cnd"))
+            for p in products:
+                for k, v in spcl_cnd_fields(p.spcl_cnd).items():
+                    setattr(p, k, v)
+
+            with transaction.atomic():
+                model.objects.bulk_update(products, FIELDS, batch_size=options["batch_size"])
+
+            if products:
+                # 점수화 인덱스가 새 감점 값을 다시 읽도록 버전 갱신
+                ProductSyncStatus.bump(product_type)
+
+            self.stdout.write(f"{product_type}: {len(products)}개 상품 갱신")
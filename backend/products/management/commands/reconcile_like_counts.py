@@ -0,0 +1,40 @@
+"""
+파일명: products/management/commands/reconcile_like_counts.py
+설명: 저장된 좋아요 수를 실제 좋아요 기준으로 복구
+
+대상:
+    - 상품: ProductLikeCount ↔ Like
+    - 게시글/댓글: likes_count ↔ like_users
+
+사용법:
+    python manage.py reconcile_like_counts            # 어긋난 값 복구
+    python manage.py reconcile_like_counts --dry-run  # 개수만 확인
+"""
+
+from django.core.management.base import BaseCommand
+
+from articles.likes import reconcile_like_counts as reconcile_article_likes
+from products.likes import reconcile_like_counts as reconcile_product_likes
+
+
+class Command(BaseCommand):
+    help = "상품/게시글/댓글의 저장된 좋아요 수를 실제 좋아요 기준으로 다시 맞춥니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="고치지 않고 어긋난 개수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        products = reconcile_product_likes(dry_run=dry_run)
+        articles = reconcile_article_likes(dry_run=dry_run)
+
+        verb = "어긋남" if dry_run else "복구"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"상품 {products}개, 게시글 {articles['articles']}개, 댓글 {articles['comments']}개 {verb}"
+            )
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:15
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_like_delete_wishlist'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSyncStatus',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('product_type', models.CharField(choices=[('deposit', '예금'), ('saving', '적금')], max_length=10, unique=True)),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('synced_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_productsyncstatus'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='depositproduct',
+            name='spcl_cnd_short',
+            field=models.CharField(blank=True, default='', max_length=140),
+        ),
+        migrations.AddField(
+            model_name='depositproduct',
+            name='spcl_easy_kws',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='depositproduct',
+            name='spcl_hard_kws',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='depositproduct',
+            name='spcl_penalty',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='savingproduct',
+            name='spcl_cnd_short',
+            field=models.CharField(blank=True, default='', max_length=140),
+        ),
+        migrations.AddField(
+            model_name='savingproduct',
+            name='spcl_easy_kws',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='savingproduct',
+            name='spcl_hard_kws',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='savingproduct',
+            name='spcl_penalty',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+    ]
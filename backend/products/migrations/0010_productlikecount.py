@@ -0,0 +1,39 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:51
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_like_counts(apps, schema_editor):
+    Like = apps.get_model("products", "Like")
+    ProductLikeCount = apps.get_model("products", "ProductLikeCount")
+    ProductLikeCount.objects.bulk_create(
+        [
+            ProductLikeCount(product_type=row["product_type"], fin_prdt_cd=row["fin_prdt_cd"], likes_count=row["n"])
+            for row in Like.objects.values("product_type", "fin_prdt_cd").annotate(n=Count("id"))
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_spcl_cnd_features'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductLikeCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fin_prdt_cd', models.CharField(max_length=50)),
+                ('product_type', models.CharField(choices=[('deposit', '예금'), ('saving', '적금')], max_length=10)),
+                ('likes_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('product_type', 'fin_prdt_cd')},
+            },
+        ),
+        migrations.RunPython(backfill_like_counts, migrations.RunPython.noop),
+    ]
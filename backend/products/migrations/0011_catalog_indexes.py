@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_productlikecount'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='depositoption',
+            index=models.Index(fields=['save_trm', 'intr_rate2'], name='deposit_opt_term_rate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='depositproduct',
+            index=models.Index(fields=['kor_co_nm', 'fin_prdt_nm'], name='deposit_bank_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savingoption',
+            index=models.Index(fields=['save_trm', 'intr_rate2'], name='saving_opt_term_rate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savingproduct',
+            index=models.Index(fields=['kor_co_nm', 'fin_prdt_nm'], name='saving_bank_name_idx'),
+        ),
+    ]
@@ -8,12 +8,16 @@
 - SavingProduct: 적금 상품 정보
 - SavingOption: 적금 상품의 옵션(기간별 금리)
 - Like: 사용자의 상품 좋아요 정보
+- ProductLikeCount: 상품별 좋아요 수 (Like 토글 시 함께 갱신)
+- ProductSyncStatus: 상품 종류별 금감원 동기화 버전
 
 데이터 출처: 금융감독원 금융상품비교공시 API
 """
 
 from django.conf import settings
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
 
 
 class DepositProduct(models.Model):
@@ -31,6 +35,10 @@ class DepositProduct(models.Model):
         join_way: 가입 방법
         spcl_cnd: 우대 조건
         etc_note: 기타 유의사항
+        spcl_cnd_short: 우대 조건 요약 (동기화 시 계산)
+        spcl_easy_kws: 우대 조건 중 쉬운 조건 키워드
+        spcl_hard_kws: 우대 조건 중 어려운 조건(카드실적 등) 키워드
+        spcl_penalty: 우대 조건 난이도 감점 (null이면 미계산)
     """
     fin_prdt_cd = models.CharField(max_length=50, unique=True)
     kor_co_nm = models.CharField(max_length=100)
@@ -40,6 +48,14 @@ class DepositProduct(models.Model):
     join_way = models.CharField(max_length=100)
     spcl_cnd = models.TextField(blank=True, default="")
     etc_note = models.TextField(blank=True, default="")
+    spcl_cnd_short = models.CharField(max_length=140, blank=True, default="")
+    spcl_easy_kws = models.JSONField(default=list, blank=True)
+    spcl_hard_kws = models.JSONField(default=list, blank=True)
+    spcl_penalty = models.FloatField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        # 목록 정렬(은행명, 상품명) + 은행 필터
+        indexes = [models.Index(fields=["kor_co_nm", "fin_prdt_nm"], name="deposit_bank_name_idx")]
 
 
 class DepositOption(models.Model):
@@ -66,6 +82,10 @@ class DepositOption(models.Model):
     max_limit = models.IntegerField(null=True, blank=True)
     intr_rate_type_nm = models.CharField(max_length=50)
 
+    class Meta:
+        # 기간/최고금리 필터
+        indexes = [models.Index(fields=["save_trm", "intr_rate2"], name="deposit_opt_term_rate_idx")]
+
 
 class SavingProduct(models.Model):
     """
@@ -82,6 +102,10 @@ class SavingProduct(models.Model):
         join_way: 가입 방법
         spcl_cnd: 우대 조건
         etc_note: 기타 유의사항
+        spcl_cnd_short: 우대 조건 요약 (동기화 시 계산)
+        spcl_easy_kws: 우대 조건 중 쉬운 조건 키워드
+        spcl_hard_kws: 우대 조건 중 어려운 조건(카드실적 등) 키워드
+        spcl_penalty: 우대 조건 난이도 감점 (null이면 미계산)
     """
     fin_prdt_cd = models.CharField(max_length=50, unique=True)
     kor_co_nm = models.CharField(max_length=100)
@@ -91,6 +115,14 @@ class SavingProduct(models.Model):
     join_way = models.CharField(max_length=100)
     spcl_cnd = models.TextField(blank=True, default="")
     etc_note = models.TextField(blank=True, default="")
+    spcl_cnd_short = models.CharField(max_length=140, blank=True, default="")
+    spcl_easy_kws = models.JSONField(default=list, blank=True)
+    spcl_hard_kws = models.JSONField(default=list, blank=True)
+    spcl_penalty = models.FloatField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        # 목록 정렬(은행명, 상품명) + 은행 필터
+        indexes = [models.Index(fields=["kor_co_nm", "fin_prdt_nm"], name="saving_bank_name_idx")]
 
 
 class SavingOption(models.Model):
@@ -116,6 +148,10 @@ class SavingOption(models.Model):
     max_limit = models.IntegerField(null=True, blank=True)
     intr_rate_type_nm = models.CharField(max_length=50)
 
+    class Meta:
+        # 기간/최고금리 필터
+        indexes = [models.Index(fields=["save_trm", "intr_rate2"], name="saving_opt_term_rate_idx")]
+
 
 # 커스텀 User 모델 참조
 User = settings.AUTH_USER_MODEL
@@ -142,4 +178,83 @@ class Like(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        unique_together = ("user", "fin_prdt_cd", "product_type")
\ No newline at end of file
+        unique_together = ("user", "fin_prdt_cd", "product_type")
+
+
+class ProductLikeCount(models.Model):
+    """
+    상품 좋아요 수 모델
+
+    상품별 좋아요 수를 미리 저장해두는 카운터입니다.
+    좋아요 토글과 같은 트랜잭션에서 갱신하고, 어긋난 값은
+    reconcile_like_counts 커맨드로 Like 기준으로 다시 맞춥니다.
+    (상품 동기화로 상품 행이 지워졌다 다시 생겨도 유지되도록 Like와 같은 키 사용)
+
+    Attributes:
+        fin_prdt_cd: 금융 상품 코드
+        product_type: 상품 유형 ('deposit' 또는 'saving')
+        likes_count: 좋아요 수
+    """
+    fin_prdt_cd = models.CharField(max_length=50)
+    product_type = models.CharField(max_length=10, choices=[("deposit", "예금"), ("saving", "적금")])
+    likes_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("product_type", "fin_prdt_cd")
+
+    @classmethod
+    def add(cls, product_type, fin_prdt_cd, delta):
+        """좋아요 수 증감 (행이 없으면 생성)"""
+        cls.objects.get_or_create(product_type=product_type, fin_prdt_cd=fin_prdt_cd)
+        cls.objects.filter(product_type=product_type, fin_prdt_cd=fin_prdt_cd).update(
+            likes_count=F("likes_count") + delta
+        )
+
+    @classmethod
+    def count_for(cls, product_type, fin_prdt_cd):
+        """상품 1개의 좋아요 수"""
+        return (
+            cls.objects.filter(product_type=product_type, fin_prdt_cd=fin_prdt_cd)
+            .values_list("likes_count", flat=True)
+            .first()
+        ) or 0
+
+    @classmethod
+    def counts(cls, product_type):
+        """{상품 코드: 좋아요 수} (목록 응답용)"""
+        return dict(
+            cls.objects.filter(product_type=product_type, likes_count__gt=0)
+            .values_list("fin_prdt_cd", "likes_count")
+        )
+
+
+class ProductSyncStatus(models.Model):
+    """
+    상품 동기화 기록 모델
+
+    금감원 API 동기화가 끝날 때마다 version을 1씩 올립니다.
+    상품 데이터를 메모리에 들고 있는 곳(추천 옵션 인덱스 등)은
+    version이 바뀌었을 때만 다시 로드합니다.
+
+    Attributes:
+        product_type: 상품 유형 ('deposit' 또는 'saving')
+        version: 동기화 버전 (동기화마다 +1)
+        synced_at: 마지막 동기화 일시
+    """
+    product_type = models.CharField(max_length=10, choices=[("deposit", "예금"), ("saving", "적금")], unique=True)
+    version = models.PositiveIntegerField(default=0)
+    synced_at = models.DateTimeField(default=timezone.now)
+
+    @classmethod
+    def bump(cls, product_type):
+        """동기화 완료 기록 (version +1)"""
+        cls.objects.get_or_create(product_type=product_type)
+        cls.objects.filter(product_type=product_type).update(
+            version=F("version") + 1, synced_at=timezone.now()
+        )
+
+    @classmethod
+    def current_versions(cls):
+        """(예금 버전, 적금 버전)"""
+        versions = dict(cls.objects.values_list("product_type", "version"))
+        return (versions.get("deposit", 0), versions.get("saving", 0))
@@ -15,10 +15,27 @@
     - fin_prdt_nm: 상품명
     - intr_rate/intr_rate2: 기본금리/최고금리
     - save_trm: 저축 기간(개월)
+    - likes_count: 좋아요 수 (ProductLikeCount에 저장된 값)
 """
 
 from rest_framework import serializers
-from .models import DepositProduct, DepositOption, SavingProduct, SavingOption, Like
+from .models import DepositProduct, DepositOption, SavingProduct, SavingOption, Like, ProductLikeCount
+
+
+class LikesCountMixin(serializers.Serializer):
+    """
+    likes_count: 저장된 좋아요 수 (ProductLikeCount)
+    목록은 context["likes_counts"] ({상품 코드: 좋아요 수})로 한 번에 넘겨받음
+    """
+    likes_count = serializers.SerializerMethodField()
+
+    likes_product_type = None
+
+    def get_likes_count(self, obj):
+        counts = self.context.get("likes_counts")
+        if counts is not None:
+            return counts.get(obj.fin_prdt_cd, 0)
+        return ProductLikeCount.count_for(self.likes_product_type, obj.fin_prdt_cd)
 
 
 class DepositOptionSerializer(serializers.ModelSerializer):
@@ -36,9 +53,11 @@ class DepositOptionSerializer(serializers.ModelSerializer):
         )
 
 
-class DepositProductSerializer(serializers.ModelSerializer):
+class DepositProductSerializer(LikesCountMixin, serializers.ModelSerializer):
     options = DepositOptionSerializer(many=True, read_only=True)
 
+    likes_product_type = "deposit"
+
     class Meta:
         model = DepositProduct
         fields = (
@@ -52,6 +71,7 @@ class DepositProductSerializer(serializers.ModelSerializer):
             "spcl_cnd",
             "etc_note",
             "options",
+            "likes_count",
         )
 
 class SavingOptionSerializer(serializers.ModelSerializer):
@@ -68,9 +88,11 @@ class SavingOptionSerializer(serializers.ModelSerializer):
             "max_limit",
         )
 
-class SavingProductSerializer(serializers.ModelSerializer):
+class SavingProductSerializer(LikesCountMixin, serializers.ModelSerializer):
     options = SavingOptionSerializer(many=True, read_only=True)
 
+    likes_product_type = "saving"
+
     class Meta:
         model = SavingProduct
         fields = (
@@ -84,6 +106,7 @@ class SavingProductSerializer(serializers.ModelSerializer):
             "spcl_cnd",
             "etc_note",
             "options",
+            "likes_count",
         )
 
 class LikeSerializer(serializers.ModelSerializer):
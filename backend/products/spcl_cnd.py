@@ -0,0 +1,75 @@
+"""
+파일명: products/spcl_cnd.py
+설명: 우대조건(spcl_cnd) 텍스트 특징 추출
+
+기능:
+    - 우대조건 요약/키워드 추출 (compress_spcl_cnd)
+    - 우대조건 난이도 감점 계산 (spcl_penalty)
+    - 상품 모델 저장용 필드 값 생성 (spcl_cnd_fields)
+
+금감원 동기화 시 상품마다 1번 계산해서 상품 테이블에 저장하고,
+추천 점수화/프롬프트 생성에서는 저장된 값을 그대로 읽습니다.
+"""
+
+import re
+from typing import Any, Dict
+
+EASY_KWS = [
+    "자동이체",
+    "비대면",
+    "모바일",
+    "앱",
+    "인터넷",
+    "스마트폰",
+    "첫거래",
+    "신규",
+]
+HARD_KWS = [
+    "카드",
+    "신용카드",
+    "체크카드",
+    "카드실적",
+    "사용실적",
+    "결제",
+    "이용실적",
+    "실적",
+]
+
+SHORT_MAX_LEN = 140
+
+
+def compress_spcl_cnd(text: str, max_len: int = SHORT_MAX_LEN) -> Dict[str, Any]:
+    if not text:
+        return {"short": "", "keywords": [], "hard": [], "easy": []}
+
+    cleaned = re.sub(r"\s+", " ", str(text)).strip()
+    short = cleaned[:max_len]
+
+    easy = [k for k in EASY_KWS if k in cleaned]
+    hard = [k for k in HARD_KWS if k in cleaned]
+
+    # 키워드는 UI 표시용/디버깅용으로 합쳐서 저장
+    keywords = list(dict.fromkeys(easy + hard))[:10]
+    return {"short": short, "keywords": keywords, "hard": hard[:10], "easy": easy[:10]}
+
+
+def spcl_penalty(hard_cnt: int, easy_cnt: int) -> float:
+    """
+    카드실적류가 많을수록 감점
+    """
+    # 쉬운 조건은 약간 가산, 어려운 조건은 감점
+    penalty = 0.0
+    penalty += hard_cnt * 0.08  # 어려운 키워드 하나당 -0.08
+    penalty -= easy_cnt * 0.03  # 쉬운 키워드 하나당 +0.03 (감점 감소)
+    return penalty
+
+
+def spcl_cnd_fields(text: str) -> Dict[str, Any]:
+    """상품 모델에 저장할 우대조건 사전 계산 필드 값"""
+    info = compress_spcl_cnd(text or "")
+    return {
+        "spcl_cnd_short": info["short"],
+        "spcl_easy_kws": info["easy"],
+        "spcl_hard_kws": info["hard"],
+        "spcl_penalty": spcl_penalty(len(info["hard"]), len(info["easy"])),
+    }
@@ -0,0 +1,309 @@
+"""
+파일명: products/sync.py
+설명: 금감원 예금/적금 상품 일괄 동기화
+
+기능:
+    - 금감원 API 페이지 병렬 조회 (fetch_fss_pages)
+    - 기존 상품/옵션을 메모리 키 맵으로 비교해서 추가/변경/삭제 분류
+    - bulk_create / bulk_update / delete 를 하나의 트랜잭션에서 실행 (sync_products)
+
+안전장치:
+    - 페이지에 err_cd(000 외)가 있거나 baseList가 없거나, 전체 행 수가 total_count와
+      다르면 FssSyncError (DB 변경 없음)
+    - 사라진 상품/옵션 삭제는 1~max_page_no 전체 페이지를 정상 수신한 경우에만 실행
+    - 분석 결과가 참조하는 옵션(RecommendedOption)과 그 상품은 삭제하지 않고 유지
+
+매칭 키:
+    - 상품: fin_prdt_cd
+    - 옵션: (fin_prdt_cd, save_trm, intr_rate_type_nm, rsrv_type)
+
+반환 예시:
+    {"products": {"inserted": 3, "updated": 10, "deleted": 1, "kept": 0},
+     "options":  {"inserted": 8, "updated": 25, "deleted": 2, "kept": 1}}
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from django.db import transaction
+
+from .models import DepositProduct, DepositOption, SavingProduct, SavingOption, ProductSyncStatus
+from .spcl_cnd import spcl_cnd_fields
+
+
+FSS_URLS = {
+    "deposit": "http://finlife.fss.or.kr/finlifeapi/depositProductsSearch.json",
+    "saving": "http://finlife.fss.or.kr/finlifeapi/savingProductsSearch.json",
+}
+
+MODELS = {
+    "deposit": (DepositProduct, DepositOption),
+    "saving": (SavingProduct, SavingOption),
+}
+
+PRODUCT_FIELDS = [
+    "kor_co_nm",
+    "fin_prdt_nm",
+    "join_way",
+    "etc_note",
+    "join_deny",
+    "join_member",
+    "spcl_cnd",
+    "spcl_cnd_short",
+    "spcl_easy_kws",
+    "spcl_hard_kws",
+    "spcl_penalty",
+]
+
+OPTION_FIELDS = ["intr_rate", "intr_rate2", "max_limit"]
+
+BATCH_SIZE = 500
+
+
+class FssSyncError(Exception):
+    """금감원 응답이 불완전함 (에러 코드, 빈 페이지, 행 수 불일치)"""
+
+
+def _fetch_page(url: str, page: int) -> dict:
+    params = {"auth": settings.API_KEY, "topFinGrpNo": "020000", "pageNo": page}
+    timeout = getattr(settings, "FSS_SYNC_TIMEOUT", 10.0)
+    response = requests.get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+
+    result = response.json().get("result") or {}
+    err_cd = str(result.get("err_cd") or "000")
+    if err_cd != "000":
+        raise FssSyncError(f"{page}페이지 오류 {err_cd}: {result.get('err_msg', '')}")
+    if not result.get("baseList"):
+        raise FssSyncError(f"{page}페이지 baseList 없음")
+    return result
+
+
+def fetch_fss_pages(product_type: str):
+    """
+    금감원 API 전체 페이지 조회
+    1페이지의 max_page_no로 나머지 페이지를 스레드 풀에서 동시에 요청
+    반환: (baseList 전체, optionList 전체)
+    한 페이지라도 실패하거나 행 수가 total_count와 다르면 FssSyncError
+    """
+    url = FSS_URLS[product_type]
+    first = _fetch_page(url, 1)
+    results = [first]
+
+    max_page = int(first.get("max_page_no") or 1)
+    if max_page > 1:
+        workers = getattr(settings, "FSS_SYNC_WORKERS", 4)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fss-sync") as ex:
+            results += list(ex.map(lambda page: _fetch_page(url, page), range(2, max_page + 1)))
+
+    base_list, option_list = [], []
+    for result in results:
+        base_list += result.get("baseList") or []
+        option_list += result.get("optionList") or []
+
+    total_count = first.get("total_count")
+    if total_count is not None and int(total_count) != len(base_list):
+        raise FssSyncError(f"상품 수 불일치: total_count={total_count}, 수신={len(base_list)}")
+    return base_list, option_list
+
+
+def _referenced_options(product_type: str):
+    """분석 결과가 참조하는 옵션 id 서브쿼리 (삭제하면 결과 조회가 깨짐)"""
+    from recommendations.models import RecommendedOption
+
+    return RecommendedOption.objects.filter(kind=product_type).values("option_id")
+
+
+def _referenced_option_ids(product_type: str, option_ids: list) -> set:
+    """삭제 후보 옵션 중 분석 결과가 참조하는 옵션 id"""
+    if not option_ids:
+        return set()
+    return set(
+        _referenced_options(product_type).filter(option_id__in=option_ids).values_list("option_id", flat=True)
+    )
+
+
+def _normalize(model, data: dict) -> dict:
+    """API 값을 모델 필드 타입으로 변환 (문자열 "1" → 1 등, 불필요한 update 방지)"""
+    return {k: model._meta.get_field(k).to_python(v) for k, v in data.items()}
+
+
+def _product_row(product_data: dict) -> dict:
+    row = {
+        "kor_co_nm": product_data.get("kor_co_nm", ""),
+        "fin_prdt_nm": product_data.get("fin_prdt_nm", ""),
+        "join_way": product_data.get("join_way", ""),
+        "etc_note": product_data.get("etc_note", ""),
+        "join_deny": product_data.get("join_deny") or 0,
+        "join_member": product_data.get("join_member", ""),
+        "spcl_cnd": product_data.get("spcl_cnd", "") or "",
+    }
+    # 우대조건 요약/키워드/감점은 여기서 1번만 계산해서 저장
+    row.update(spcl_cnd_fields(row["spcl_cnd"]))
+    return row
+
+
+def _option_key(option_data: dict):
+    """옵션 매칭 키 (save_trm이 숫자가 아니면 None → 건너뜀)"""
+    # save_trm은 API에서 문자열로 올때가 많아서 int로 변환
+    try:
+        save_trm = int(option_data.get("save_trm"))
+    except (TypeError, ValueError):
+        return None
+    return (
+        option_data.get("fin_prdt_cd"),
+        save_trm,
+        option_data.get("intr_rate_type_nm", ""),
+        option_data.get("rsrv_type", ""),
+    )
+
+
+def _changed(obj, row: dict) -> bool:
+    changed = False
+    for k, v in row.items():
+        if getattr(obj, k) != v:
+            setattr(obj, k, v)
+            changed = True
+    return changed
+
+
+def sync_products(product_type: str, base_list=None, option_list=None, complete: bool = False) -> dict:
+    """
+    금감원 데이터와 DB를 비교해서 일괄 반영
+    - base_list/option_list를 넘기지 않으면 API에서 조회 (전체 페이지 검증 후 complete=True)
+    - 직접 넘긴 목록은 complete=True일 때만 사라진 상품/옵션 삭제 (기본은 추가/변경만)
+    - API 응답에 상품이 하나도 없으면 (키 오류/점검 등) 아무것도 하지 않음
+    """
+    product_model, option_model = MODELS[product_type]
+    if base_list is None or option_list is None:
+        base_list, option_list = fetch_fss_pages(product_type)
+        complete = True
+
+    counts = {
+        "products": {"inserted": 0, "updated": 0, "deleted": 0, "kept": 0},
+        "options": {"inserted": 0, "updated": 0, "deleted": 0, "kept": 0},
+    }
+
+    # 1) 들어온 데이터 정리 (같은 키가 여러 번 오면 마지막 값 사용)
+    incoming_products = {}
+    for product_data in base_list:
+        fin_prdt_cd = product_data.get("fin_prdt_cd")
+        if fin_prdt_cd:
+            incoming_products[fin_prdt_cd] = _normalize(product_model, _product_row(product_data))
+
+    if not incoming_products:
+        return counts
+
+    incoming_options = {}
+    for option_data in option_list:
+        key = _option_key(option_data)
+        if key is None or key[0] not in incoming_products:
+            continue
+        incoming_options[key] = _normalize(
+            option_model,
+            {
+                "intr_rate": option_data.get("intr_rate") or 0,
+                "intr_rate2": option_data.get("intr_rate2") or 0,
+                "max_limit": option_data.get("max_limit", None),
+            },
+        )
+
+    with transaction.atomic():
+        # 2) 상품: 기존 키 맵과 비교
+        existing = {p.fin_prdt_cd: p for p in product_model.objects.all()}
+
+        to_create, to_update = [], []
+        for fin_prdt_cd, row in incoming_products.items():
+            product = existing.get(fin_prdt_cd)
+            if product is None:
+                to_create.append(product_model(fin_prdt_cd=fin_prdt_cd, **row))
+            elif _changed(product, row):
+                to_update.append(product)
+
+        stale_codes = []
+        kept_codes = set()
+        if complete:
+            stale_codes = [code for code in existing if code not in incoming_products]
+            if stale_codes:
+                # 분석 결과가 참조하는 옵션이 남은 상품은 유지
+                kept_codes = set(
+                    option_model.objects.filter(
+                        product__fin_prdt_cd__in=stale_codes, id__in=_referenced_options(product_type)
+                    ).values_list("product__fin_prdt_cd", flat=True)
+                )
+                stale_codes = [code for code in stale_codes if code not in kept_codes]
+
+        product_model.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        product_model.objects.bulk_update(to_update, PRODUCT_FIELDS, batch_size=BATCH_SIZE)
+        cascaded_options = 0
+        if stale_codes:
+            # 사라진 상품의 옵션 먼저 삭제 후 상품 삭제
+            cascaded_options, _ = option_model.objects.filter(
+                product__fin_prdt_cd__in=stale_codes
+            ).delete()
+            product_model.objects.filter(fin_prdt_cd__in=stale_codes).delete()
+
+        counts["products"] = {
+            "inserted": len(to_create),
+            "updated": len(to_update),
+            "deleted": len(stale_codes),
+            "kept": len(kept_codes),
+        }
+
+        # 3) 옵션: 상품 id는 한 번에 다시 조회 (bulk_create로 새로 생긴 id 포함)
+        product_ids = dict(product_model.objects.values_list("fin_prdt_cd", "id"))
+        code_by_id = {pid: code for code, pid in product_ids.items()}
+
+        existing_options = {}
+        duplicate_ids = []
+        for opt in option_model.objects.order_by("id"):
+            key = (code_by_id.get(opt.product_id), opt.save_trm, opt.intr_rate_type_nm, opt.rsrv_type)
+            if key in existing_options:
+                # 예전 단건 저장 방식에서 생긴 중복 옵션 정리
+                duplicate_ids.append(opt.id)
+            else:
+                existing_options[key] = opt
+
+        opt_create, opt_update = [], []
+        for key, row in incoming_options.items():
+            opt = existing_options.get(key)
+            if opt is None:
+                fin_prdt_cd, save_trm, intr_rate_type_nm, rsrv_type = key
+                opt_create.append(
+                    option_model(
+                        product_id=product_ids[fin_prdt_cd],
+                        save_trm=save_trm,
+                        intr_rate_type_nm=intr_rate_type_nm,
+                        rsrv_type=rsrv_type,
+                        **row,
+                    )
+                )
+            elif _changed(opt, row):
+                opt_update.append(opt)
+
+        # 삭제 후보 (사라진 옵션 + 예전 중복 옵션) 중 분석 결과가 참조하는 옵션은 유지
+        candidate_ids = list(duplicate_ids)
+        if complete:
+            candidate_ids += [opt.id for key, opt in existing_options.items() if key not in incoming_options]
+        referenced_ids = _referenced_option_ids(product_type, candidate_ids)
+        stale_option_ids = [opt_id for opt_id in candidate_ids if opt_id not in referenced_ids]
+        kept_option_ids = [opt_id for opt_id in candidate_ids if opt_id in referenced_ids]
+
+        option_model.objects.bulk_create(opt_create, batch_size=BATCH_SIZE)
+        option_model.objects.bulk_update(opt_update, OPTION_FIELDS, batch_size=BATCH_SIZE)
+        if stale_option_ids:
+            option_model.objects.filter(id__in=stale_option_ids).delete()
+
+        counts["options"] = {
+            "inserted": len(opt_create),
+            "updated": len(opt_update),
+            "deleted": len(stale_option_ids) + cascaded_options,
+            "kept": len(kept_option_ids),
+        }
+
+        # 동기화 버전 갱신 (추천 옵션 인덱스 재로드 트리거)
+        ProductSyncStatus.bump(product_type)
+
+    print(f"[FSS SYNC] {product_type}: {counts}")
+    return counts
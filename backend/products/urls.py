@@ -7,6 +7,7 @@ URL 패턴:
 - GET /api/products/deposits/ : 예금 상품 목록 조회
 - POST /api/products/save-savings/ : 적금 상품 데이터 저장 (금감원 API → DB)
 - GET /api/products/savings/ : 적금 상품 목록 조회
+  (목록 공통 쿼리: bank, term, min_rate 필터 / page_size, cursor 커서 페이지네이션 / If-None-Match → 304)
 - GET /api/products/deposit/<fin_prdt_cd>/ : 예금 상품 상세 조회
 - GET /api/products/saving/<fin_prdt_cd>/ : 적금 상품 상세 조회
 - POST /api/products/likes/toggle/ : 좋아요 토글
@@ -5,234 +5,136 @@
 기능:
     - 금융감독원 API에서 예금/적금 상품 데이터 수집
     - 상품 목록 조회 및 상세 조회
-    - 상품 좋아요 토글 기능
+      (목록은 products.catalog 캐시 사용: 은행/기간/최저금리 필터, 커서 페이지네이션, ETag/304)
+    - 상품 좋아요 토글 기능 (좋아요 수는 ProductLikeCount에 저장된 값 사용)
     - 내 좋아요 목록 조회
 
 API 엔드포인트:
     - GET /products/save-deposit/     : 예금 상품 데이터 수집 (금감원 API)
-    - GET /products/deposits/         : 예금 상품 목록
+    - GET /products/deposits/         : 예금 상품 목록 (?bank=&term=&min_rate=&page_size=&cursor=)
     - GET /products/deposits/<fin_prdt_cd>/ : 예금 상품 상세
     - GET /products/save-saving/      : 적금 상품 데이터 수집 (금감원 API)
-    - GET /products/savings/          : 적금 상품 목록
+    - GET /products/savings/          : 적금 상품 목록 (?bank=&term=&min_rate=&page_size=&cursor=)
     - GET /products/savings/<fin_prdt_cd>/  : 적금 상품 상세
     - POST /products/toggle-like/     : 좋아요 토글
     - GET /products/my-likes/         : 내 좋아요 목록
 """
 
-import requests
-from django.conf import settings
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
+from rest_framework.utils.urls import replace_query_param
+from django.conf import settings
 from django.shortcuts import get_object_or_404
 
 # permission Decorators
 from rest_framework.decorators import permission_classes
 from rest_framework.permissions import IsAuthenticated
 
-from .models import DepositProduct, DepositOption, SavingProduct, SavingOption, Like
+from .catalog import InvalidCursor, get_catalog, make_etag
+from .likes import toggle_like as toggle_product_like
+from .models import DepositProduct, SavingProduct, Like, ProductLikeCount
 from .serializers import DepositProductSerializer, SavingProductSerializer, LikeSerializer
+from .sync import FssSyncError, sync_products
+
+def _parse_catalog_params(query) -> dict:
+    """
+    목록 조회 조건 (잘못된 값이면 ValueError)
+    - bank: 금융회사명 (kor_co_nm 일치)
+    - term: 저축 기간(개월) 옵션이 있는 상품
+    - min_rate: 최고 우대금리(intr_rate2)가 이 값 이상인 옵션이 있는 상품 (term과 함께면 그 기간 옵션 기준)
+    - page_size / cursor: 둘 중 하나라도 있으면 커서 페이지네이션
+    """
+    params = {
+        "bank": query.get("bank", "").strip() or None,
+        "term": int(query["term"]) if query.get("term") else None,
+        "min_rate": float(query["min_rate"]) if query.get("min_rate") else None,
+        "paginated": "page_size" in query or "cursor" in query,
+    }
+    if params["paginated"]:
+        page_size = int(query.get("page_size") or settings.PRODUCT_PAGE_SIZE)
+        if page_size < 1:
+            raise ValueError(page_size)
+        params["page_size"] = min(page_size, settings.PRODUCT_MAX_PAGE_SIZE)
+        params["cursor"] = query.get("cursor") or None
+    return params
+
+
+def _etag_matches(request, etag: str) -> bool:
+    header = request.headers.get("If-None-Match", "")
+    tags = {tag.strip() for tag in header.split(",") if tag.strip()}
+    return "*" in tags or etag in tags or etag.removeprefix("W/") in tags
+
+
+def catalog_response(request, product_type: str):
+    """
+    예금/적금 목록 공통 응답
+    - 조건 없이 호출하면 기존과 같이 전체 목록(배열)
+    - page_size/cursor가 있으면 {"count", "next", "results"}
+    """
+    try:
+        params = _parse_catalog_params(request.query_params)
+    except ValueError:
+        return Response({"error": "잘못된 조회 조건입니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+    catalog = get_catalog(product_type)
+    likes_counts = ProductLikeCount.counts(product_type)
+    etag = make_etag(catalog, likes_counts, params)
+    if _etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    positions = catalog.filter(bank=params["bank"], term=params["term"], min_rate=params["min_rate"])
+    if not params["paginated"]:
+        return Response(catalog.records(positions, likes_counts), headers={"ETag": etag})
+
+    try:
+        page, next_cursor = catalog.page(positions, params["cursor"], params["page_size"])
+    except InvalidCursor:
+        return Response({"error": "잘못된 cursor입니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+    next_url = None
+    if next_cursor:
+        next_url = replace_query_param(request.build_absolute_uri(), "cursor", next_cursor)
+    data = {
+        "count": len(positions),
+        "next": next_url,
+        "results": catalog.records(page, likes_counts),
+    }
+    return Response(data, headers={"ETag": etag})
+
 
 @api_view(['GET'])
 def save_deposit_products(request):
-    API_KEY = settings.API_KEY
-    URL = f"http://finlife.fss.or.kr/finlifeapi/depositProductsSearch.json"
-
-    page = 1
-    total_products = 0
-    total_options = 0
-
-    while True:
-        params = {"auth": API_KEY, "topFinGrpNo": '020000', "pageNo": page}
-        response = requests.get(URL, params=params).json()
-
-        baseList = response.get("result", {}).get("baseList", [])
-        optionList = response.get("result", {}).get("optionList", [])
-
-        if not baseList:
-            break
-
-        # 1) DepositProducts 저장 (중복이면 update)
-        for product_data in baseList:
-            fin_prdt_cd = product_data.get("fin_prdt_cd")
-            if not fin_prdt_cd:
-                continue
-            
-            product = DepositProduct.objects.filter(fin_prdt_cd=fin_prdt_cd).first()
-
-            save_data = {
-                "fin_prdt_cd": fin_prdt_cd,
-                "kor_co_nm": product_data.get("kor_co_nm", ""),
-                "fin_prdt_nm": product_data.get("fin_prdt_nm", ""),
-                "join_way": product_data.get("join_way", ""),
-                "etc_note": product_data.get("etc_note", ""),
-                "join_deny": product_data.get("join_deny") or 0,
-                "join_member": product_data.get("join_member", ""),
-                "spcl_cnd": product_data.get("spcl_cnd", ""),
-            }
-
-            if product:
-                # 업데이트
-                for k, v in save_data.items():
-                    setattr(product, k, v)
-                product.save()
-            
-            else:
-                product = DepositProduct(**save_data)
-                product.save()
-                total_products += 1
-        
-        # 2) DepositOption 저장
-        for option_data in optionList:
-            fin_prdt_cd = option_data.get("fin_prdt_cd")
-            if not fin_prdt_cd:
-                continue
-
-            product = DepositProduct.objects.filter(fin_prdt_cd=fin_prdt_cd).first()
-            if not product:
-                continue
-                
-            # save_trm은 API에서 문자열로 올때가 많아서 int로 변환을 GPT가 추천하였습니다.
-            try:
-                save_trm = int(option_data.get("save_trm"))
-            except (TypeError, ValueError):
-                save_trm = None
-            
-            intr_rate_type_nm = option_data.get("intr_rate_type_nm", "")
-
-            option = DepositOption.objects.filter(product=product, save_trm=save_trm, intr_rate_type_nm=intr_rate_type_nm, rsrv_type=option_data.get("rsrv_type", ""),).first()
-
-            save_data = {
-                "product": product,
-                "intr_rate_type_nm": intr_rate_type_nm,
-                "intr_rate": option_data.get("intr_rate") or 0,
-                "intr_rate2": option_data.get("intr_rate2") or 0,
-                "save_trm": save_trm,
-                "rsrv_type": option_data.get("rsrv_type", ""),
-                "max_limit": option_data.get("max_limit", None),
-            }
-
-            if option:
-                for k, v in save_data.items():
-                    setattr(option, k, v)
-                option.save()
-            else:
-                option = DepositOption(**save_data)
-                option.save()
-                total_options += 1
-
-        page += 1
-        
-    return Response({"message": "saved"}, status=status.HTTP_200_OK)
+    # 금감원 API 전체 페이지 조회 → 기존 데이터와 비교해서 일괄 반영
+    try:
+        counts = sync_products("deposit")
+    except FssSyncError as e:
+        print(f"[FSS SYNC] deposit 중단: {e}")
+        return Response({"error": f"금감원 응답이 불완전해서 동기화하지 않았습니다: {e}"}, status=status.HTTP_502_BAD_GATEWAY)
+    return Response({"message": "saved", **counts}, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
 def deposit_products(request):
-    # 프론트에서 필터/검색/정렬을 할 예정
-    # (전체 상품 + 해당 옵션들)을 한번에 내려주는 API
-    products = DepositProduct.objects.all().order_by("kor_co_nm", "fin_prdt_nm")
-
-    serializer = DepositProductSerializer(products, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    # 직렬화된 카탈로그(동기화 버전별 캐시)에서 필터/페이지 → ETag 일치 시 304
+    return catalog_response(request, "deposit")
 
 
 @api_view(['GET'])
 def save_saving_products(request):
-    API_KEY = settings.API_KEY
-    URL = f"http://finlife.fss.or.kr/finlifeapi/savingProductsSearch.json"
-
-    page = 1
-
-    while True:
-        params = {"auth": API_KEY, "topFinGrpNo": '020000', "pageNo": page}
-        response = requests.get(URL, params=params).json()
-
-        baseList = response.get("result", {}).get("baseList", [])
-        optionList = response.get("result", {}).get("optionList", [])
-
-        if not baseList:
-            break
-
-        # 1) SavingProducts 저장 (중복이면 update)
-        for product_data in baseList:
-            fin_prdt_cd = product_data.get("fin_prdt_cd")
-            if not fin_prdt_cd:
-                continue
-            
-            product = SavingProduct.objects.filter(fin_prdt_cd=fin_prdt_cd).first()
-
-            save_data = {
-                "fin_prdt_cd": fin_prdt_cd,
-                "kor_co_nm": product_data.get("kor_co_nm", ""),
-                "fin_prdt_nm": product_data.get("fin_prdt_nm", ""),
-                "join_way": product_data.get("join_way", ""),
-                "etc_note": product_data.get("etc_note", ""),
-                "join_deny": product_data.get("join_deny") or 0,
-                "join_member": product_data.get("join_member", ""),
-                "spcl_cnd": product_data.get("spcl_cnd", ""),
-            }
-
-            if product:
-                # 업데이트
-                for k, v in save_data.items():
-                    setattr(product, k, v)
-                product.save()
-            
-            else:
-                product = SavingProduct(**save_data)
-                product.save()
-        
-        # 2) SavingOption 저장
-        for option_data in optionList:
-            fin_prdt_cd = option_data.get("fin_prdt_cd")
-            if not fin_prdt_cd:
-                continue
-
-            product = SavingProduct.objects.filter(fin_prdt_cd=fin_prdt_cd).first()
-            if not product:
-                continue
-                
-            # save_trm은 API에서 문자열로 올때가 많아서 int로 변환을 GPT가 추천하였습니다.
-            try:
-                save_trm = int(option_data.get("save_trm"))
-            except (TypeError, ValueError):
-                save_trm = None
-            
-            intr_rate_type_nm = option_data.get("intr_rate_type_nm", "")
-
-            option = SavingOption.objects.filter(product=product, save_trm=save_trm, intr_rate_type_nm=intr_rate_type_nm, rsrv_type=option_data.get("rsrv_type", ""),).first()
-
-            save_data = {
-                "product": product,
-                "intr_rate_type_nm": intr_rate_type_nm,
-                "intr_rate": option_data.get("intr_rate") or 0,
-                "intr_rate2": option_data.get("intr_rate2") or 0,
-                "save_trm": save_trm,
-                "rsrv_type": option_data.get("rsrv_type", ""),
-                "max_limit": option_data.get("max_limit", None),
-            }
-
-            if option:
-                for k, v in save_data.items():
-                    setattr(option, k, v)
-                option.save()
-            else:
-                option = SavingOption(**save_data)
-                option.save()
-
-        page += 1
-        
-    return Response({"message": "saved"}, status=status.HTTP_200_OK)
+    # 금감원 API 전체 페이지 조회 → 기존 데이터와 비교해서 일괄 반영
+    try:
+        counts = sync_products("saving")
+    except FssSyncError as e:
+        print(f"[FSS SYNC] saving 중단: {e}")
+        return Response({"error": f"금감원 응답이 불완전해서 동기화하지 않았습니다: {e}"}, status=status.HTTP_502_BAD_GATEWAY)
+    return Response({"message": "saved", **counts}, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
 def saving_products(request):
-    # 프론트에서 필터/검색/정렬을 할 예정
-    # (전체 상품 + 해당 옵션들)을 한번에 내려주는 API
-    products = SavingProduct.objects.all().order_by("kor_co_nm", "fin_prdt_nm")
-
-    serializer = SavingProductSerializer(products, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    # 직렬화된 카탈로그(동기화 버전별 캐시)에서 필터/페이지 → ETag 일치 시 304
+    return catalog_response(request, "saving")
 
 
 @api_view(['GET'])
@@ -248,14 +150,7 @@ def deposit_product_detail(request, fin_prdt_cd):
             product_type="deposit",
         ).exists()
     
-    # 좋아요 수(로그인 상관없이 계산 가능)
-    likes_count = Like.objects.filter(
-        fin_prdt_cd=fin_prdt_cd,
-        product_type="deposit",
-    ).count()
-
     data["liked"] = liked
-    data["likes_count"] = likes_count
 
     return Response(data, status=status.HTTP_200_OK)
 
@@ -272,13 +167,7 @@ def saving_product_detail(request, fin_prdt_cd):
             product_type="saving",
         ).exists()
 
-    likes_count = Like.objects.filter(
-        fin_prdt_cd=fin_prdt_cd,
-        product_type="saving",
-    ).count()
-
     data["liked"] = liked
-    data["likes_count"] = likes_count
 
     return Response(data, status=status.HTTP_200_OK)
 
@@ -293,19 +182,7 @@ def toggle_like(request):
     if not fin_prdt_cd or product_type not in ["deposit", "saving"]:
         return Response({"detail": "fin_prdt_cd/product_type이 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-    like, created = Like.objects.get_or_create(
-        user=request.user,
-        fin_prdt_cd=fin_prdt_cd,
-        product_type=product_type,
-    )
-
-    if not created:
-        like.delete()
-        liked = False
-    else:
-        liked = True
-
-    likes_count = Like.objects.filter(fin_prdt_cd=fin_prdt_cd, product_type=product_type).count()
+    liked, likes_count = toggle_product_like(user, product_type, fin_prdt_cd)
 
     return Response({"liked": liked, "likes_count": likes_count}, status=status.HTTP_200_OK)
 
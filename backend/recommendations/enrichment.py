@@ -0,0 +1,387 @@
+"""
+파일명: recommendations/enrichment.py
+설명: 분석 결과 외부 연동 데이터 조회 (환율/뉴스/유튜브)
+
+기능:
+    - 저장된 최신 환율 조회 + 목표금액 외화 환산 (fetch_exchange_rate_info, exchange.rates)
+    - 네이버 뉴스 검색 (fetch_related_news)
+    - 유튜브 검색 + 추천 여행지 추출 (fetch_related_youtube)
+    - 위 조회들을 병렬 실행 (gather_enrichments)
+
+병렬 실행:
+    - 프로세스 공용 ThreadPoolExecutor (settings.ANALYSIS_ENRICH_WORKERS)
+    - 전체 마감 시간 1개 (settings.ANALYSIS_ENRICH_DEADLINE, 초)
+    - 마감 시간 내에 끝나지 않았거나 실패한 소스는 기본값으로 채우고 partial 표시
+
+실패 처리:
+    - 외부 API 오류/비정상 응답은 예외(EnrichmentError 등)로 올려보냄 → missing 처리
+      (빈 결과로 저장해서 TTL 동안 그대로 서빙되지 않도록)
+    - 검색어/API 키가 없는 경우만 정상적인 빈 결과
+"""
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from html import unescape
+
+import requests
+from django.conf import settings
+from django.utils.html import strip_tags
+
+from exchange.rates import get_rate_book, unit_rate
+
+
+# 유튜브 제목에서 추천 여행지 추출 시 제외할 단어 목록 (유튜버 이름, 일반 단어 등)
+EXCLUDE_PLACE_WORDS = {
+    # 일반적인 제외 단어
+    "해외",
+    "국내",
+    "유럽",
+    "아시아",
+    "여행지",
+    "추천",
+    "필수",
+    "해외여행",
+    "국내여행",
+    "해외여행지",
+    "국내여행지",
+    "브이로그",
+    "여행기",
+    "여행자",
+    "유튜브",
+    "채널",
+    "베스트",
+    "인기",
+    "핫플",
+    "명소",
+    "코스",
+    "일정",
+    # 유튜버/인플루언서 관련
+    "곽튜브",
+    "곽튜브가",
+    "서동주",
+    "서동주가",
+    "빠니보틀",
+    "원지",
+    "원지가",
+    "승우아빠",
+    "승우",
+    "침착맨",
+    "풍자",
+    "풍자가",
+    "침튜브",
+    "피식대학",
+    "숏박스",
+    # 동사/형용사 관련
+    "갔다",
+    "다녀",
+    "가봤",
+    "가면",
+    "가는",
+    "갈때",
+    "먹방",
+    "먹을",
+    "맛집",
+    "호텔",
+    "숙소",
+}
+
+
+class EnrichmentError(Exception):
+    """외부 조회 실패 (gather_enrichments에서 missing 처리)"""
+
+
+def clean_html(s):
+    s = unescape(s or "")
+    return strip_tags(s)
+
+
+# -----------------------------
+# 1) 환율 정보 (여행 목적일 때)
+# -----------------------------
+
+
+def fetch_exchange_rate_info(
+    country_code: str, target_amount: int, combination_strategy: dict | None
+) -> dict | None:
+    """
+    저장된 최신 환율(exchange.rates, 외부 API 호출 없음)로 목표금액/최적 전략 총액을 외화로 환산
+    저장된 환율이 없으면 EnrichmentError (아직 수집 전 → 다음 조회 때 다시 시도)
+    """
+    rate = get_rate_book().find(country_code)
+    if rate is None:
+        raise EnrichmentError(f"환율 정보 없음: {country_code}")
+
+    print(f"환율 찾음: {rate.cur_unit} | {rate.cur_nm} | {rate.deal_bas_r}")
+    return build_exchange_rate_info(
+        cur_unit=rate.cur_unit,
+        cur_nm=rate.cur_nm,
+        deal_bas_r=unit_rate(rate),  # JPY(100) → 1엔 기준
+        target_krw=int(target_amount),
+        search_date=rate.date.strftime("%Y%m%d"),
+        combination_strategy=combination_strategy,
+    )
+
+
+def build_exchange_rate_info(
+    cur_unit: str,
+    cur_nm: str,
+    deal_bas_r: float,
+    target_krw: int,
+    search_date: str,
+    combination_strategy: dict | None,
+) -> dict:
+    """환율(1단위 기준) + 최적 전략 결과로 외화 환산 정보 구성"""
+    foreign_amount = round(target_krw / deal_bas_r, 2)
+
+    # best_strategy에서 계산된 결과 사용
+    best_strategy = (combination_strategy or {}).get("best_strategy") or {}
+
+    # best_strategy에서 이미 계산된 값 가져오기
+    total_with_interest = int(best_strategy.get("total_amount", 0))
+    total_interest = int(best_strategy.get("total_interest", 0))
+    strategy_name = best_strategy.get("strategy_name", "")
+    strategy_type = best_strategy.get("strategy_type", "")
+
+    # 예금/적금 세부 정보
+    deposit_info = best_strategy.get("deposit") or {}
+    saving_info = best_strategy.get("saving") or {}
+
+    # 예금 정보 (best_strategy에서)
+    deposit_principal = int(deposit_info.get("principal", 0))
+    deposit_interest = int(deposit_info.get("interest", 0))
+    deposit_rate = deposit_info.get("rate", 0)
+    deposit_term = deposit_info.get("term", 0)
+
+    # 적금 정보 (best_strategy에서)
+    saving_principal = int(saving_info.get("principal", 0))
+    saving_interest = int(saving_info.get("interest", 0))
+    saving_rate = saving_info.get("rate", 0)
+    saving_term = saving_info.get("term", 0)
+
+    # 총 원금
+    total_principal = deposit_principal + saving_principal
+
+    # 이자 포함 금액을 현지 통화로 환산
+    foreign_with_interest = (
+        round(total_with_interest / deal_bas_r, 2) if total_with_interest > 0 else 0
+    )
+
+    return {
+        "currency_code": cur_unit,
+        "currency_name": cur_nm,
+        "exchange_rate": deal_bas_r,
+        "target_krw": target_krw,
+        "target_foreign": foreign_amount,
+        "updated_at": search_date,
+        # best_strategy 기반 정보
+        "strategy_name": strategy_name,
+        "strategy_type": strategy_type,
+        # 예금 정보
+        "deposit_principal": deposit_principal,
+        "deposit_interest": deposit_interest,
+        "deposit_rate": deposit_rate,
+        "deposit_term": deposit_term,
+        # 적금 정보
+        "saving_principal": saving_principal,
+        "saving_interest": saving_interest,
+        "saving_rate": saving_rate,
+        "saving_term": saving_term,
+        # 총액
+        "total_principal": total_principal,
+        "total_interest": total_interest,
+        "total_with_interest_krw": total_with_interest,
+        "total_with_interest_foreign": foreign_with_interest,
+    }
+
+
+# -----------------------------
+# 2) 관련 뉴스 (목적별 키워드 기반)
+# -----------------------------
+
+
+def fetch_related_news(search_keywords: list) -> list:
+    """네이버 뉴스 API로 첫 번째 키워드 검색 (최신순 5개)"""
+    print(f"뉴스 검색 키워드: {search_keywords}")
+
+    if not search_keywords:
+        print("검색 키워드가 없습니다")
+        return []
+
+    naver_client_id = getattr(settings, "NAVER_CLIENT_ID", None)
+    naver_client_secret = getattr(settings, "NAVER_CLIENT_SECRET", None)
+
+    if not (naver_client_id and naver_client_secret):
+        print("네이버 API 키가 설정되지 않았습니다")
+        return []
+
+    # 첫 번째 키워드로 검색
+    search_query = search_keywords[0]
+    print(f"네이버 뉴스 API 호출: {search_query}")
+
+    url = "https://openapi.naver.com/v1/search/news.json"
+    headers = {
+        "X-Naver-Client-Id": naver_client_id,
+        "X-Naver-Client-Secret": naver_client_secret,
+    }
+    params = {"query": search_query, "display": 5, "sort": "date"}
+
+    res = requests.get(url, headers=headers, params=params, timeout=5)
+    if res.status_code != 200:
+        raise EnrichmentError(f"네이버 뉴스 API 실패: {res.status_code}")
+
+    items = res.json().get("items", [])
+    print(f"네이버 뉴스 {len(items)}개 검색됨")
+
+    return [
+        {
+            "title": clean_html(item.get("title", "")),
+            "link": item.get("link", ""),
+            "description": clean_html(item.get("description", "")),
+            "pubdate": item.get("pubDate", ""),
+        }
+        for item in items
+    ]
+
+
+# -----------------------------
+# 3) 유튜브 검색 (여행 목적일 때 추천 여행지 탐색)
+# -----------------------------
+
+
+def fetch_related_youtube(
+    youtube_query: str | None, purpose: str, purpose_data: dict
+) -> tuple[list, list]:
+    """
+    유튜브 검색 결과(표시용 5개)와 제목에서 추출한 추천 여행지 반환
+    반환: (related_youtube, recommended_destinations)
+    """
+    if not youtube_query:
+        return [], []
+
+    youtube_api_key = getattr(settings, "YOUTUBE_API_KEY", None)
+    if not youtube_api_key:
+        print("유튜브 API 키가 설정되지 않았습니다 (YOUTUBE_API_KEY)")
+        return [], []
+
+    print(f"유튜브 API 호출: {youtube_query}")
+
+    url = "https://www.googleapis.com/youtube/v3/search"
+    params = {
+        "part": "snippet",
+        "q": youtube_query,
+        "type": "video",
+        "maxResults": 10,  # 추천 여행지 추출을 위해 더 많이 검색
+        "key": youtube_api_key,
+        "relevanceLanguage": "ko",
+    }
+    res = requests.get(url, params=params, timeout=5)
+    if res.status_code != 200:
+        raise EnrichmentError(f"유튜브 API 실패: {res.status_code}")
+
+    items = res.json().get("items", [])
+    print(f"유튜브 {len(items)}개 검색됨")
+
+    related_youtube = [
+        {
+            "title": item["snippet"]["title"],
+            "videoId": item["id"]["videoId"],
+            "thumbnail": item["snippet"]["thumbnails"]["medium"]["url"],
+            "channelTitle": item["snippet"]["channelTitle"],
+        }
+        for item in items[:5]  # 표시용은 5개만
+    ]
+
+    recommended_destinations = []
+    # 여행 목적일 때: 유튜브 제목에서 추천 여행지 추출
+    if purpose == "travel":
+        recommended_destinations = extract_destinations(
+            [item["snippet"]["title"] for item in items],
+            purpose_data.get("popular_cities", []),
+        )
+        print(f"추출된 추천 여행지: {recommended_destinations}")
+
+    return related_youtube, recommended_destinations
+
+
+def extract_destinations(titles: list, popular_cities: list) -> list:
+    """영상 제목에서 장소명 추출 (인기 도시 우선, 최대 5개)"""
+    extracted_places = set()
+    for title in titles:
+        # 인기 도시가 제목에 포함되어 있으면 추가
+        for city in popular_cities:
+            if city in title:
+                extracted_places.add(city)
+
+        # 일반적인 여행지 패턴 매칭 (예: "XX 여행", "XX 추천")
+        place_patterns = re.findall(r"([가-힣]{2,6})\s*(여행|추천|필수|핫플|명소)", title)
+        for place, _ in place_patterns:
+            # 제외 단어가 아니고, 실제 장소처럼 보이는 것만 추가
+            if place not in EXCLUDE_PLACE_WORDS and not any(
+                ex in place for ex in EXCLUDE_PLACE_WORDS
+            ):
+                extracted_places.add(place)
+
+        # 특정 패턴으로 도시명 추출 (예: "도쿄 3박4일", "파리 여행")
+        city_patterns = re.findall(
+            r"([가-힣A-Za-z]{2,10})\s*(\d+박\d+일|\d+일|\d+Days?)", title
+        )
+        for city, _ in city_patterns:
+            if city not in EXCLUDE_PLACE_WORDS and len(city) <= 6:
+                extracted_places.add(city)
+
+    # 인기 도시 우선, 나머지는 뒤에
+    priority_places = [p for p in popular_cities if p in extracted_places]
+    other_places = [p for p in extracted_places if p not in priority_places]
+    return (priority_places + other_places)[:5]
+
+
+# -----------------------------
+# 4) 병렬 실행 (전체 마감 시간 1개)
+# -----------------------------
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_enrichment_executor() -> ThreadPoolExecutor:
+    """외부 조회 전용 공용 스레드 풀 (요청 수와 무관하게 스레드 수 제한)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "ANALYSIS_ENRICH_WORKERS", 8),
+                    thread_name_prefix="analysis-enrich",
+                )
+    return _executor
+
+
+def gather_enrichments(tasks: dict, defaults: dict, deadline: float | None = None):
+    """
+    tasks: {이름: (함수, args)} 를 병렬 실행
+    defaults: 마감 시간을 넘기거나 예외가 난 소스에 대신 넣을 값
+    반환: (results, missing) - missing은 결과를 못 받은 소스 이름 목록
+    """
+    if deadline is None:
+        deadline = getattr(settings, "ANALYSIS_ENRICH_DEADLINE", 8.0)
+
+    executor = get_enrichment_executor()
+    futures = {name: executor.submit(fn, *args) for name, (fn, args) in tasks.items()}
+    wait(futures.values(), timeout=deadline)
+
+    results = {}
+    missing = []
+    for name, future in futures.items():
+        if future.done() and future.exception() is None:
+            results[name] = future.result()
+            continue
+        if not future.done():
+            future.cancel()
+            print(f"⚠️ 외부 조회 마감 시간 초과: {name}")
+        else:
+            print(f"❌ 외부 조회 실패: {name}: {future.exception()}")
+        results[name] = defaults.get(name)
+        missing.append(name)
+
+    return results, missing
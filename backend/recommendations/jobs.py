@@ -0,0 +1,277 @@
+"""
+파일명: recommendations/jobs.py
+설명: AI 분석 파이프라인 및 백그라운드 작업 워커
+
+기능:
+    - 후보 점수화 + GPT 호출 + 결과 저장 파이프라인 (run_analysis_pipeline)
+    - 분석 작업 큐잉 (enqueue_analysis)
+    - 스레드 기반 워커 풀 (AnalysisWorkerPool)
+
+워커 백엔드 (settings.ANALYSIS_JOB_BACKEND):
+    - "thread": ThreadPoolExecutor에서 백그라운드 처리 (기본값)
+    - "inline": 프로세스 내부 큐에 쌓아두고 drain() 호출 시 처리 (테스트용)
+
+작업 상태:
+    - queued → running → done / failed
+    - queued → running 전이는 조건부 UPDATE 1번 (워커 여러 개가 같은 작업을 잡지 않음)
+    - 재시작 복구 (recover_jobs): 남은 queued는 다시 제출, 오래된 running은 failed 처리
+      (워커 풀 생성 시 1번 + python manage.py recover_analysis_jobs)
+"""
+
+from datetime import timedelta
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import AnalysisJob, RecommendationResult, RecommendationCache
+from .services import (
+    pick_candidates_scored,
+    option_to_compact_dict,
+    make_cache_key,
+    validate_reco_payload,
+)
+from .llm import SYSTEM_PROMPT, build_user_prompt, call_gpt_json
+
+
+NO_CANDIDATES_MESSAGE = (
+    "추천 가능한 후보 상품(옵션)을 찾지 못했습니다. (기간/데이터 범위 확인 필요)"
+)
+FALLBACK_WARNING = "GPT 추천 생성에 실패하여 내부 점수 기반 추천으로 대체되었습니다."
+INTERRUPTED_MESSAGE = "서버 재시작 등으로 분석 작업이 중단되었습니다. 다시 요청해주세요."
+
+
+class NoCandidatesError(Exception):
+    """점수화 가능한 후보 상품이 하나도 없을 때"""
+
+
+def run_analysis_pipeline(analysis) -> dict:
+    """
+    분석 요청 1건에 대해 후보 점수화 → GPT 추천 → RecommendationResult 저장
+    반환: {"warning": str} (GPT 실패로 폴백된 경우에만 warning 포함)
+    후보가 없으면 NoCandidatesError
+    """
+    user_input = {
+        "purpose": analysis.purpose,
+        "period_months": int(analysis.period_months),
+        "target_amount": int(analysis.target_amount),
+        "monthly_amount": int(analysis.monthly_amount),
+        "current_savings": int(getattr(analysis, "current_savings", 0) or 0),
+    }
+
+    # 배치 점수화(NumPy)라 기간에 맞는 옵션 전체를 점수화 (개수 제한 없음)
+    scored = pick_candidates_scored(user_input, dep_limit=None, sav_limit=None, top_n=60)
+
+    if not scored:
+        raise NoCandidatesError(NO_CANDIDATES_MESSAGE)
+
+    candidates = []
+    for score, opt, kind, dbg in scored:
+        c = option_to_compact_dict(opt, kind)
+        c["pre_score"] = round(float(score), 4)
+        candidates.append(c)
+
+    cache_key = make_cache_key(user_input, candidates)
+    cache = RecommendationCache.objects.filter(cache_key=cache_key).first()
+
+    if cache:
+        result = RecommendationResult.objects.create(
+            analysis=analysis,
+            summary=cache.payload.get("summary", ""),
+            items=cache.payload.get("items", []),
+            gpt_raw="",
+            ai_verdict=cache.payload.get("ai_verdict", ""),  # 캐시에서 ai_verdict 복원
+        )
+        result.record_options()
+        return {}
+
+    try:
+        prompt = build_user_prompt(user_input, candidates, top_k=5)
+        raw = call_gpt_json(SYSTEM_PROMPT, prompt)
+
+        cleaned = validate_reco_payload(raw, candidates, top_k=5)
+
+        RecommendationCache.objects.create(
+            cache_key=cache_key,
+            payload={
+                "summary": cleaned.get("summary", ""),
+                "items": cleaned.get("items", []),
+                # (선택) 스키마 확장했다면 저장
+                "strategy": cleaned.get("strategy", ""),
+                "goal_math": cleaned.get("goal_math", {}),
+                "ai_verdict": raw.get("ai_verdict", ""),  # ai_verdict 캐시
+            },
+        )
+
+        result = RecommendationResult.objects.create(
+            analysis=analysis,
+            summary=cleaned.get("summary", ""),
+            items=cleaned.get("items", []),
+            gpt_raw=str(raw)[:5000],
+            ai_verdict=raw.get("ai_verdict", ""),  # GPT ai_verdict 저장
+        )
+        result.record_options()
+        return {}
+
+    except Exception as e:
+        # GPT API 호출 실패 시 폴백(내부 점수 기반 추천) 처리
+        fallback_items = []
+        for score, opt, kind, dbg in scored[:5]:
+            fallback_items.append(
+                {
+                    "kind": kind,
+                    "option_id": int(opt.id),
+                    "product_id": int(opt.product.id),
+                    "fit_score": 0.50,
+                    "reason": "LLM 응답 오류로 인해 내부 점수 기반 추천으로 대체되었습니다.",
+                }
+            )
+
+        result = RecommendationResult.objects.create(
+            analysis=analysis,
+            summary="내부 점수 기반으로 목표/기간/조건을 반영해 추천했습니다.",
+            items=fallback_items,
+            gpt_raw=f"ERROR: {str(e)[:2000]}",
+        )
+        result.record_options()
+        return {"warning": FALLBACK_WARNING}
+
+
+# -----------------------------
+# 백그라운드 워커 풀
+# -----------------------------
+
+
+def execute_job(job_id: int, manage_connections: bool = True) -> None:
+    """
+    작업 1건 실행 (상태 전이: queued → running → done/failed)
+    워커 스레드에서는 manage_connections=True로 DB 커넥션을 정리한다.
+    """
+    if manage_connections:
+        close_old_connections()
+    try:
+        # queued인 경우에만 running으로 (조건부 UPDATE → 1건 갱신한 워커만 실행)
+        claimed = AnalysisJob.objects.filter(id=job_id, status="queued").update(
+            status="running", started_at=timezone.now()
+        )
+        if claimed != 1:
+            return
+
+        try:
+            job = AnalysisJob.objects.select_related("analysis").get(id=job_id)
+            outcome = run_analysis_pipeline(job.analysis)
+            AnalysisJob.objects.filter(id=job_id).update(
+                status="done",
+                warning=outcome.get("warning", ""),
+                finished_at=timezone.now(),
+            )
+        except Exception as e:
+            AnalysisJob.objects.filter(id=job_id).update(
+                status="failed", error=str(e)[:2000], finished_at=timezone.now()
+            )
+    finally:
+        if manage_connections:
+            close_old_connections()
+
+
+def recover_jobs(pool=None, stale_after: int = None) -> dict:
+    """
+    재시작 등으로 남은 작업 정리
+    - running인데 stale_after초 넘게 끝나지 않은 작업 → failed
+    - queued 작업 → 워커 풀에 다시 제출 (이미 다른 워커가 잡았으면 execute_job에서 건너뜀)
+    반환: {"failed": n, "requeued": n}
+    """
+    if stale_after is None:
+        stale_after = getattr(settings, "ANALYSIS_JOB_STALE_AFTER", 1800)
+    now = timezone.now()
+
+    failed = AnalysisJob.objects.filter(
+        status="running", started_at__lt=now - timedelta(seconds=stale_after)
+    ).update(status="failed", error=INTERRUPTED_MESSAGE, finished_at=now)
+    # started_at 없이 running으로 남은 작업 (비정상 상태)
+    failed += AnalysisJob.objects.filter(status="running", started_at__isnull=True).update(
+        status="failed", error=INTERRUPTED_MESSAGE, finished_at=now
+    )
+
+    pool = pool or get_worker_pool()
+    queued_ids = list(
+        AnalysisJob.objects.filter(status="queued").order_by("id").values_list("id", flat=True)
+    )
+    for job_id in queued_ids:
+        pool.submit(job_id)
+
+    return {"failed": failed, "requeued": len(queued_ids)}
+
+
+class AnalysisWorkerPool:
+    """
+    분석 작업 워커 풀
+    - thread: ThreadPoolExecutor(max_workers)로 요청 스레드와 분리해서 처리
+    - inline: 내부 Queue에만 쌓고 drain()에서 호출 스레드가 직접 처리
+    """
+
+    def __init__(self, max_workers: int = 4, backend: str = "thread"):
+        self.backend = backend
+        self.max_workers = max_workers
+        self._queue: "queue.Queue[int]" = queue.Queue()
+        self._executor = None
+        if backend == "thread":
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="analysis-worker"
+            )
+
+    def submit(self, job_id: int) -> None:
+        if self._executor is not None:
+            self._executor.submit(execute_job, job_id)
+        else:
+            self._queue.put(job_id)
+
+    def drain(self) -> int:
+        """inline 백엔드: 쌓인 작업을 모두 처리하고 처리 건수 반환"""
+        processed = 0
+        while True:
+            try:
+                job_id = self._queue.get_nowait()
+            except queue.Empty:
+                return processed
+            execute_job(job_id, manage_connections=False)
+            processed += 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> AnalysisWorkerPool:
+    """프로세스당 1개의 워커 풀 (최초 사용 시 생성 + 남은 작업 복구)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                pool = AnalysisWorkerPool(
+                    max_workers=getattr(settings, "ANALYSIS_JOB_WORKERS", 4),
+                    backend=getattr(settings, "ANALYSIS_JOB_BACKEND", "thread"),
+                )
+                if pool.backend == "thread":
+                    try:
+                        print(f"[ANALYSIS JOB] 시작 복구: {recover_jobs(pool)}")
+                    except Exception as e:
+                        print(f"[ANALYSIS JOB] 시작 복구 실패: {e}")
+                _pool = pool
+    return _pool
+
+
+def enqueue_analysis(analysis) -> AnalysisJob:
+    """분석 요청을 작업 큐에 등록 (트랜잭션 커밋 후 워커에 전달)"""
+    job = AnalysisJob.objects.create(analysis=analysis)
+    pool = get_worker_pool()
+    transaction.on_commit(lambda: pool.submit(job.id))
+    return job
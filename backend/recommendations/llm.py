@@ -22,7 +22,8 @@
 
 import json
 from django.conf import settings
-from openai import OpenAI
+
+from finance import llm_gateway
 
 # services의 compute_goal_math를 import
 from .services import compute_goal_math
@@ -304,13 +305,8 @@ def call_gpt_json(system_prompt: str, user_prompt: str) -> dict:
     if not getattr(settings, "OPENAI_BASE_URL", None):
         raise RuntimeError("OPENAI_BASE_URL is not set")
 
-    client = OpenAI(
-        api_key=settings.OPENAI_API_KEY,
-        base_url=settings.OPENAI_BASE_URL,
-    )
-
-    res = client.chat.completions.create(
-        model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
+    res = llm_gateway.chat_completion(
+        cache="recommendation",
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
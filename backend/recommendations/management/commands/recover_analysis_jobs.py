@@ -0,0 +1,28 @@
+"""
+recommendations/management/commands/recover_analysis_jobs.py
+재시작 등으로 남은 분석 작업 복구
+
+사용법:
+    python manage.py recover_analysis_jobs                    # 오래된 running → failed, queued 작업 실행
+    python manage.py recover_analysis_jobs --stale-after 600  # 10분 넘은 running을 중단으로 판단
+"""
+
+from django.core.management.base import BaseCommand
+
+from recommendations.jobs import AnalysisWorkerPool, recover_jobs
+
+
+class Command(BaseCommand):
+    help = "중단된 running 분석 작업을 실패 처리하고, 대기 중(queued)인 작업을 다시 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--stale-after', type=int, default=None, help='running 작업을 중단으로 볼 시간(초)')
+
+    def handle(self, *args, **options):
+        # 이 프로세스에서 직접 처리 (inline 큐 → drain)
+        pool = AnalysisWorkerPool(backend="inline")
+        counts = recover_jobs(pool, stale_after=options['stale_after'])
+        processed = pool.drain()
+        self.stdout.write(
+            f"실패 처리 {counts['failed']}건, 다시 실행 {counts['requeued']}건 (처리 {processed}건)"
+        )
@@ -0,0 +1,512 @@
+"""
+파일명: recommendations/materialize.py
+설명: 분석 결과 머티리얼라이즈 (계산 결과를 RecommendationResult에 저장 후 재사용)
+
+기능:
+    - 상품 상세/plan/fit_score, goal_math, 조합 전략, 대안 플랜 계산 (compute_core_payload)
+    - 계산 결과를 RecommendationResult JSON 필드에 저장
+    - 파트별 갱신 시각(refreshed_at) 기록 → 만료된 파트만 다시 계산/조회
+    - 저장된 row로 응답 payload 구성 (materialize_result)
+
+파트 구분 (RESULT_PART_TTLS):
+    - core: items/goal_math/alternative_plans/combination_strategy/purpose_data
+    - exchange_rate_info: 환율 (core의 best_strategy에 의존 → core 갱신 시 함께 갱신)
+    - related_news: 네이버 뉴스
+    - related_videos: 유튜브 영상 + 추천 여행지
+"""
+
+import math
+from datetime import timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from products.models import DepositOption, SavingOption
+
+from .services import (
+    compute_goal_math,
+    build_alternative_plans,
+    optimize_deposit_saving_combination,
+    build_smart_alternative_plans_with_products,
+    build_purpose_specific_data,
+    product_condition_penalty,
+    channel_bonus,
+    limit_fitness,
+)
+from .enrichment import (
+    fetch_exchange_rate_info,
+    fetch_related_news,
+    fetch_related_youtube,
+    gather_enrichments,
+)
+
+
+# 파트별 유효 시간 - 만료된 파트만 다시 계산/조회
+RESULT_PART_TTLS = {
+    "core": timedelta(hours=24),
+    "exchange_rate_info": timedelta(hours=1),
+    "related_news": timedelta(minutes=30),
+    "related_videos": timedelta(hours=6),
+}
+
+
+def compute_core_payload(analysis, result) -> dict:
+    """
+    DB 상품 정보 + 사용자 입력으로 계산되는 결과 (외부 API 호출 없음)
+    items에 product/option 상세 + plan(목표 달성 계산) 포함
+    goal_math(전체 계획) + alternative_plans(기간별 필요 월납입) 포함
+    combination_strategy(예금+적금 조합 최적화) 포함
+    purpose_data(목적별 분석 데이터) 포함
+    """
+    stored_items = result.items or []
+
+    deposit_option_ids = [
+        it["option_id"] for it in stored_items if it.get("kind") == "deposit"
+    ]
+    saving_option_ids = [
+        it["option_id"] for it in stored_items if it.get("kind") == "saving"
+    ]
+
+    deposit_opts = DepositOption.objects.select_related("product").filter(
+        id__in=deposit_option_ids
+    )
+    saving_opts = SavingOption.objects.select_related("product").filter(
+        id__in=saving_option_ids
+    )
+
+    deposit_map = {opt.id: opt for opt in deposit_opts}
+    saving_map = {opt.id: opt for opt in saving_opts}
+
+    # 사용자 입력 값 (정수)
+    target = int(analysis.target_amount)
+    monthly = int(analysis.monthly_amount)
+    current_savings = int(getattr(analysis, "current_savings", 0) or 0)
+
+    enriched_items = []
+    for it in stored_items:
+        kind = it.get("kind")
+        option_id = it.get("option_id")
+
+        opt = None
+        if kind == "deposit":
+            opt = deposit_map.get(option_id)
+        elif kind == "saving":
+            opt = saving_map.get(option_id)
+
+        if opt is None:
+            enriched_items.append(
+                {
+                    **it,
+                    "detail": None,
+                    "plan": None,
+                    "missing": True,
+                }
+            )
+            continue
+
+        p = opt.product
+        term = int(opt.save_trm)  # 이 추천 옵션의 기간
+
+        # -------------------------
+        # plan(추천 카드 하단용 계산)
+        # -------------------------
+        if kind == "saving":
+            # 적금: 월납 기준 계산
+            required_monthly = (
+                math.ceil(target / term) if (target > 0 and term > 0) else None
+            )
+            extra_needed = (
+                max(0, required_monthly - monthly)
+                if (required_monthly is not None)
+                else None
+            )
+
+            plan = {
+                "type": "monthly",
+                "term_months": term,
+                "required_monthly_amount": required_monthly,
+                "extra_needed_per_month": extra_needed,
+                "planned_total_amount": monthly * term,
+                "shortfall_amount": max(0, target - monthly * term),
+                "message": (
+                    ""
+                    if (required_monthly is None)
+                    else (
+                        f"{term}개월 목표 달성에는 월 {required_monthly}원 필요"
+                        + (
+                            f"(현재보다 +{extra_needed}원/월)"
+                            if extra_needed and extra_needed > 0
+                            else ""
+                        )
+                    )
+                ),
+            }
+
+        else:
+            # 예금: 일시납 안내 (월납과 성격 다름)
+            plan = {
+                "type": "lump_sum",
+                "term_months": term,
+                "required_lump_sum": target if target > 0 else None,
+                "message": "예금은 일반적으로 일시납(목돈 예치) 상품입니다. "
+                "현재 월납 계획과 성격이 달라 목표금액에 가까운 목돈 예치가 필요합니다.",
+            }
+
+        # -------------------------
+        # detail(기존 유지)
+        # -------------------------
+        detail = {
+            "kind": kind,
+            "option_id": opt.id,
+            "product_id": p.id,
+            "fin_prdt_cd": p.fin_prdt_cd,
+            "bank": p.kor_co_nm,
+            "name": p.fin_prdt_nm,
+            "join_way": p.join_way,
+            "join_member": p.join_member,
+            "join_deny": p.join_deny,
+            "spcl_cnd": p.spcl_cnd,
+            "etc_note": p.etc_note,
+            "save_trm": opt.save_trm,
+            "intr_rate": opt.intr_rate,
+            "intr_rate2": opt.intr_rate2,
+            "intr_rate_type_nm": opt.intr_rate_type_nm,
+            "rsrv_type": opt.rsrv_type,
+            "max_limit": opt.max_limit,
+        }
+
+        # -------------------------
+        # fit_score 재계산: 목표달성률 + 우대조건 난이도 + 채널 가산 + 한도 적합성
+        # 종합적인 적합도를 계산하여 사용자에게 제공
+        # -------------------------
+        opt_rate = float(opt.intr_rate2 or opt.intr_rate or 3.5)
+        
+        # 1) 목표 달성률 (0~1)
+        if kind == "saving" and monthly > 0 and term > 0:
+            principal = monthly * term
+            saving_interest = monthly * term * (term + 1) / 2 * ((opt_rate / 100) / 12)
+            deposit_interest = current_savings * (3.5 / 100) * (term / 12)
+            total_with_interest = current_savings + deposit_interest + principal + saving_interest
+            goal_achievement = min(1.0, total_with_interest / target) if target > 0 else 1.0
+        elif kind == "deposit" and current_savings > 0 and term > 0:
+            deposit_interest = current_savings * (opt_rate / 100) * (term / 12)
+            if monthly > 0:
+                saving_principal = monthly * term
+                saving_interest = monthly * term * (term + 1) / 2 * ((4.0 / 100) / 12)
+                total_with_interest = current_savings + deposit_interest + saving_principal + saving_interest
+            else:
+                total_with_interest = current_savings + deposit_interest
+            goal_achievement = min(1.0, total_with_interest / target) if target > 0 else 1.0
+        else:
+            goal_achievement = it.get("fit_score") or 0.5
+        
+        # 2) 우대조건 난이도 감점 (0~0.4 범위, 어려울수록 높음)
+        cond_penalty = product_condition_penalty(p)
+        
+        # 3) 채널 가산 (모바일/인터넷 가입 가능 시 +0.1~0.17)
+        chan_bonus = channel_bonus(p.join_way or "")
+        
+        # 4) 한도 적합성 (-0.25 ~ +0.1)
+        lim_fit = limit_fitness(opt.max_limit, target, monthly, term)
+        
+        # 종합 적합도 계산
+        # 목표달성률(70%) + 우대조건(-20%p) + 채널(+10%p) + 한도(±10%p)
+        # 가중치 조정으로 0~1 범위 유지
+        raw_fit_score = (
+            goal_achievement * 0.70  # 목표 달성이 가장 중요
+            - cond_penalty * 0.25    # 우대조건 어려우면 감점 (최대 -10%p)
+            + chan_bonus * 0.60      # 비대면 가입 가능하면 가산 (최대 +10%p)
+            + lim_fit * 0.40         # 한도 적합하면 가산 (최대 +4%p)
+            + 0.30                   # 기본점 (최소 적합도 보장)
+        )
+        calculated_fit_score = max(0.0, min(1.0, raw_fit_score))
+
+        enriched_items.append(
+            {
+                "kind": kind,
+                "option_id": int(option_id),
+                "product_id": int(it.get("product_id") or p.id),
+                "fit_score": calculated_fit_score,
+                "goal_achievement": goal_achievement,  # 순수 목표달성률 (참고용)
+                "condition_difficulty": round(cond_penalty, 3),  # 우대조건 난이도 (참고용)
+                "reason": it.get("reason"),
+                "detail": detail,
+                "plan": plan,  # 핵심 추가
+            }
+        )
+
+    # 전체 계획(사용자 입력 기간 기준)
+    user_input = {
+        "purpose": analysis.purpose,
+        "period_months": analysis.period_months,
+        "target_amount": analysis.target_amount,
+        "monthly_amount": analysis.monthly_amount,
+        "current_savings": getattr(analysis, "current_savings", 0) or 0,
+        "housing_type": getattr(analysis, "housing_type", ""),
+        "target_region": getattr(analysis, "target_region", ""),
+        "target_apartment": getattr(analysis, "target_apartment", ""),
+        "apartment_price": getattr(analysis, "apartment_price", 0),
+        "travel_destination": getattr(analysis, "travel_destination", ""),
+        "travel_country_code": getattr(analysis, "travel_country_code", ""),
+        "savings_purpose_detail": getattr(analysis, "savings_purpose_detail", ""),
+    }
+
+    # GPT 추천 상품 중 최적 상품 찾기 (적합도 + 금리 기준)
+    # enriched_items는 서버에서 재계산한 fit_score가 포함됨
+    # 전략별 최적 상품 = 추천 상품 중 예금/적금 각각 (적합도 1위 중 금리 최고)
+    best_deposit_opt = None
+    best_deposit_rate = 0
+    best_saving_opt = None
+    best_saving_rate = 0
+
+    # 1단계: 예금/적금 각각 모든 후보 수집 (enriched_items에서 재계산된 fit_score 사용!)
+    deposit_candidates = []
+    saving_candidates = []
+    
+    for it in enriched_items:  # ★ stored_items → enriched_items 변경
+        kind = it.get("kind")
+        option_id = it.get("option_id")
+        fit_score = it.get("fit_score", 0)  # 서버에서 재계산한 fit_score
+
+        if kind == "deposit":
+            opt = deposit_map.get(option_id)
+            if opt:
+                rate = float(opt.intr_rate2 or opt.intr_rate or 0)
+                deposit_candidates.append((fit_score, rate, opt))
+        elif kind == "saving":
+            opt = saving_map.get(option_id)
+            if opt:
+                rate = float(opt.intr_rate2 or opt.intr_rate or 0)
+                saving_candidates.append((fit_score, rate, opt))
+
+    # 2단계: 적합도 1위 → 같으면 금리 높은 순으로 정렬 후 첫 번째 선택
+    if deposit_candidates:
+        # 적합도 내림차순 → 금리 내림차순
+        deposit_candidates.sort(key=lambda x: (x[0], x[1]), reverse=True)
+        best_deposit_opt = deposit_candidates[0][2]
+        best_deposit_rate = deposit_candidates[0][1]
+
+    if saving_candidates:
+        # 적합도 내림차순 → 금리 내림차순
+        saving_candidates.sort(key=lambda x: (x[0], x[1]), reverse=True)
+        best_saving_opt = saving_candidates[0][2]
+        best_saving_rate = saving_candidates[0][1]
+
+    # goal_math 계산 시 실제 상품 금리 적용
+    goal_math = compute_goal_math(
+        user_input,
+        deposit_rate=best_deposit_rate if best_deposit_rate > 0 else 3.5,
+        saving_rate=best_saving_rate if best_saving_rate > 0 else 4.0,
+    )
+
+    # 기간 대안표(목표/월납 기준) - 상품 포함된 스마트 대안
+    alt_plans = build_smart_alternative_plans_with_products(user_input, goal_math)
+
+    # 기존 대안도 포함 (fallback)
+    basic_alt_plans = build_alternative_plans(
+        {
+            "target_amount": analysis.target_amount,
+            "monthly_amount": analysis.monthly_amount,
+        }
+    )
+
+    # 예금+적금 조합 최적화
+    combination_strategy = None
+    current_savings = int(user_input.get("current_savings") or 0)
+
+    # 추천 상품 정보 구성
+    recommended_deposit = None
+    recommended_saving = None
+
+    if best_deposit_opt:
+        p = best_deposit_opt.product
+        recommended_deposit = {
+            "option_id": best_deposit_opt.id,
+            "product_id": p.id,
+            "fin_prdt_cd": p.fin_prdt_cd,
+            "bank": p.kor_co_nm,
+            "name": p.fin_prdt_nm,
+            "rate": best_deposit_rate,
+            "save_trm": best_deposit_opt.save_trm,
+        }
+
+    if best_saving_opt:
+        p = best_saving_opt.product
+        recommended_saving = {
+            "option_id": best_saving_opt.id,
+            "product_id": p.id,
+            "fin_prdt_cd": p.fin_prdt_cd,
+            "bank": p.kor_co_nm,
+            "name": p.fin_prdt_nm,
+            "rate": best_saving_rate,
+            "save_trm": best_saving_opt.save_trm,
+        }
+
+    # 조합 전략 계산 (보유금 또는 월납입액이 있으면)
+    if current_savings > 0 or int(analysis.monthly_amount) > 0:
+        # 실제 추천 상품의 가입 기간 가져오기
+        deposit_save_trm = best_deposit_opt.save_trm if best_deposit_opt else None
+        saving_save_trm = best_saving_opt.save_trm if best_saving_opt else None
+
+        combination_strategy = optimize_deposit_saving_combination(
+            current_savings=current_savings,
+            monthly_amount=int(analysis.monthly_amount),
+            target_amount=int(analysis.target_amount),
+            period_months=int(analysis.period_months),
+            deposit_rate=best_deposit_rate if best_deposit_rate > 0 else 3.5,
+            saving_rate=best_saving_rate if best_saving_rate > 0 else 4.0,
+            deposit_save_trm=deposit_save_trm,  # 실제 예금 상품 기간
+            saving_save_trm=saving_save_trm,  # 실제 적금 상품 기간
+        )
+
+        # 각 전략별로 최적 상품 정보 추가
+        for strategy in combination_strategy.get("strategies", []):
+            strategy_type = strategy.get("strategy_type", "")
+
+            # 예금을 사용하는 전략
+            if strategy.get("uses_deposit"):
+                strategy["best_deposit_product"] = recommended_deposit
+
+            # 적금을 사용하는 전략
+            if strategy.get("uses_saving"):
+                strategy["best_saving_product"] = recommended_saving
+
+        # best_strategy에도 추가
+        if combination_strategy.get("best_strategy"):
+            best = combination_strategy["best_strategy"]
+            if best.get("uses_deposit"):
+                best["best_deposit_product"] = recommended_deposit
+            if best.get("uses_saving"):
+                best["best_saving_product"] = recommended_saving
+
+        # 전체 추천 상품 정보도 추가 (기존 호환)
+        combination_strategy["recommended_deposit"] = recommended_deposit
+        combination_strategy["recommended_saving"] = recommended_saving
+
+    # 목적별 추가 분석 데이터
+    purpose_data = build_purpose_specific_data(user_input, analysis.purpose)
+
+    # 추천 상품 정렬: 적합도 내림차순 → 금리 내림차순
+    sorted_items = sorted(
+        enriched_items,
+        key=lambda x: (
+            x.get("fit_score", 0),
+            float((x.get("detail") or {}).get("intr_rate2", 0) or (x.get("detail") or {}).get("intr_rate", 0) or 0)
+        ),
+        reverse=True
+    )
+
+    return {
+        "enriched_items": sorted_items,  # ★ 정렬된 items
+        "goal_math": goal_math,
+        "alternative_plans": alt_plans if alt_plans else basic_alt_plans,
+        "combination_strategy": combination_strategy or {},
+        "purpose_data": purpose_data,
+    }
+
+
+def stale_parts(result, now=None) -> list:
+    """갱신 시각이 없거나 TTL이 지난 파트 목록"""
+    now = now or timezone.now()
+    refreshed_at = result.refreshed_at or {}
+    stale = []
+    for part, ttl in RESULT_PART_TTLS.items():
+        ts = parse_datetime(refreshed_at.get(part) or "")
+        if ts is None or now - ts >= ttl:
+            stale.append(part)
+    # 환율 환산은 core의 best_strategy를 사용하므로 core와 함께 갱신
+    if "core" in stale and "exchange_rate_info" not in stale:
+        stale.append("exchange_rate_info")
+    return stale
+
+
+def materialize_result(analysis, result) -> dict:
+    """
+    만료된 파트만 다시 계산/조회해서 row에 저장하고, row 기준으로 응답 구성
+    - 외부 조회가 실패하거나 마감 시간을 넘기면 이전 저장값을 유지하고 partial 표시
+      (갱신 시각을 찍지 않으므로 다음 조회 때 다시 시도)
+    """
+    now = timezone.now()
+    stale = stale_parts(result, now)
+    refreshed_at = dict(result.refreshed_at or {})
+    update_fields = []
+
+    if "core" in stale:
+        core = compute_core_payload(analysis, result)
+        for field, value in core.items():
+            setattr(result, field, value)
+        update_fields.extend(core.keys())
+        refreshed_at["core"] = now.isoformat()
+
+    purpose_data = result.purpose_data or {}
+    search_keywords = purpose_data.get("search_keywords", [])
+
+    # 외부 연동 데이터 (환율/뉴스/유튜브) - 서로 독립적이므로 병렬 조회
+    tasks = {}
+    if "related_news" in stale:
+        tasks["related_news"] = (fetch_related_news, (search_keywords,))
+    if "related_videos" in stale:
+        # 여행 목적일 때 전용 유튜브 검색 키워드 사용
+        youtube_query = (
+            purpose_data.get("youtube_search_keyword")
+            if analysis.purpose == "travel"
+            else (search_keywords[0] if search_keywords else None)
+        )
+        tasks["related_videos"] = (
+            fetch_related_youtube,
+            (youtube_query, analysis.purpose, purpose_data),
+        )
+    if "exchange_rate_info" in stale:
+        if analysis.purpose == "travel" and analysis.travel_country_code:
+            tasks["exchange_rate_info"] = (
+                fetch_exchange_rate_info,
+                (
+                    analysis.travel_country_code,
+                    int(analysis.target_amount),
+                    result.combination_strategy,
+                ),
+            )
+        else:
+            refreshed_at["exchange_rate_info"] = now.isoformat()
+
+    enrichments, missing_sources = gather_enrichments(tasks, defaults={})
+
+    for part, value in enrichments.items():
+        if part in missing_sources:
+            continue  # 이전 저장값 유지, 갱신 시각도 그대로
+        if part == "related_videos":
+            # 유튜브 제목에서 추출한 추천 여행지도 함께 저장
+            result.related_videos, result.recommended_destinations = value
+            update_fields.extend(["related_videos", "recommended_destinations"])
+        else:
+            setattr(result, part, value or ({} if part == "exchange_rate_info" else []))
+            update_fields.append(part)
+        refreshed_at[part] = now.isoformat()
+
+    if refreshed_at != (result.refreshed_at or {}):
+        result.refreshed_at = refreshed_at
+        update_fields.append("refreshed_at")
+    if update_fields:
+        result.save(update_fields=update_fields)
+
+    # AI 최종 판단 (GPT가 생성한 ai_verdict 사용, 없으면 summary fallback)
+    ai_verdict = result.ai_verdict if result.ai_verdict else result.summary
+
+    return {
+        "summary": result.summary,
+        "goal_math": result.goal_math,
+        "alternative_plans": result.alternative_plans,
+        "combination_strategy": result.combination_strategy or None,
+        "purpose_data": result.purpose_data,
+        "exchange_rate_info": result.exchange_rate_info or None,
+        "related_news": result.related_news,
+        "related_youtube": result.related_videos,
+        "recommended_destinations": result.recommended_destinations,  # 추천 여행지 추가
+        "ai_verdict": ai_verdict,
+        "items": result.enriched_items,
+        "created_at": result.created_at,
+        # 실패했거나 마감 시간 내 응답하지 않은 외부 소스가 있으면 partial
+        "partial": bool(missing_sources),
+        "missing_sources": missing_sources,
+        "refreshed_at": result.refreshed_at,
+    }
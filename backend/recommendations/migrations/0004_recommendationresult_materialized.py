@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0003_analysisjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recommendationresult',
+            name='enriched_items',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='recommendationresult',
+            name='purpose_data',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name='recommendationresult',
+            name='refreshed_at',
+            field=models.JSONField(default=dict),
+        ),
+    ]
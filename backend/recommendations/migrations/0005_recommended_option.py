@@ -0,0 +1,48 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_options(apps, schema_editor):
+    """기존 분석 결과 items의 옵션 참조 기록"""
+    RecommendationResult = apps.get_model('recommendations', 'RecommendationResult')
+    RecommendedOption = apps.get_model('recommendations', 'RecommendedOption')
+
+    refs = {}
+    for result_id, items in RecommendationResult.objects.values_list('id', 'items').iterator():
+        for it in items or []:
+            if not isinstance(it, dict) or it.get('kind') not in ('deposit', 'saving'):
+                continue
+            try:
+                option_id = int(it.get('option_id'))
+            except (TypeError, ValueError):
+                continue
+            refs[(result_id, it['kind'], option_id)] = RecommendedOption(
+                result_id=result_id, kind=it['kind'], option_id=option_id
+            )
+    RecommendedOption.objects.bulk_create(refs.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0004_recommendationresult_materialized'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendedOption',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('deposit', '예금'), ('saving', '적금')], max_length=10)),
+                ('option_id', models.IntegerField()),
+                ('result', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='options', to='recommendations.recommendationresult')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'option_id'], name='recommendat_kind_84c468_idx')],
+                'constraints': [models.UniqueConstraint(fields=('result', 'kind', 'option_id'), name='uniq_recommended_option')],
+            },
+        ),
+        migrations.RunPython(backfill_options, migrations.RunPython.noop),
+    ]
@@ -78,6 +78,10 @@ class RecommendationResult(models.Model):
     combination_strategy = models.JSONField(default=dict)
     # 목표 계산 결과
     goal_math = models.JSONField(default=dict)
+    # 상품 상세/plan/fit_score가 포함된 추천 상품 (조회 응답용, 정렬 완료)
+    enriched_items = models.JSONField(default=list)
+    # 목적별 분석 데이터 (검색 키워드, 팁 등)
+    purpose_data = models.JSONField(default=dict)
 
     # === 주택 관련 결과 ===
     real_estate_analysis = models.JSONField(default=dict)  # 부동산 시장 분석
@@ -96,10 +100,82 @@ class RecommendationResult(models.Model):
     # AI 최종 판단/조언
     ai_verdict = models.TextField(blank=True, default="")
 
+    # 파트별 마지막 계산/조회 시각 (ISO 문자열) - recommendations.materialize 참고
+    # 예: {"core": "...", "related_news": "...", "related_videos": "...", "exchange_rate_info": "..."}
+    refreshed_at = models.JSONField(default=dict)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
+    def record_options(self) -> None:
+        """items가 참조하는 예금/적금 옵션 id를 RecommendedOption에 기록 (상품 동기화 삭제 판단용)"""
+        refs = {}
+        for it in self.items or []:
+            if not isinstance(it, dict) or it.get("kind") not in ("deposit", "saving"):
+                continue
+            try:
+                option_id = int(it.get("option_id"))
+            except (TypeError, ValueError):
+                continue
+            refs[(it["kind"], option_id)] = RecommendedOption(
+                result=self, kind=it["kind"], option_id=option_id
+            )
+        RecommendedOption.objects.bulk_create(refs.values(), ignore_conflicts=True)
+
+
+class RecommendedOption(models.Model):
+    """
+    분석 결과가 참조하는 옵션 (kind + 옵션 id)
+    - 상품 동기화에서 삭제 대상 옵션 중 참조 중인 것만 option_id__in으로 조회
+      (결과 JSON 전체를 읽지 않음)
+    """
+
+    KIND_CHOICES = [
+        ("deposit", "예금"),
+        ("saving", "적금"),
+    ]
+
+    result = models.ForeignKey(
+        RecommendationResult, on_delete=models.CASCADE, related_name="options"
+    )
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    option_id = models.IntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["result", "kind", "option_id"], name="uniq_recommended_option"
+            ),
+        ]
+        indexes = [models.Index(fields=["kind", "option_id"])]
+
 
 class RecommendationCache(models.Model):
     cache_key = models.CharField(max_length=128, unique=True)
     payload = models.JSONField(default=dict)
     created_at = models.DateTimeField(auto_now_add=True)
+
+
+class AnalysisJob(models.Model):
+    """분석 비동기 작업 모델 - 백그라운드 워커 처리 상태 추적"""
+
+    STATUS_CHOICES = [
+        ("queued", "대기"),
+        ("running", "실행 중"),
+        ("done", "완료"),
+        ("failed", "실패"),
+    ]
+
+    analysis = models.OneToOneField(
+        AnalysisRequest, on_delete=models.CASCADE, related_name="job"
+    )
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default="queued", db_index=True
+    )
+    # GPT 실패로 내부 점수 기반 추천으로 대체된 경우 안내 문구
+    warning = models.TextField(blank=True, default="")
+    # 실패 사유 (후보 없음, 예외 메시지 등)
+    error = models.TextField(blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
@@ -0,0 +1,190 @@
+"""
+파일명: recommendations/option_index.py
+설명: 예금/적금 옵션 인메모리 인덱스 (후보 점수화용)
+
+기능:
+    - 전체 DepositOption/SavingOption을 기간(save_trm)별로 묶어 메모리에 보관
+    - 상품 속성 사전 계산 (channel_bonus, rate_score)
+    - 우대조건 감점은 동기화 시 저장된 spcl_penalty 사용
+    - 사용자 기간 주변 기간 선택 (terms_near)
+    - 배치 점수 계산용 컬럼 배열 (select → services.score_options_batch)
+
+버전 관리:
+    - 인덱스 버전 = ProductSyncStatus의 (예금 버전, 적금 버전)
+    - 금감원 동기화가 돌아 버전이 바뀐 경우에만 다시 로드
+    - 버전 확인 쿼리는 settings.OPTION_INDEX_CHECK_INTERVAL(초)마다 1회만 실행
+"""
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from django.conf import settings
+
+from .services import channel_bonus, product_condition_penalty, rate_score
+
+
+KINDS = ("deposit", "saving")
+
+
+@dataclass
+class IndexedOption:
+    """옵션 1개 + 사전 계산된 점수 요소"""
+
+    option: Any  # DepositOption / SavingOption (product select_related)
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+
+class OptionIndex:
+    """
+    종류(kind) → 기간(term) → 옵션 목록(id 순)
+    """
+
+    def __init__(self, version: tuple, by_term: Dict[str, Dict[int, List[IndexedOption]]]):
+        self.version = version
+        self._by_term = by_term
+        self._terms = {kind: sorted(by_term.get(kind, {})) for kind in KINDS}
+        # 종류별 전체 옵션(id 순) + 같은 순서의 컬럼 배열
+        self._entries: Dict[str, List[IndexedOption]] = {}
+        self._columns: Dict[str, Dict[str, np.ndarray]] = {}
+        for kind in KINDS:
+            entries = sorted(
+                (e for group in by_term.get(kind, {}).values() for e in group),
+                key=lambda e: e.option.id,
+            )
+            self._entries[kind] = entries
+            self._columns[kind] = _build_columns(entries)
+
+    @classmethod
+    def build(cls, version: tuple) -> "OptionIndex":
+        from products.models import DepositOption, SavingOption
+
+        by_term: Dict[str, Dict[int, List[IndexedOption]]] = {}
+        for kind, model in (("deposit", DepositOption), ("saving", SavingOption)):
+            # 상품 단위 속성은 상품당 1번만 계산
+            product_attrs: Dict[int, Dict[str, float]] = {}
+            groups: Dict[int, List[IndexedOption]] = {}
+
+            for opt in model.objects.select_related("product").order_by("id"):
+                if opt.save_trm is None:
+                    continue
+                p = opt.product
+                if p.id not in product_attrs:
+                    product_attrs[p.id] = {
+                        "channel_bonus": channel_bonus(p.join_way or ""),
+                        "condition_penalty": product_condition_penalty(p),
+                    }
+                attrs = {
+                    **product_attrs[p.id],
+                    "rate_score": rate_score(opt.intr_rate, opt.intr_rate2),
+                }
+                groups.setdefault(int(opt.save_trm), []).append(
+                    IndexedOption(option=opt, attrs=attrs)
+                )
+
+            by_term[kind] = groups
+
+        return cls(version, by_term)
+
+    def is_empty(self) -> bool:
+        return not any(self._terms.values())
+
+    def terms(self, kind: str) -> List[int]:
+        """해당 종류에 존재하는 기간 목록 (오름차순)"""
+        return self._terms.get(kind, [])
+
+    def terms_near(self, kind: str, user_period: int) -> List[int]:
+        """
+        존재하는 기간 중 사용자 기간 주변(하위 최대값/상위 최소값)
+        예: user_period=27, terms=[6,12,24,36] -> [24,36]
+        """
+        terms = self._terms.get(kind, [])
+        if not terms:
+            return []
+
+        chosen = set()
+        i = bisect.bisect_right(terms, user_period)
+        if i > 0:
+            chosen.add(terms[i - 1])
+        j = bisect.bisect_left(terms, user_period)
+        if j < len(terms):
+            chosen.add(terms[j])
+        return sorted(chosen)
+
+    def select(
+        self, kind: str, terms: List[int], limit: int | None = None
+    ) -> Tuple[List[IndexedOption], Dict[str, np.ndarray]]:
+        """
+        주어진 기간들의 옵션과 컬럼 배열 (옵션 id 순, limit개까지)
+        """
+        entries = self._entries.get(kind, [])
+        columns = self._columns.get(kind) or _build_columns([])
+        idx = np.flatnonzero(np.isin(columns["save_trm"], terms))
+        if limit is not None:
+            idx = idx[:limit]
+        return [entries[i] for i in idx], {k: v[idx] for k, v in columns.items()}
+
+
+def _build_columns(entries: List[IndexedOption]) -> Dict[str, np.ndarray]:
+    """옵션 목록 → 배치 점수 계산용 컬럼 배열 (max_limit 없음은 NaN)"""
+    opts = [e.option for e in entries]
+    return {
+        "save_trm": np.array([int(o.save_trm or 0) for o in opts], dtype=np.int64),
+        "intr_rate": np.array([float(o.intr_rate or 0) for o in opts], dtype=np.float64),
+        "intr_rate2": np.array([float(o.intr_rate2 or 0) for o in opts], dtype=np.float64),
+        "max_limit": np.array(
+            [np.nan if o.max_limit is None else float(o.max_limit) for o in opts],
+            dtype=np.float64,
+        ),
+        "rate_score": np.array([e.attrs["rate_score"] for e in entries], dtype=np.float64),
+        "channel_bonus": np.array([e.attrs["channel_bonus"] for e in entries], dtype=np.float64),
+        "condition_penalty": np.array(
+            [e.attrs["condition_penalty"] for e in entries], dtype=np.float64
+        ),
+    }
+
+
+_index: OptionIndex | None = None
+_last_checked = 0.0
+_lock = threading.Lock()
+
+
+def get_option_index() -> OptionIndex:
+    """
+    프로세스 공용 인덱스 반환
+    - 버전 확인은 OPTION_INDEX_CHECK_INTERVAL초마다 1회 (그 사이에는 쿼리 없음)
+    - 비어 있는 인덱스는 보관하지 않음 (상품 적재 전 기동한 경우 대비)
+    """
+    global _index, _last_checked
+
+    interval = getattr(settings, "OPTION_INDEX_CHECK_INTERVAL", 30)
+    now = time.monotonic()
+    index = _index
+    if index is not None and now - _last_checked < interval:
+        return index
+
+    with _lock:
+        if _index is not None and now - _last_checked < interval:
+            return _index
+
+        from products.models import ProductSyncStatus
+
+        version = ProductSyncStatus.current_versions()
+        if _index is None or _index.version != version:
+            index = OptionIndex.build(version)
+            _index = None if index.is_empty() else index
+        else:
+            index = _index
+        _last_checked = now
+        return index
+
+
+def invalidate_option_index() -> None:
+    """다음 조회 시 다시 로드 (테스트/수동 데이터 변경용)"""
+    global _index, _last_checked
+    with _lock:
+        _index = None
+        _last_checked = 0.0
@@ -5,6 +5,7 @@
 클래스:
     - AnalysisCreateSerializer: 분석 요청 생성 시리얼라이저
     - RecommendationResultSerializer: 추천 결과 시리얼라이저
+    - AnalysisJobSerializer: 비동기 분석 작업 상태 시리얼라이저
 
 목적별 필드:
     - housing: 주거 관련 (housing_type, target_region, apartment_price)
@@ -13,7 +14,7 @@
 """
 
 from rest_framework import serializers
-from .models import AnalysisRequest, RecommendationResult
+from .models import AnalysisRequest, RecommendationResult, AnalysisJob
 
 
 class AnalysisCreateSerializer(serializers.ModelSerializer):
@@ -103,3 +104,23 @@ class AnalysisDetailSerializer(serializers.ModelSerializer):
 
     def get_housing_type_display(self, obj):
         return obj.get_housing_type_display() if obj.housing_type else None
+
+
+class AnalysisJobSerializer(serializers.ModelSerializer):
+    """비동기 분석 작업 상태 시리얼라이저"""
+
+    job_id = serializers.IntegerField(source="id", read_only=True)
+    analysis_id = serializers.IntegerField(source="analysis.id", read_only=True)
+
+    class Meta:
+        model = AnalysisJob
+        fields = [
+            "job_id",
+            "analysis_id",
+            "status",
+            "warning",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
@@ -15,7 +15,7 @@
 
 주요 함수:
     - compute_goal_math: 목표금액 달성 여부 계산
-    - pick_candidates_scored: 조건에 맞는 상품 후보 점수화
+    - pick_candidates_scored: 조건에 맞는 상품 후보 점수화 (option_index 사용)
     - optimize_deposit_saving_combination: 예적금 조합 최적화
     - build_purpose_specific_data: 목적별 데이터 구성
 """
@@ -23,6 +23,10 @@
 import re, math
 from typing import Any, Dict, List, Tuple, Optional
 
+import numpy as np
+
+from products.spcl_cnd import EASY_KWS, HARD_KWS, compress_spcl_cnd, spcl_penalty
+
 # 한국 이자소득세율 (15.4% = 소득세 14% + 지방소득세 1.4%)
 INTEREST_TAX_RATE = 0.154
 
@@ -161,41 +165,26 @@ def compute_goal_math(
 # 1) 우대조건 키워드 추출/난이도
 # -----------------------------
 
-EASY_KWS = [
-    "자동이체",
-    "비대면",
-    "모바일",
-    "앱",
-    "인터넷",
-    "스마트폰",
-    "첫거래",
-    "신규",
-]
-HARD_KWS = [
-    "카드",
-    "신용카드",
-    "체크카드",
-    "카드실적",
-    "사용실적",
-    "결제",
-    "이용실적",
-    "실적",
-]
-
-
-def compress_spcl_cnd(text: str, max_len: int = 140) -> Dict[str, Any]:
-    if not text:
-        return {"short": "", "keywords": [], "hard": [], "easy": []}
-
-    cleaned = re.sub(r"\s+", " ", str(text)).strip()
-    short = cleaned[:max_len]
-
-    easy = [k for k in EASY_KWS if k in cleaned]
-    hard = [k for k in HARD_KWS if k in cleaned]
-
-    # 키워드는 UI 표시용/디버깅용으로 합쳐서 저장
-    keywords = list(dict.fromkeys(easy + hard))[:10]
-    return {"short": short, "keywords": keywords, "hard": hard[:10], "easy": easy[:10]}
+# 키워드 목록/요약/감점 계산은 products.spcl_cnd에 있음
+# (금감원 동기화 시 상품 테이블에 미리 계산해서 저장)
+
+
+def product_spcl_info(p: Any) -> Dict[str, Any]:
+    """
+    상품의 우대조건 요약/키워드
+    - 동기화 시 저장된 값 사용 (spcl_penalty가 null이면 미계산 → 즉석 계산)
+    """
+    if getattr(p, "spcl_penalty", None) is None:
+        return compress_spcl_cnd(getattr(p, "spcl_cnd", "") or "")
+
+    easy = list(p.spcl_easy_kws or [])
+    hard = list(p.spcl_hard_kws or [])
+    return {
+        "short": p.spcl_cnd_short or "",
+        "keywords": list(dict.fromkeys(easy + hard))[:10],
+        "hard": hard,
+        "easy": easy,
+    }
 
 
 def channel_bonus(join_way: str) -> float:
@@ -217,58 +206,19 @@ def condition_penalty(spcl_cnd: str) -> float:
     카드실적류가 많을수록 감점
     """
     info = compress_spcl_cnd(spcl_cnd or "")
-    hard_cnt = len(info["hard"])
-    easy_cnt = len(info["easy"])
-
-    # 쉬운 조건은 약간 가산, 어려운 조건은 감점
-    # (너가 원하는 방향에 맞게 계수는 쉽게 조정 가능)
-    penalty = 0.0
-    penalty += hard_cnt * 0.08  # 어려운 키워드 하나당 -0.08
-    penalty -= easy_cnt * 0.03  # 쉬운 키워드 하나당 +0.03 (감점 감소)
-    return penalty
+    return spcl_penalty(len(info["hard"]), len(info["easy"]))
 
 
-# -----------------------------
-# 2) 달성가능성(feasibility)
-# -----------------------------
-
-
-def feasibility_score(
-    user_input: Dict[str, Any],
-    deposit_rate: float = 3.5,
-    saving_rate: float = 4.0,
-) -> float:
-    """
-    보유금 + 적금 원금 + 이자를 모두 포함하여 목표 달성 가능성 점수화 (0~1)
-    - compute_goal_math를 활용하여 정확한 계산
-    - 부족하면 0~1 사이, 초과해도 1로 캡
-    """
-    period_months = max(1, int(user_input.get("period_months") or 1))
-    target_amount = max(1, int(user_input.get("target_amount") or 1))
-    monthly_amount = max(0, int(user_input.get("monthly_amount") or 0))
-    current_savings = max(0, int(user_input.get("current_savings") or 0))
-
-    # 이자 포함 총액 계산
-    # 예금 이자 (보유금)
-    deposit_interest = current_savings * (deposit_rate / 100) * (period_months / 12)
-    
-    # 적금 이자 (단리: 등차급수 공식)
-    saving_interest = 0
-    if monthly_amount > 0 and period_months > 0:
-        saving_interest = monthly_amount * period_months * (period_months + 1) / 2 * ((saving_rate / 100) / 12)
-    
-    # 총 예상 금액 (보유금 + 적금원금 + 이자)
-    total_with_interest = current_savings + deposit_interest + (monthly_amount * period_months) + saving_interest
-    
-    ratio = total_with_interest / target_amount
-
-    if ratio >= 1.0:
-        return 1.0
-    return max(0.0, min(1.0, ratio))
+def product_condition_penalty(p: Any) -> float:
+    """상품의 우대조건 감점 (저장된 spcl_penalty 우선)"""
+    stored = getattr(p, "spcl_penalty", None)
+    if stored is not None:
+        return float(stored)
+    return condition_penalty(getattr(p, "spcl_cnd", "") or "")
 
 
 # -----------------------------
-# 3) 한도 적합성(limit fitness)
+# 2) 한도 적합성(limit fitness)
 # -----------------------------
 
 
@@ -303,7 +253,7 @@ def limit_fitness(
 
 
 # -----------------------------
-# 4) 금리 점수(rate score)
+# 3) 금리 점수(rate score)
 # -----------------------------
 
 
@@ -323,56 +273,76 @@ def rate_score(base_rate: float, max_rate: float) -> float:
 
 
 # -----------------------------
-# 5) 최종 후보 점수 계산
+# 4) 후보 점수 계산 (NumPy 배치)
 # -----------------------------
 
 
-def candidate_score(
-    opt: Any,
+def score_options_batch(
+    columns: Dict[str, "np.ndarray"],
     kind: str,
     user_input: Dict[str, Any],
-) -> Tuple[float, Dict[str, Any]]:
+) -> Dict[str, "np.ndarray"]:
     """
-    opt: DepositOption or SavingOption (select_related(product))
-    user_input: purpose, period_months, target_amount, monthly_amount
-    반환: (final_score, debug_parts)
+    옵션 컬럼 배열 전체를 한 번에 점수화
+    columns: save_trm, intr_rate, intr_rate2, max_limit(NaN=없음),
+             rate_score, channel_bonus, condition_penalty (option_index.select 참고)
+    반환: {"final", "feasibility", "rate_score", "channel_bonus",
+           "limit_fit", "condition_penalty", "term_adjustment"} (행별 배열)
     """
-    p = opt.product
-
     period_months = int(user_input["period_months"])
     target_amount = int(user_input["target_amount"])
     monthly_amount = int(user_input["monthly_amount"])
-    user_period = int(user_input["period_months"])
-    opt_period = int(getattr(opt, "save_trm", 0) or 0)
-    tadj = term_adjustment(user_period, opt_period)
-
-    # 해당 옵션의 금리 가져오기
-    opt_rate = float(getattr(opt, "intr_rate2", 0) or getattr(opt, "intr_rate", 0) or 3.5)
-    
-    # 1) 달성가능성(중요도 높게) - 이자/보유금 포함
-    feas = feasibility_score(
-        user_input,
-        deposit_rate=opt_rate if kind == "deposit" else 3.5,
-        saving_rate=opt_rate if kind == "saving" else 4.0,
-    )  # 0~1
 
-    # 2) 금리
-    rscore = rate_score(
-        getattr(opt, "intr_rate", 0), getattr(opt, "intr_rate2", 0)
-    )  # 0~1
+    intr_rate = columns["intr_rate"]
+    intr_rate2 = columns["intr_rate2"]
 
-    # 3) 채널 가산
-    cbonus = channel_bonus(getattr(p, "join_way", ""))  # 0~0.17
+    # 해당 옵션의 금리 (intr_rate2 → intr_rate → 3.5 순서로 대체)
+    opt_rate = np.where(intr_rate2 != 0, intr_rate2, np.where(intr_rate != 0, intr_rate, 3.5))
 
-    # 4) 우대조건 난이도 감점
-    cpen = condition_penalty(getattr(p, "spcl_cnd", ""))  # 0~(대략 0.4)
+    # 1) 달성가능성 (중요도 높게) - 보유금 + 적금 원금 + 이자를 모두 포함, 0~1 (초과해도 1로 캡)
+    f_period = max(1, int(user_input.get("period_months") or 1))
+    f_target = max(1, int(user_input.get("target_amount") or 1))
+    f_monthly = max(0, int(user_input.get("monthly_amount") or 0))
+    f_current = max(0, int(user_input.get("current_savings") or 0))
 
-    # 5) 한도 적합성 (옵션에 존재)
-    lfit = limit_fitness(
-        getattr(opt, "max_limit", None), target_amount, monthly_amount, period_months
-    )  # -0.25~+0.1
+    deposit_rate = opt_rate if kind == "deposit" else np.full_like(opt_rate, 3.5)
+    saving_rate = opt_rate if kind == "saving" else np.full_like(opt_rate, 4.0)
+
+    deposit_interest = f_current * (deposit_rate / 100) * (f_period / 12)
+    saving_interest = np.zeros_like(opt_rate)
+    if f_monthly > 0 and f_period > 0:
+        saving_interest = f_monthly * f_period * (f_period + 1) / 2 * ((saving_rate / 100) / 12)
+    total_with_interest = f_current + deposit_interest + (f_monthly * f_period) + saving_interest
+    feas = np.clip(total_with_interest / f_target, 0.0, 1.0)
+
+    # 2) 금리
+    rscore = columns["rate_score"]
+
+    # 3) 채널 가산 / 4) 우대조건 난이도 감점 (상품 단위 사전 계산 값)
+    cbonus = columns["channel_bonus"]
+    cpen = columns["condition_penalty"]
+
+    # 5) 한도 적합성 (limit_fitness와 동일: 없음/0 이하 → 0, 이내 → +0.1, 초과 → 감점)
+    max_limit = columns["max_limit"]
+    planned = monthly_amount * period_months
+    valid = ~np.isnan(max_limit) & (max_limit > 0)
+    safe_limit = np.where(valid, max_limit, 1.0)
+    over_ratio = (planned - safe_limit) / safe_limit
+    lfit = np.where(
+        valid,
+        np.where(planned <= safe_limit, 0.10, -np.minimum(0.25, over_ratio * 0.25)),
+        0.0,
+    )
+
+    # 6) 기간 보정
+    #    - 옵션 기간 == 사용자 기간 : +0.08
+    #    - 옵션 기간 <  사용자 기간 : 만기 후 재운용 필요 → +0.03 (작게 가산)
+    #    - 옵션 기간 >  사용자 기간 : 중도해지 리스크 → 12개월 초과당 -0.10, 최대 -0.15
+    d = columns["save_trm"] - period_months
+    tadj = np.where(
+        d == 0, 0.08, np.where(d < 0, 0.03, -np.minimum(0.15, (d / 12) * 0.10))
+    )
 
-    # 가중치 조합 (너가 원하는대로 조정 가능)
     # 달성가능성을 가장 중요하게(0.55), 금리(0.35), 나머지 보정
     final = (
         0.55 * feas
@@ -383,58 +353,45 @@ def candidate_score(
         + 1.00 * tadj
     )
 
-    debug = {
+    return {
+        "final": final,
         "feasibility": feas,
         "rate_score": rscore,
         "channel_bonus": cbonus,
         "limit_fit": lfit,
         "condition_penalty": cpen,
-        "final": final,
-        "kind": kind,
-        "option_id": int(opt.id),
-        "product_id": int(p.id),
-        "bank": getattr(p, "kor_co_nm", ""),
-        "name": getattr(p, "fin_prdt_nm", ""),
-        "join_way": getattr(p, "join_way", ""),
+        "term_adjustment": tadj,
     }
-    return final, debug
 
 
 # -----------------------------
-# 6) 후보 뽑기 + 점수 정렬
+# 5) 후보 뽑기 + 점수 정렬
 # -----------------------------
 def _pick_terms_near(kind_model, user_period: int) -> List[int]:
     """
     DB에 존재하는 save_trm들 중 사용자 기간 주변(하위/상위)을 골라준다.
     예: user_period=27, DB terms=[6,12,24,36] -> [24,36]
+    (옵션 인덱스 사용 - DB 조회 없음)
     """
-    qs = kind_model.objects.values_list("save_trm", flat=True).distinct()
-    terms = sorted({int(t) for t in qs if t is not None})
+    from products.models import DepositOption
+    from .option_index import get_option_index
 
-    if not terms:
-        return []
-
-    lower = [t for t in terms if t <= user_period]
-    upper = [t for t in terms if t >= user_period]
-
-    chosen = set()
-    if lower:
-        chosen.add(max(lower))
-    if upper:
-        chosen.add(min(upper))
-
-    # 혹시 user_period가 정확히 있으면 그거 하나로 충분
-    # chosen에 user_period가 들어가면 lower/upper가 동일할 수 있음(자동 처리)
-    return sorted(chosen)
+    kind = "deposit" if kind_model is DepositOption else "saving"
+    return get_option_index().terms_near(kind, user_period)
 
 
 def pick_candidates_scored(
     user_input: Dict[str, Any],
-    dep_limit: int = 80,
-    sav_limit: int = 80,
+    dep_limit: Optional[int] = 80,
+    sav_limit: Optional[int] = 80,
     top_n: int = 60,
 ):
-    from products.models import DepositOption, SavingOption
+    """
+    옵션 인덱스(메모리)에서 사용자 기간 주변 옵션을 골라 배치 점수화 후 상위 top_n 반환
+    dep_limit/sav_limit=None이면 해당 기간의 옵션 전체를 점수화
+    반환: [(score, option, kind, debug), ...]
+    """
+    from .option_index import get_option_index
 
     user_period = int(user_input["period_months"])
     monthly_amount = int(user_input.get("monthly_amount", 0))
@@ -444,61 +401,68 @@ def pick_candidates_scored(
     # 월 납입만 있고 목돈이 없으면 -> 적금만 추천
     # 목돈이 있으면 -> 예금+적금 조합 추천
 
-    scored: List[Tuple[float, Any, str, Dict[str, Any]]] = []
+    index = get_option_index()
+
+    # (옵션 목록, kind, 점수 요소 배열) - 적금 먼저, 예금 다음 (기존 정렬 순서 유지)
+    batches = []
 
     # 적금은 항상 추천 (월 납입이 있을 때)
     if monthly_amount > 0:
-        sav_terms = _pick_terms_near(SavingOption, user_period)
-        sav_qs = (
-            SavingOption.objects.select_related("product").filter(
-                save_trm__in=sav_terms
-            )
-        )[:sav_limit]
-
-        for opt in sav_qs:
-            s, dbg = candidate_score(opt, "saving", user_input)
-            scored.append((s, opt, "saving", dbg))
+        sav_terms = index.terms_near("saving", user_period)
+        entries, columns = index.select("saving", sav_terms, sav_limit)
+        parts = score_options_batch(columns, "saving", user_input)
+        batches.append((entries, "saving", parts))
 
     # 예금은 보유금이 있거나, 월 납입이 없을 때만 추천
     if current_savings > 0 or monthly_amount == 0:
-        dep_terms = _pick_terms_near(DepositOption, user_period)
-        dep_qs = (
-            DepositOption.objects.select_related("product").filter(
-                save_trm__in=dep_terms
-            )
-        )[:dep_limit]
+        dep_terms = index.terms_near("deposit", user_period)
+        entries, columns = index.select("deposit", dep_terms, dep_limit)
+        parts = score_options_batch(columns, "deposit", user_input)
+        batches.append((entries, "deposit", parts))
 
-        for opt in dep_qs:
-            s, dbg = candidate_score(opt, "deposit", user_input)
-            scored.append((s, opt, "deposit", dbg))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return scored[:top_n]
+    if not batches or not any(entries for entries, _, _ in batches):
+        return []
 
+    finals = np.concatenate([parts["final"] for _, _, parts in batches])
+    batch_ids = np.concatenate([np.full(len(e), b) for b, (e, _, _) in enumerate(batches)])
+    row_ids = np.concatenate([np.arange(len(e)) for e, _, _ in batches])
+    # 점수 내림차순 (동점이면 기존 순서 유지)
+    order = np.argsort(-finals, kind="stable")[:top_n]
 
-def term_adjustment(user_period: int, opt_period: int) -> float:
-    """
-    - opt_period <= user_period : 만기 후 재운용(보수적) 가능 -> 약간 가산
-    - opt_period >  user_period : 중도해지 가능성 -> 감점
-    """
-    d = opt_period - user_period
-    if d == 0:
-        return 0.08  # 정확히 맞으면 가산
-    if d < 0:
-        # 27개월 목표인데 24개월이면 재운용 필요: 가산은 작게
-        return 0.03
-    # 36개월 추천은 중도해지 리스크 -> 감점
-    return -min(0.15, (d / 12) * 0.10)  # 12개월 초과당 -0.10, 최대 -0.15
+    scored: List[Tuple[float, Any, str, Dict[str, Any]]] = []
+    for r in order:
+        entries, kind, parts = batches[batch_ids[r]]
+        i = row_ids[r]
+        opt = entries[i].option
+        p = opt.product
+        final = float(parts["final"][i])
+        debug = {
+            "feasibility": float(parts["feasibility"][i]),
+            "rate_score": float(parts["rate_score"][i]),
+            "channel_bonus": float(parts["channel_bonus"][i]),
+            "limit_fit": float(parts["limit_fit"][i]),
+            "condition_penalty": float(parts["condition_penalty"][i]),
+            "term_adjustment": float(parts["term_adjustment"][i]),
+            "final": final,
+            "kind": kind,
+            "option_id": int(opt.id),
+            "product_id": int(p.id),
+            "bank": getattr(p, "kor_co_nm", ""),
+            "name": getattr(p, "fin_prdt_nm", ""),
+            "join_way": getattr(p, "join_way", ""),
+        }
+        scored.append((final, opt, kind, debug))
+    return scored
 
 
 # -----------------------------
-# 7) GPT로 넘길 compact dict 생성 (한도/우대/채널 포함)
+# 6) GPT로 넘길 compact dict 생성 (한도/우대/채널 포함)
 # -----------------------------
 
 
 def option_to_compact_dict(opt: Any, kind: str) -> Dict[str, Any]:
     p = opt.product
-    sp = compress_spcl_cnd(getattr(p, "spcl_cnd", "") or "")
+    sp = product_spcl_info(p)
 
     return {
         "kind": kind,
@@ -668,7 +632,7 @@ def build_alternative_plans(
 
 
 # -----------------------------
-# 8) 예금/적금 조합 최적화 계산
+# 7) 예금/적금 조합 최적화 계산
 # -----------------------------
 
 # 한국 이자소득세율 (15.4% = 소득세 14% + 지방소득세 1.4%)
@@ -1048,7 +1012,8 @@ def build_smart_alternative_plans_with_products(
     """
     목표 달성이 불가능할 때 다양한 대안 제시 + 해당 대안에 맞는 상품 추천
     """
-    from products.models import DepositOption, SavingOption
+    from products.models import SavingOption
+    from .option_index import get_option_index
 
     target = int(user_input.get("target_amount") or 0)
     monthly = int(user_input.get("monthly_amount") or 0)
@@ -1057,21 +1022,10 @@ def build_smart_alternative_plans_with_products(
 
     plans = []
 
-    # DB에 존재하는 적금/예금 기간 목록 가져오기
-    saving_terms = sorted(
-        {
-            int(t)
-            for t in SavingOption.objects.values_list("save_trm", flat=True).distinct()
-            if t
-        }
-    )
-    deposit_terms = sorted(
-        {
-            int(t)
-            for t in DepositOption.objects.values_list("save_trm", flat=True).distinct()
-            if t
-        }
-    )
+    # DB에 존재하는 적금/예금 기간 목록 가져오기 (옵션 인덱스)
+    index = get_option_index()
+    saving_terms = [t for t in index.terms("saving") if t]
+    deposit_terms = [t for t in index.terms("deposit") if t]
 
     # 합리적인 기간 제한: 목표 기간의 2배 또는 +12개월 중 작은 값
     max_allowed_period = min(period * 2, period + 12)
@@ -1298,7 +1252,7 @@ def build_smart_alternative_plans_with_products(
 
 
 # -----------------------------
-# 9) 목적별 추가 분석 데이터 생성
+# 8) 목적별 추가 분석 데이터 생성
 # -----------------------------
 
 
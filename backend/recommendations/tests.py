@@ -1,3 +1,107 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from . import jobs
+from .jobs import AnalysisWorkerPool, NoCandidatesError, execute_job, recover_jobs
+from .models import AnalysisJob, AnalysisRequest
+
+
+ANALYSIS_INPUT = {
+    "purpose": "travel",
+    "period_months": 12,
+    "target_amount": 3000000,
+    "monthly_amount": 250000,
+}
+
+
+class AnalysisJobTests(TestCase):
+    """inline 워커로 job 모드 상태 전이와 결과 조회 응답 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="analyst", password="pw")
+
+    def setUp(self):
+        self.pool = AnalysisWorkerPool(backend="inline")
+        patcher = mock.patch.object(jobs, "_pool", self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def create_job(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/v1/analysis/?mode=job", ANALYSIS_INPUT, format="json")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], "queued")
+        return AnalysisJob.objects.get(id=response.data["job_id"])
+
+    def result_response(self, job):
+        return self.client.get(f"/api/v1/analysis/{job.analysis_id}/result/")
+
+    def test_queued_job_returns_202_until_it_runs(self):
+        job = self.create_job()
+        response = self.result_response(job)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], "queued")
+
+        AnalysisJob.objects.filter(id=job.id).update(status="running", started_at=timezone.now())
+        self.assertEqual(self.result_response(job).data["status"], "running")
+
+    def test_job_runs_to_done(self):
+        job = self.create_job()
+        with mock.patch.object(jobs, "run_analysis_pipeline", return_value={"warning": "대체"}) as pipeline:
+            self.assertEqual(self.pool.drain(), 1)
+        pipeline.assert_called_once()
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.warning), ("done", "대체"))
+        self.assertIsNotNone(job.started_at)
+        self.assertIsNotNone(job.finished_at)
+
+        response = self.client.get(f"/api/v1/analysis/jobs/{job.id}/")
+        self.assertEqual(response.data["status"], "done")
+
+    def test_failed_job_returns_400(self):
+        job = self.create_job()
+        with mock.patch.object(jobs, "run_analysis_pipeline", side_effect=NoCandidatesError("후보 없음")):
+            self.pool.drain()
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.error), ("failed", "후보 없음"))
+
+        response = self.result_response(job)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["detail"], "후보 없음")
+
+    def test_job_is_claimed_once(self):
+        job = self.create_job()
+        with mock.patch.object(jobs, "run_analysis_pipeline", return_value={}) as pipeline:
+            execute_job(job.id, manage_connections=False)
+            execute_job(job.id, manage_connections=False)
+        self.assertEqual(pipeline.call_count, 1)
+
+    def test_recover_fails_stale_running_and_requeues_queued(self):
+        stale = self.create_job()
+        AnalysisJob.objects.filter(id=stale.id).update(
+            status="running", started_at=timezone.now() - timedelta(hours=2)
+        )
+        queued = self.create_job()
+        # 재시작으로 워커 큐가 사라진 상태 재현
+        self.pool._queue.queue.clear()
+
+        self.assertEqual(recover_jobs(self.pool, stale_after=600), {"failed": 1, "requeued": 1})
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, "failed")
 
-# Create your tests here.
+        with mock.patch.object(jobs, "run_analysis_pipeline", return_value={}):
+            self.assertEqual(self.pool.drain(), 1)
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, "done")
+        self.assertEqual(AnalysisRequest.objects.count(), 2)
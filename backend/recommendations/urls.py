@@ -5,6 +5,7 @@
 URL 패턴:
 - POST /api/v1/analysis/ : AI 분석 생성 요청
 - GET /api/v1/analysis/<id>/result/ : 분석 결과 조회
+- GET /api/v1/analysis/jobs/<job_id>/ : 비동기 분석 작업 상태 조회
 
 AI 모델: OpenAI GPT (GMS 프록시 사용)
 기능: 사용자 정보 기반 맞춤형 금융 상품 추천
@@ -18,4 +19,6 @@ urlpatterns = [
     path("analysis/", views.create_analysis),
     # 분석 결과 조회
     path("analysis/<int:analysis_id>/result/", views.get_analysis_result),
+    # 비동기 분석 작업 상태 조회 (queued/running/done/failed)
+    path("analysis/jobs/<int:job_id>/", views.get_analysis_job),
 ]
@@ -0,0 +1,207 @@
+"""
+stocks/candles.py
+종목 차트용 OHLCV 캔들 로컬 저장소
+
+주요 기능:
+- 일/주/월봉(1d, 1wk, 1mo)은 DB(StockCandle)에 저장해두고 기간만 잘라서 응답
+- 저장 범위보다 긴 기간을 요청하면 그 기간 전체를 1번 받아서 채움
+- 마지막 조회 후 CHART_CANDLE_TTL초가 지났으면 최신 구간(tail)만 받아서 덮어씀
+- 저장 캔들은 수정주가가 아닌 원본 OHLC (auto_adjust=False)
+  → 배당/분할 때마다 과거 전체가 다시 계산되는 수정주가를 쓰면
+    tail만 덮어쓴 구간 경계에서 가격이 튐
+- 분봉 등 나머지 간격은 yfinance 결과를 그대로 사용 (저장 안 함)
+- 응답 직렬화는 컬럼 배열 단위로 처리 (serialize_candles)
+- 시장별 시가총액 상위 종목 미리 채우기 (warm_top_candles)
+"""
+
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Stock, StockCandle, StockCandleSeries
+
+
+STORED_INTERVALS = {'1d', '1wk', '1mo'}
+
+# 짧은 기간은 달력 기준으로 자르면 주말/휴장일에 비어버려서 최근 캔들 개수로 자름
+PERIOD_BARS = {'1d': 1, '5d': 5}
+PERIOD_DAYS = {
+    '1mo': 31, '3mo': 92, '6mo': 183, '1y': 366, '2y': 731, '5y': 1827, '10y': 3653,
+}
+
+
+def period_start(period: str, now: datetime = None):
+    """기간 → 시작 시각(UTC epoch 초), 'max'와 캔들 개수 기준 기간은 None"""
+    now = now or datetime.now(dt_timezone.utc)
+    if period == 'ytd':
+        return int(datetime(now.year, 1, 1, tzinfo=dt_timezone.utc).timestamp())
+    if period in PERIOD_DAYS:
+        return int((now - timedelta(days=PERIOD_DAYS[period])).timestamp())
+    return None
+
+
+def _fetch_start(period: str, now: datetime = None):
+    """저장 범위 판단용 시작 시각 (캔들 개수 기준 기간은 넉넉하게 2주)"""
+    if period in PERIOD_BARS:
+        now = now or datetime.now(dt_timezone.utc)
+        return int((now - timedelta(days=14)).timestamp())
+    return period_start(period, now)
+
+
+# ============================================================
+# 직렬화
+# ============================================================
+def _price_list(values: np.ndarray) -> list:
+    """소수 둘째 자리 반올림, 0/NaN은 None"""
+    rounded = np.round(values.astype(float), 2)
+    valid = np.isfinite(rounded) & (rounded != 0)
+    return np.where(valid, rounded, None).tolist()
+
+
+def serialize_candles(ts: np.ndarray, opens, highs, lows, closes, volumes, tz: str) -> list:
+    """컬럼 배열 → 응답용 캔들 목록 (날짜는 거래소 시간대 ISO 형식)"""
+    dates = pd.to_datetime(ts, unit='s', utc=True).tz_convert(tz).map(pd.Timestamp.isoformat)
+    volumes = np.nan_to_num(np.asarray(volumes, dtype=float)).astype(np.int64).tolist()
+    return [
+        {'date': d, 'open': o, 'high': h, 'low': lo, 'close': c, 'volume': v}
+        for d, o, h, lo, c, v in zip(
+            dates, _price_list(opens), _price_list(highs), _price_list(lows), _price_list(closes), volumes
+        )
+    ]
+
+
+def _frame_columns(hist: pd.DataFrame):
+    """yfinance history → (ts 배열, open, high, low, close, volume, 시간대)"""
+    index = hist.index
+    tz = str(index.tz) if index.tz is not None else 'UTC'
+    if index.tz is None:
+        index = index.tz_localize('UTC')
+    ts = index.asi8 // 10**9
+    cols = [hist[name].to_numpy(dtype=float) for name in ('Open', 'High', 'Low', 'Close', 'Volume')]
+    return (ts, *cols, tz)
+
+
+# ============================================================
+# 저장소
+# ============================================================
+def _store(symbol: str, interval: str, hist: pd.DataFrame) -> tuple:
+    """캔들 upsert, 반환: (마지막 ts, 시간대)"""
+    ts, opens, highs, lows, closes, volumes, tz = _frame_columns(hist)
+    volumes = np.nan_to_num(volumes).astype(np.int64)
+
+    def _nullable(values):
+        return np.where(np.isfinite(values), values, None).tolist()
+
+    candles = [
+        StockCandle(symbol=symbol, interval=interval, ts=t, open=o, high=h, low=lo, close=c, volume=v)
+        for t, o, h, lo, c, v in zip(
+            ts.tolist(), _nullable(opens), _nullable(highs), _nullable(lows), _nullable(closes), volumes.tolist()
+        )
+    ]
+    StockCandle.objects.bulk_create(
+        candles,
+        update_conflicts=True,
+        unique_fields=['symbol', 'interval', 'ts'],
+        update_fields=['open', 'high', 'low', 'close', 'volume'],
+        batch_size=500,
+    )
+    return (int(ts[-1]) if len(ts) else None), tz
+
+
+def sync_candles(symbol: str, interval: str, period: str) -> StockCandleSeries:
+    """
+    요청 기간을 서빙할 수 있도록 저장소를 채움
+    - 저장 범위가 부족하면 기간 전체 조회
+    - 범위는 충분하지만 오래됐으면 최신 구간만 조회
+    - 둘 다 아니면 upstream 호출 없음
+    """
+    series = StockCandleSeries.objects.filter(symbol=symbol, interval=interval).first()
+    start = _fetch_start(period)
+    ttl = getattr(settings, 'CHART_CANDLE_TTL', 900)
+
+    need_range = (
+        series is None
+        or (series.covered_from is not None and (start is None or series.covered_from > start))
+    )
+
+    if need_range:
+        hist = yf.Ticker(symbol).history(
+            period=period if period not in PERIOD_BARS else '1mo', interval=interval, auto_adjust=False
+        )
+        if hist.empty:
+            return series
+        last_ts, tz = _store(symbol, interval, hist)
+        # 같은 종목/간격 첫 요청이 동시에 들어와도 (symbol, interval) 행 1개만 생성
+        series, _ = StockCandleSeries.objects.update_or_create(
+            symbol=symbol,
+            interval=interval,
+            defaults={'covered_from': start, 'tz': tz, 'last_ts': last_ts, 'fetched_at': timezone.now()},
+        )
+        return series
+
+    if (timezone.now() - series.fetched_at).total_seconds() >= ttl:
+        # 마지막 캔들부터 다시 받아서 진행 중인 캔들까지 덮어씀
+        tail_start = datetime.fromtimestamp(series.last_ts or time.time(), tz=dt_timezone.utc) - timedelta(days=1)
+        try:
+            hist = yf.Ticker(symbol).history(
+                start=tail_start.strftime('%Y-%m-%d'), interval=interval, auto_adjust=False
+            )
+        except Exception as e:
+            print(f"[CANDLES] {symbol} 최신 구간 조회 실패: {e}")
+            hist = pd.DataFrame()
+        if not hist.empty:
+            series.last_ts, series.tz = _store(symbol, interval, hist)
+        series.fetched_at = timezone.now()
+        series.save(update_fields=['last_ts', 'tz', 'fetched_at'])
+
+    return series
+
+
+def get_chart_data(symbol: str, period: str, interval: str) -> list:
+    """차트 캔들 목록 (데이터가 없으면 빈 리스트)"""
+    # 저장 대상이 아닌 간격 (짧은 기간의 주/월봉 포함)은 yfinance 결과 그대로
+    if interval not in STORED_INTERVALS or (period in PERIOD_BARS and interval != '1d'):
+        hist = yf.Ticker(symbol).history(period=period, interval=interval)
+        if hist.empty:
+            return []
+        ts, opens, highs, lows, closes, volumes, tz = _frame_columns(hist)
+        return serialize_candles(ts, opens, highs, lows, closes, volumes, tz)
+
+    series = sync_candles(symbol, interval, period)
+    if series is None:
+        return []
+
+    qs = StockCandle.objects.filter(symbol=symbol, interval=interval)
+    fields = ('ts', 'open', 'high', 'low', 'close', 'volume')
+    if period in PERIOD_BARS:
+        rows = list(qs.order_by('-ts').values_list(*fields)[:PERIOD_BARS[period]])[::-1]
+    else:
+        start = period_start(period)
+        if start is not None:
+            qs = qs.filter(ts__gte=start)
+        rows = list(qs.order_by('ts').values_list(*fields))
+
+    if not rows:
+        return []
+
+    arr = np.array(rows, dtype=float)
+    return serialize_candles(
+        arr[:, 0].astype(np.int64), arr[:, 1], arr[:, 2], arr[:, 3], arr[:, 4], arr[:, 5], series.tz
+    )
+
+
+def warm_top_candles(limit: int = 50, period: str = '1y', interval: str = '1d') -> int:
+    """시장별 시가총액 상위 종목 캔들 미리 채우기 (Stock.top_symbols), 반환: 처리한 종목 수"""
+    count = 0
+    for symbol in Stock.top_symbols(limit):
+        try:
+            sync_candles(symbol, interval, period)
+            count += 1
+        except Exception as e:
+            print(f"[CANDLES] {symbol} 워밍 실패: {e}")
+    return count
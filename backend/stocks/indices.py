@@ -0,0 +1,120 @@
+"""
+stocks/indices.py
+주요 시장 지표 (나스닥, S&P500, 환율 등) 조회 + 캐시
+
+주요 기능:
+- (심볼, 기간)별 TTL 캐시 + single-flight (settings.MARKET_INDICES_TTL)
+- 캐시가 없는 지표만 스레드 풀에서 동시에 조회
+- 기본 기간(5d) 백그라운드 워머 (settings.MARKET_INDICES_WARMER)
+- 지표별 데이터 경과 시간(data_age) 포함
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import yfinance as yf
+from django.conf import settings
+
+from .ttl_cache import TTLCache
+
+
+INDICES = {
+    '^IXIC': {'name': '나스닥', 'symbol': 'NASDAQ'},
+    '^GSPC': {'name': 'S&P 500', 'symbol': 'S&P500'},
+    '^DJI': {'name': '다우존스', 'symbol': 'DOW'},
+    '^KS11': {'name': '코스피', 'symbol': 'KOSPI'},
+    '^KQ11': {'name': '코스닥', 'symbol': 'KOSDAQ'},
+    'KRW=X': {'name': '원/달러', 'symbol': 'USD/KRW'},
+    'GC=F': {'name': '금', 'symbol': 'GOLD'},
+    'BTC-USD': {'name': '비트코인', 'symbol': 'BTC'},
+}
+
+DEFAULT_PERIOD = '5d'
+VALID_PERIODS = {'1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'}
+
+_cache = TTLCache(ttl=getattr(settings, 'MARKET_INDICES_TTL', 60))
+_executor = ThreadPoolExecutor(max_workers=len(INDICES), thread_name_prefix='market-index')
+
+
+def fetch_index(ticker_symbol: str, period: str):
+    """지표 1개 조회 (데이터가 없으면 None)"""
+    info = INDICES[ticker_symbol]
+    hist = yf.Ticker(ticker_symbol).history(period=period)
+    if len(hist) < 1:
+        return None
+
+    current = hist['Close'].iloc[-1]
+    previous = hist['Close'].iloc[0] if len(hist) >= 2 else current
+    change = current - previous
+    change_percent = (change / previous * 100) if previous else 0
+
+    # 미니 차트용 데이터 (최근 데이터 포인트들)
+    chart_data = [round(float(price), 2) for price in hist['Close'].tolist()[-20:]]
+
+    return {
+        'symbol': info['symbol'],
+        'name': info['name'],
+        'current_price': round(float(current), 2),
+        'value': round(float(current), 2),
+        'change': round(float(change), 2),
+        'change_percent': round(float(change_percent), 2),
+        'chart_data': chart_data,
+    }
+
+
+def _get_cached(ticker_symbol: str, period: str):
+    """(지표 dict 또는 None, 경과 초) - 조회 실패 시 (None, None)"""
+    try:
+        return _cache.get((ticker_symbol, period), lambda: fetch_index(ticker_symbol, period))
+    except Exception as e:
+        print(f"Error fetching {ticker_symbol}: {e}")
+        return None, None
+
+
+def get_market_indices(period: str = DEFAULT_PERIOD) -> list:
+    """
+    전체 지표 목록 (INDICES 순서 유지)
+    캐시 만료된 지표는 동시에 조회, 각 항목에 data_age(초) 포함
+    """
+    futures = [_executor.submit(_get_cached, ticker_symbol, period) for ticker_symbol in INDICES]
+
+    result = []
+    for future in futures:
+        item, age = future.result()
+        if item is None:
+            continue
+        result.append({**item, 'data_age': round(age, 1)})
+    return result
+
+
+# ============================================================
+# 백그라운드 워머 (기본 기간 5d)
+# ============================================================
+_warmer = None
+_warmer_lock = threading.Lock()
+
+
+def _warm_loop(interval: float) -> None:
+    while True:
+        for ticker_symbol in INDICES:
+            try:
+                _cache.refresh((ticker_symbol, DEFAULT_PERIOD), lambda t=ticker_symbol: fetch_index(t, DEFAULT_PERIOD))
+            except Exception as e:
+                print(f"[MARKET INDICES] 워머 조회 실패 {ticker_symbol}: {e}")
+        time.sleep(interval)
+
+
+def ensure_warmer() -> None:
+    """워머 스레드 시작 (프로세스당 1번, 첫 요청 시)"""
+    global _warmer
+    if not getattr(settings, 'MARKET_INDICES_WARMER', True) or _warmer is not None:
+        return
+    with _warmer_lock:
+        if _warmer is None:
+            # TTL보다 조금 짧은 주기로 갱신해서 사용자 요청은 항상 캐시 히트
+            interval = max(5.0, getattr(settings, 'MARKET_INDICES_TTL', 60) * 0.8)
+            _warmer = threading.Thread(
+                target=_warm_loop, args=(interval,), name='market-index-warmer', daemon=True
+            )
+            _warmer.start()
@@ -0,0 +1,41 @@
+"""
+stocks/management/commands/run_stock_refresher.py
+주식 데이터 주기 갱신 데몬
+
+사용법:
+    python manage.py run_stock_refresher            # 계속 실행 (tick초마다 확인)
+    python manage.py run_stock_refresher --once     # 갱신 대상만 1번 처리하고 종료 (cron용)
+    python manage.py run_stock_refresher --market KR --once   # 지정 시장 즉시 갱신
+"""
+
+from django.core.management.base import BaseCommand
+
+from stocks.refresh import run_refresh
+from stocks.scheduler import StockRefreshScheduler
+
+
+class Command(BaseCommand):
+    help = "국내/해외 주식 데이터를 시장별 주기에 맞춰 갱신합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='1번만 실행하고 종료')
+        parser.add_argument('--tick', type=float, default=10.0, help='갱신 대상 확인 간격(초)')
+        parser.add_argument('--market', choices=['KR', 'US'], help='주기와 상관없이 해당 시장 갱신')
+
+    def handle(self, *args, **options):
+        if options['market']:
+            success, message, count = run_refresh(options['market'])
+            self.stdout.write(message)
+            return
+
+        scheduler = StockRefreshScheduler(tick=options['tick'])
+        if options['once']:
+            for market, (success, message, count) in scheduler.run_once().items():
+                self.stdout.write(f"{market}: {message}")
+            return
+
+        self.stdout.write(f"주식 갱신 스케줄러 시작 (tick={options['tick']}초)")
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            scheduler.stop()
@@ -0,0 +1,25 @@
+"""
+stocks/management/commands/warm_stock_candles.py
+시가총액 상위 종목 차트 캔들 미리 채우기
+
+사용법:
+    python manage.py warm_stock_candles                       # 상위 50개, 1y/1d
+    python manage.py warm_stock_candles --limit 100 --period 2y --interval 1wk
+"""
+
+from django.core.management.base import BaseCommand
+
+from stocks.candles import STORED_INTERVALS, warm_top_candles
+
+
+class Command(BaseCommand):
+    help = "시가총액 상위 종목의 차트 캔들을 로컬 저장소에 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=50)
+        parser.add_argument('--period', default='1y')
+        parser.add_argument('--interval', default='1d', choices=sorted(STORED_INTERVALS))
+
+    def handle(self, *args, **options):
+        count = warm_top_candles(options['limit'], options['period'], options['interval'])
+        self.stdout.write(f"{count}개 종목 캔들 갱신 완료")
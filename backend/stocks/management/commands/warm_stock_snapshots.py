@@ -0,0 +1,23 @@
+"""
+stocks/management/commands/warm_stock_snapshots.py
+시가총액 상위 종목 상세 정보 스냅샷 미리 채우기
+
+사용법:
+    python manage.py warm_stock_snapshots              # 상위 50개
+    python manage.py warm_stock_snapshots --limit 200
+"""
+
+from django.core.management.base import BaseCommand
+
+from stocks.snapshots import warm_snapshots
+
+
+class Command(BaseCommand):
+    help = "시가총액 상위 종목의 상세 정보 스냅샷을 갱신합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=50)
+
+    def handle(self, *args, **options):
+        counts = warm_snapshots(options['limit'])
+        self.stdout.write(f"전체 갱신 {counts['full']}개, 시세 갱신 {counts['price']}개")
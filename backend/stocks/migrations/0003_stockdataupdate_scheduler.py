@@ -0,0 +1,53 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0002_stockdataupdate_stock'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stockdataupdate',
+            name='changed_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='stockdataupdate',
+            name='lock_owner',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='stockdataupdate',
+            name='locked_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='stockdataupdate',
+            name='message',
+            field=models.CharField(blank=True, default='', max_length=200),
+        ),
+        migrations.AddField(
+            model_name='stockdataupdate',
+            name='progress',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='stockdataupdate',
+            name='requested_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='stockdataupdate',
+            name='started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='stockdataupdate',
+            name='total',
+            field=models.IntegerField(default=0),
+        ),
+    ]
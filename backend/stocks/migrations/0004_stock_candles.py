@@ -0,0 +1,46 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:28
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0003_stockdataupdate_scheduler'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockCandle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('symbol', models.CharField(max_length=20)),
+                ('interval', models.CharField(max_length=5)),
+                ('ts', models.BigIntegerField()),
+                ('open', models.FloatField(blank=True, null=True)),
+                ('high', models.FloatField(blank=True, null=True)),
+                ('low', models.FloatField(blank=True, null=True)),
+                ('close', models.FloatField(blank=True, null=True)),
+                ('volume', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('symbol', 'interval', 'ts'), name='uniq_stock_candle')],
+            },
+        ),
+        migrations.CreateModel(
+            name='StockCandleSeries',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('symbol', models.CharField(max_length=20)),
+                ('interval', models.CharField(max_length=5)),
+                ('tz', models.CharField(default='UTC', max_length=50)),
+                ('covered_from', models.BigIntegerField(blank=True, null=True)),
+                ('last_ts', models.BigIntegerField(blank=True, null=True)),
+                ('fetched_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'unique_together': {('symbol', 'interval')},
+            },
+        ),
+    ]
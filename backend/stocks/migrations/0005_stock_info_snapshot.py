@@ -0,0 +1,45 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0004_stock_candles'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockInfoSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('symbol', models.CharField(max_length=20, unique=True)),
+                ('current_price', models.FloatField(blank=True, null=True)),
+                ('previous_close', models.FloatField(blank=True, null=True)),
+                ('open_price', models.FloatField(blank=True, null=True)),
+                ('day_high', models.FloatField(blank=True, null=True)),
+                ('day_low', models.FloatField(blank=True, null=True)),
+                ('volume', models.BigIntegerField(blank=True, null=True)),
+                ('market_cap', models.BigIntegerField(blank=True, null=True)),
+                ('avg_volume', models.BigIntegerField(blank=True, null=True)),
+                ('fifty_two_week_high', models.FloatField(blank=True, null=True)),
+                ('fifty_two_week_low', models.FloatField(blank=True, null=True)),
+                ('pe_ratio', models.FloatField(blank=True, null=True)),
+                ('eps', models.FloatField(blank=True, null=True)),
+                ('dividend_yield', models.FloatField(blank=True, null=True)),
+                ('beta', models.FloatField(blank=True, null=True)),
+                ('name', models.CharField(blank=True, default='', max_length=200)),
+                ('currency', models.CharField(blank=True, max_length=10, null=True)),
+                ('exchange', models.CharField(blank=True, max_length=20, null=True)),
+                ('sector', models.CharField(blank=True, max_length=100, null=True)),
+                ('industry', models.CharField(blank=True, max_length=100, null=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('website', models.CharField(blank=True, max_length=200, null=True)),
+                ('logo_url', models.CharField(blank=True, max_length=300, null=True)),
+                ('price_fetched_at', models.DateTimeField(blank=True, null=True)),
+                ('fundamentals_fetched_at', models.DateTimeField(blank=True, null=True)),
+                ('profile_fetched_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0005_stock_info_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stockdataupdate',
+            name='failed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='stockdataupdate',
+            name='last_updated',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+def reset_candles(apps, schema_editor):
+    """수정주가로 저장된 캔들 삭제 (다음 조회 때 원본 OHLC로 다시 채움)"""
+    apps.get_model('stocks', 'StockCandle').objects.all().delete()
+    apps.get_model('stocks', 'StockCandleSeries').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0006_refresh_failure_backoff'),
+    ]
+
+    operations = [
+        migrations.RunPython(reset_candles, migrations.RunPython.noop),
+    ]
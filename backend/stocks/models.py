@@ -6,8 +6,13 @@ stocks/models.py
 - Stock: 국내/해외 주식 데이터 (DB 캐싱)
 - StockDataUpdate: 주식 데이터 갱신 기록
 - BookmarkedStock: 사용자별 북마크한 주식
+- StockCandle: 종목별 OHLCV 캔들 (차트 로컬 저장소)
+- StockCandleSeries: 종목/간격별 캔들 저장 범위 및 마지막 조회 시각
+- StockInfoSnapshot: 종목 상세 정보 스냅샷 (필드 그룹별 조회 시각)
 """
 
+from itertools import zip_longest
+
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
@@ -46,12 +51,27 @@ class Stock(models.Model):
     def __str__(self):
         return f"[{self.market}] {self.name} ({self.symbol})"
 
+    @classmethod
+    def top_symbols(cls, limit: int) -> list:
+        """
+        시장별 시가총액 상위 종목 심볼 (시장별 순위대로 번갈아 합쳐서 limit개)
+        - 국내는 원화, 해외는 달러 시가총액이라 전체를 한 번에 정렬하면 국내 종목만 뽑힘
+        - 한 시장 종목이 모자라면 나머지 시장 종목으로 채움
+        """
+        ranked = [
+            list(cls.objects.filter(market=market).order_by('-market_cap').values_list('symbol', flat=True)[:limit])
+            for market, _ in cls.MARKET_CHOICES
+        ]
+        merged = [symbol for rank in zip_longest(*ranked) for symbol in rank if symbol is not None]
+        return merged[:limit]
+
 
 class StockDataUpdate(models.Model):
     """
     주식 데이터 갱신 기록
     
     갱신 주기 제한 (30분)을 위한 모델
+    스케줄러의 갱신 요청 큐/잠금/진행률도 함께 기록
     """
     MARKET_CHOICES = [
         ('KR', '국내'),
@@ -59,10 +79,21 @@ class StockDataUpdate(models.Model):
     ]
     
     market = models.CharField(max_length=2, choices=MARKET_CHOICES, unique=True)
-    last_updated = models.DateTimeField(default=timezone.now)
+    last_updated = models.DateTimeField(null=True, blank=True)  # 마지막 성공 시각 (null: 아직 갱신 안 함)
     stock_count = models.IntegerField(default=0)
     status = models.CharField(max_length=20, default='success')  # success, failed, in_progress
     
+    # 스케줄러 (stocks.scheduler)
+    requested_at = models.DateTimeField(null=True, blank=True)  # 수동 갱신 요청 (큐)
+    started_at = models.DateTimeField(null=True, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)  # 갱신 잠금 만료 시각
+    failed_at = models.DateTimeField(null=True, blank=True)  # 마지막 실패 시각 (재시도 대기 기준)
+    lock_owner = models.CharField(max_length=100, blank=True, default='')
+    progress = models.IntegerField(default=0)  # 처리한 종목 수
+    total = models.IntegerField(default=0)  # 처리할 종목 수
+    changed_count = models.IntegerField(default=0)  # 값이 바뀌어 저장한 종목 수
+    message = models.CharField(max_length=200, blank=True, default='')
+    
     def __str__(self):
         return f"{self.market} - {self.last_updated}"
     
@@ -70,6 +101,8 @@ class StockDataUpdate(models.Model):
         """갱신 가능 여부 확인 (기본 30분)"""
         if self.status == 'in_progress':
             return False
+        if self.last_updated is None:
+            return True
         elapsed = timezone.now() - self.last_updated
         return elapsed.total_seconds() >= minutes * 60
 
@@ -93,3 +126,98 @@ class BookmarkedStock(models.Model):
     
     def __str__(self):
         return f"{self.user.username} - {self.symbol}"
+
+
+class StockCandle(models.Model):
+    """
+    OHLCV 캔들 (차트 로컬 저장소)
+    
+    ts: 캔들 시작 시각 (UTC epoch 초)
+    (symbol, interval, ts) 유니크 인덱스로 기간 조회
+    """
+    symbol = models.CharField(max_length=20)
+    interval = models.CharField(max_length=5)
+    ts = models.BigIntegerField()
+    open = models.FloatField(null=True, blank=True)
+    high = models.FloatField(null=True, blank=True)
+    low = models.FloatField(null=True, blank=True)
+    close = models.FloatField(null=True, blank=True)
+    volume = models.BigIntegerField(default=0)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['symbol', 'interval', 'ts'], name='uniq_stock_candle'),
+        ]
+    
+    def __str__(self):
+        return f"{self.symbol} {self.interval} {self.ts}"
+
+
+class StockCandleSeries(models.Model):
+    """
+    종목/간격별 캔들 저장 상태
+    
+    covered_from: 저장된 범위 시작 (UTC epoch 초, null이면 전체 이력)
+    fetched_at: 마지막으로 yfinance에서 최신 구간을 받아온 시각
+    tz: 거래소 시간대 (응답 날짜를 원래 시간대로 표시)
+    """
+    symbol = models.CharField(max_length=20)
+    interval = models.CharField(max_length=5)
+    tz = models.CharField(max_length=50, default='UTC')
+    covered_from = models.BigIntegerField(null=True, blank=True)
+    last_ts = models.BigIntegerField(null=True, blank=True)
+    fetched_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        unique_together = ('symbol', 'interval')
+    
+    def __str__(self):
+        return f"{self.symbol} {self.interval}"
+
+
+class StockInfoSnapshot(models.Model):
+    """
+    종목 상세 정보 스냅샷 (yfinance info 캐시)
+    
+    StockDetailSerializer에 필요한 필드만 보관
+    필드 그룹별로 조회 시각을 따로 기록해서 유지 시간을 다르게 적용 (stocks.snapshots)
+    - price: 시세 (짧게)
+    - fundamentals: 거래량 평균, 52주, PER/EPS 등 (길게)
+    - profile: 이름, 거래소, 섹터, 기업 설명 (길게)
+    """
+    symbol = models.CharField(max_length=20, unique=True)
+    
+    # price
+    current_price = models.FloatField(null=True, blank=True)
+    previous_close = models.FloatField(null=True, blank=True)
+    open_price = models.FloatField(null=True, blank=True)
+    day_high = models.FloatField(null=True, blank=True)
+    day_low = models.FloatField(null=True, blank=True)
+    volume = models.BigIntegerField(null=True, blank=True)
+    market_cap = models.BigIntegerField(null=True, blank=True)
+    
+    # fundamentals
+    avg_volume = models.BigIntegerField(null=True, blank=True)
+    fifty_two_week_high = models.FloatField(null=True, blank=True)
+    fifty_two_week_low = models.FloatField(null=True, blank=True)
+    pe_ratio = models.FloatField(null=True, blank=True)
+    eps = models.FloatField(null=True, blank=True)
+    dividend_yield = models.FloatField(null=True, blank=True)
+    beta = models.FloatField(null=True, blank=True)
+    
+    # profile
+    name = models.CharField(max_length=200, blank=True, default='')
+    currency = models.CharField(max_length=10, null=True, blank=True)
+    exchange = models.CharField(max_length=20, null=True, blank=True)
+    sector = models.CharField(max_length=100, null=True, blank=True)
+    industry = models.CharField(max_length=100, null=True, blank=True)
+    description = models.TextField(null=True, blank=True)
+    website = models.CharField(max_length=200, null=True, blank=True)
+    logo_url = models.CharField(max_length=300, null=True, blank=True)
+    
+    price_fetched_at = models.DateTimeField(null=True, blank=True)
+    fundamentals_fetched_at = models.DateTimeField(null=True, blank=True)
+    profile_fetched_at = models.DateTimeField(null=True, blank=True)
+    
+    def __str__(self):
+        return f"{self.name} ({self.symbol})"
@@ -0,0 +1,465 @@
+"""
+stocks/refresh.py
+주식 데이터 갱신 (국내/해외)
+
+주요 기능:
+- 국내 주식 갱신 (pykrx): refresh_kr_stocks
+- 해외 주식 갱신 (Wikipedia S&P 500 + Yahoo 시세 일괄 조회): refresh_us_stocks
+- S&P 500 구성 종목 디스크 캐시 (get_sp500_constituents, TTL)
+- 해외 시세 배치 병렬 조회 + 재시도 (fetch_us_quotes, fetch_quote_batches)
+  → 받은 시세 비율이 STOCK_QUOTE_MIN_COVERAGE 미만이면 해외 갱신 실패로 기록
+- 시장별 갱신 잠금 (StockDataUpdate 행의 locked_until lease)
+- 값이 바뀐 종목만 DB 반영 (apply_stock_rows, bulk upsert 1번)
+- 국내 종목명 테이블 캐시 (get_kr_ticker_names, 하루 1번 갱신)
+- 잠금 + 상태 기록을 묶은 실행 진입점 (run_refresh, 성공 시 검색 인덱스 갱신)
+"""
+
+import io
+import json
+import os
+import random
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import requests
+import pandas as pd
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from pykrx import stock as pykrx_stock
+from pykrx.website import krx as pykrx_krx
+from yfinance.data import YfData
+
+from .models import Stock, StockDataUpdate
+from .search_index import rebuild_index as rebuild_search_index
+
+
+def calculate_change_percent(current: float, previous: float) -> float:
+    """등락률 계산"""
+    if current and previous and previous != 0:
+        return round(((current - previous) / previous) * 100, 2)
+    return 0.0
+
+
+# ============================================================
+# 갱신 잠금 / 진행률
+# ============================================================
+def _lock_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"[:100]
+
+
+def acquire_refresh_lock(market: str) -> bool:
+    """
+    시장별 갱신 잠금 획득
+    - 조건부 UPDATE 1번으로 처리 (잠금이 없거나 만료된 경우에만 성공)
+    - 프로세스가 죽어도 STOCK_REFRESH_LOCK_TIMEOUT초 뒤에는 다시 획득 가능
+    - 처음 만드는 행은 last_updated=None (한 번도 갱신 안 한 시장)
+    """
+    StockDataUpdate.objects.get_or_create(market=market, defaults={'last_updated': None})
+    now = timezone.now()
+    lease = now + timedelta(seconds=getattr(settings, 'STOCK_REFRESH_LOCK_TIMEOUT', 1800))
+    acquired = (
+        StockDataUpdate.objects.filter(market=market)
+        .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+        .update(
+            status='in_progress', locked_until=lease, lock_owner=_lock_owner(),
+            started_at=now, requested_at=None, progress=0, total=0, message='',
+        )
+    )
+    return acquired == 1
+
+
+def release_refresh_lock(market: str, **fields) -> bool:
+    """
+    잠금 해제 + 결과 기록 (내가 잡은 잠금일 때만)
+    - 갱신이 STOCK_REFRESH_LOCK_TIMEOUT보다 오래 걸려 다른 워커가 잠금을 가져갔으면
+      그 워커의 잠금/상태를 건드리지 않고 False
+    """
+    released = StockDataUpdate.objects.filter(market=market, lock_owner=_lock_owner()).update(
+        locked_until=None, lock_owner='', **fields
+    )
+    if not released:
+        print(f"[STOCK REFRESH] {market}: 잠금이 만료되어 다른 작업이 가져감 (결과 기록 생략)")
+    return released == 1
+
+
+def report_progress(market: str, progress: int, total: int, message: str = '') -> None:
+    """진행률 기록 (get_update_status에서 조회)"""
+    StockDataUpdate.objects.filter(market=market).update(
+        progress=progress, total=total, message=message[:200]
+    )
+
+
+# ============================================================
+# 변경분만 저장
+# ============================================================
+def apply_stock_rows(rows: list) -> tuple:
+    """
+    종목 행(dict, symbol 필수) 목록을 DB에 반영
+    - 한 번 호출할 때 모든 행은 같은 필드를 가져야 함
+    - 기존 값과 같은 종목은 건너뛰고, 나머지는 bulk_create(update_conflicts) 1번으로 저장
+    - 반환: (새로 추가한 심볼 목록, 값이 바뀌어 수정한 심볼 목록)
+    """
+    if not rows:
+        return [], []
+
+    fields = [k for k in rows[0] if k != 'symbol']
+    existing = {
+        values[0]: values[1:]
+        for values in Stock.objects.filter(symbol__in=[r['symbol'] for r in rows])
+        .values_list('symbol', *fields)
+    }
+
+    created, updated, changed_rows = [], [], []
+    for row in rows:
+        current = existing.get(row['symbol'])
+        if current is None:
+            created.append(row['symbol'])
+        elif current != tuple(row[k] for k in fields):
+            updated.append(row['symbol'])
+        else:
+            continue
+        changed_rows.append(row)
+
+    if changed_rows:
+        # updated_at은 auto_now라 bulk_create 시 pre_save로 채워짐
+        Stock.objects.bulk_create(
+            [Stock(**row) for row in changed_rows],
+            update_conflicts=True,
+            unique_fields=['symbol'],
+            update_fields=fields + ['updated_at'],
+            batch_size=500,
+        )
+
+    return created, updated
+
+
+# ============================================================
+# 국내 종목명 테이블 (하루 1번 갱신)
+# ============================================================
+_kr_names = {'date': None, 'names': {}}
+_kr_names_lock = threading.Lock()
+
+
+def get_kr_ticker_names(date_str: str, tickers) -> dict:
+    """
+    티커 → 종목명
+    - KRX 전종목 티커/종목명 표를 요청 1번으로 받아 하루 동안 메모리에 보관
+    - 표에 없는 티커만 개별 조회 (신규 상장 등)
+    """
+    today = timezone.localdate().isoformat()
+    with _kr_names_lock:
+        if _kr_names['date'] != today:
+            try:
+                table = pykrx_krx.get_market_ticker_and_name(date_str, "ALL")
+                names = {str(k): v for k, v in table.items() if v}
+            except Exception:
+                names = {}
+            fetched = bool(names)
+            if not fetched:
+                # KRX 조회 실패 시 DB에 저장된 이름으로 대체 (다음 갱신 때 다시 시도)
+                names = dict(Stock.objects.filter(market='KR').values_list('code', 'name'))
+            _kr_names['date'] = today if fetched else None
+            _kr_names['names'] = names
+
+        names = _kr_names['names']
+        for ticker in tickers:
+            if ticker in names:
+                continue
+            try:
+                name = pykrx_stock.get_market_ticker_name(ticker)
+                if name:
+                    names[ticker] = name
+            except Exception:
+                continue
+        return dict(names)
+
+
+# ============================================================
+# 데이터 갱신 함수 (국내/해외)
+# ============================================================
+def refresh_kr_stocks():
+    """
+    국내 주식 데이터 갱신 (pykrx)
+    반환: (성공 여부, 메시지, 종목 수, 변경 종목 수)
+    """
+    # 최근 유효 거래일 찾기
+    today = datetime.today()
+    date_str, df_cap = None, None
+
+    for i in range(14):
+        check_date = (today - timedelta(days=i)).strftime("%Y%m%d")
+        try:
+            df = pykrx_stock.get_market_cap_by_ticker(check_date, market="ALL")
+            if df is not None and not df.empty:
+                df_valid = df[(df['시가총액'] > 0) & (df['종가'] > 0)]
+                if len(df_valid) > 100:
+                    date_str, df_cap = check_date, df_valid
+                    break
+        except Exception:
+            continue
+
+    if df_cap is None or df_cap.empty:
+        return False, '유효한 거래일을 찾을 수 없습니다.', 0, 0
+
+    # OHLCV 데이터 (등락률)
+    try:
+        df_ohlcv = pykrx_stock.get_market_ohlcv_by_ticker(date_str, market="ALL")
+    except Exception:
+        df_ohlcv = None
+
+    # 시가총액순 정렬 및 상위 500개
+    df_cap = df_cap.sort_values('시가총액', ascending=False).head(500)
+    total = len(df_cap)
+    report_progress('KR', 0, total, f'{date_str} 데이터 정리 중')
+
+    # 시가총액 + 등락률을 한 번에 합치고 종목명 매핑
+    df = df_cap[['종가', '시가총액']].copy()
+    if df_ohlcv is not None and '등락률' in df_ohlcv.columns:
+        df = df.join(df_ohlcv[['등락률']], how='left')
+    else:
+        df['등락률'] = 0.0
+    df['등락률'] = pd.to_numeric(df['등락률'], errors='coerce').fillna(0.0)
+
+    names = get_kr_ticker_names(date_str, df.index)
+    df['종목명'] = df.index.map(names)
+    df = df[df['종목명'].notna()]
+
+    # 저장할 행 구성
+    rows = [
+        {
+            'symbol': f"{ticker}.KS",
+            'code': ticker,
+            'name': name,
+            'market': 'KR',
+            'current_price': int(close),
+            'change_percent': round(float(change), 2),
+            'market_cap': int(cap),
+        }
+        for ticker, close, cap, change, name in zip(
+            df.index, df['종가'], df['시가총액'], df['등락률'], df['종목명']
+        )
+    ]
+
+    created, updated = apply_stock_rows(rows)
+    count = len(rows)
+    changed = len(created) + len(updated)
+    report_progress('KR', total, total, f'{date_str} 기준 저장 완료')
+
+    return True, f'국내 주식 {count}개 갱신 완료 (변경 {changed}개)', count, changed
+
+
+# ============================================================
+# 해외 주식: S&P 500 구성 종목 (디스크 캐시) / 시세 일괄 조회
+# ============================================================
+SP500_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+
+def _sp500_cache_path() -> Path:
+    return Path(getattr(settings, 'STOCK_CACHE_DIR', '.cache/stocks')) / 'sp500.json'
+
+
+def get_sp500_constituents() -> list:
+    """
+    S&P 500 구성 종목 [(symbol, name, sector), ...]
+    - 디스크 캐시가 STOCK_SP500_CACHE_TTL초 이내면 Wikipedia 요청 없이 사용
+    - Wikipedia 조회가 실패하면 만료된 캐시라도 사용
+    """
+    path = _sp500_cache_path()
+    ttl = getattr(settings, 'STOCK_SP500_CACHE_TTL', 86400)
+    cached = None
+    if path.exists():
+        try:
+            cached = json.loads(path.read_text(encoding='utf-8'))
+            if time.time() - path.stat().st_mtime < ttl:
+                return [tuple(row) for row in cached]
+        except (OSError, ValueError):
+            cached = None
+
+    try:
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        response = requests.get(SP500_URL, headers=headers, timeout=15)
+        response.raise_for_status()
+        sp500_df = pd.read_html(io.StringIO(response.text))[0]
+    except Exception:
+        if cached:
+            return [tuple(row) for row in cached]
+        raise
+
+    tickers_info = []
+    for _, row in sp500_df.iterrows():
+        symbol = row['Symbol'].replace('.', '-')  # BRK.B -> BRK-B
+        sector = row.get('GICS Sector', '')
+        tickers_info.append((symbol, row['Security'], sector if isinstance(sector, str) else ''))
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(tickers_info, ensure_ascii=False), encoding='utf-8')
+        tmp.replace(path)
+    except OSError as e:
+        print(f"[STOCK REFRESH] S&P 500 캐시 저장 실패: {e}")
+
+    return tickers_info
+
+
+def _fetch_quote_batch(symbols: list) -> dict:
+    """
+    Yahoo quote API로 여러 종목 시세를 요청 1번에 조회 (실패 시 지수 백오프 재시도)
+    반환: {symbol: {'price', 'previous_close', 'market_cap', 'open', 'day_high', 'day_low', 'volume'}}
+          재시도까지 모두 실패하면 None
+    """
+    retries = getattr(settings, 'STOCK_QUOTE_RETRIES', 3)
+    params = {'symbols': ','.join(symbols), 'formatted': 'false'}
+
+    for attempt in range(retries + 1):
+        try:
+            data = YfData().get_raw_json(YAHOO_QUOTE_URL, params=params, timeout=15)
+            quotes = {}
+            for q in (data.get('quoteResponse') or {}).get('result') or []:
+                price = q.get('regularMarketPrice')
+                if q.get('symbol') and price:
+                    quotes[q['symbol']] = {
+                        'price': price,
+                        'previous_close': q.get('regularMarketPreviousClose'),
+                        'market_cap': q.get('marketCap') or 0,
+                        'open': q.get('regularMarketOpen'),
+                        'day_high': q.get('regularMarketDayHigh'),
+                        'day_low': q.get('regularMarketDayLow'),
+                        'volume': q.get('regularMarketVolume'),
+                    }
+            return quotes
+        except Exception as e:
+            if attempt == retries:
+                print(f"[STOCK REFRESH] 시세 조회 실패 ({symbols[0]} 외 {len(symbols) - 1}개): {e}")
+                return None
+            # 0.5초, 1초, 2초 ... + 지터
+            time.sleep(0.5 * (2 ** attempt) + random.uniform(0, 0.5))
+
+
+def fetch_quote_batches(symbols: list, on_batch=None) -> tuple:
+    """
+    종목 시세 일괄 조회
+    - STOCK_QUOTE_BATCH_SIZE개씩 묶어 STOCK_QUOTE_WORKERS개 스레드에서 동시에 요청
+    - on_batch(처리한 종목 수): 배치가 끝날 때마다 호출 (진행률 기록용)
+    반환: (시세 dict, 실패한 배치 수)
+    """
+    batch_size = getattr(settings, 'STOCK_QUOTE_BATCH_SIZE', 100)
+    workers = getattr(settings, 'STOCK_QUOTE_WORKERS', 4)
+    batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+
+    quotes, done, failed = {}, 0, 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='stock-quote') as ex:
+        futures = {ex.submit(_fetch_quote_batch, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            result = future.result()
+            if result is None:
+                failed += 1
+            else:
+                quotes.update(result)
+            done += len(futures[future])
+            if on_batch:
+                on_batch(done)
+    return quotes, failed
+
+
+def fetch_us_quotes(symbols: list, on_batch=None) -> dict:
+    """종목 시세 일괄 조회 (실패한 배치는 빠진 채로 반환)"""
+    quotes, _ = fetch_quote_batches(symbols, on_batch)
+    return quotes
+
+
+def refresh_us_stocks():
+    """
+    해외 주식 데이터 갱신 (Wikipedia S&P 500 + Yahoo 시세 일괄 조회)
+    모든 종목의 가격, 등락율을 업데이트
+    반환: (성공 여부, 메시지, 종목 수, 변경 종목 수)
+    """
+    tickers_info = get_sp500_constituents()
+
+    # 1단계: 전체 종목 기본 정보 저장 (바뀐 종목만)
+    created, updated = apply_stock_rows([
+        {'symbol': symbol, 'code': symbol, 'name': name, 'market': 'US', 'sector': sector}
+        for symbol, name, sector in tickers_info
+    ])
+
+    # 2단계: 모든 종목 가격/등락율 조회 (배치 병렬) 후 한 번에 저장
+    all_symbols = [t[0] for t in tickers_info]
+    symbol_set = set(all_symbols)
+    total = len(all_symbols)
+    quotes, failed_batches = fetch_quote_batches(
+        all_symbols, on_batch=lambda done: report_progress('US', done, total, '가격 조회 중')
+    )
+
+    price_rows = [
+        {
+            'symbol': symbol,
+            'current_price': round(q['price'], 2),
+            'change_percent': calculate_change_percent(q['price'], q['previous_close']),
+            'market_cap': q['market_cap'],
+        }
+        for symbol, q in quotes.items()
+        if symbol in symbol_set
+    ]
+    _, price_updated = apply_stock_rows(price_rows)
+    changed_symbols = set(created) | set(updated) | set(price_updated)
+
+    # 시세를 거의 못 받았으면 (Yahoo 장애 등) 실패로 기록 → last_updated를 찍지 않고 재시도 백오프
+    min_coverage = getattr(settings, 'STOCK_QUOTE_MIN_COVERAGE', 0.5)
+    if not price_rows or len(price_rows) < total * min_coverage:
+        return (
+            False,
+            f'해외 시세 조회 실패 ({len(price_rows)}/{total}개 수신, 실패 배치 {failed_batches}개)',
+            len(tickers_info),
+            len(changed_symbols),
+        )
+
+    message = f'해외 주식 {len(tickers_info)}개 갱신 완료 ({len(price_rows)}개 가격 업데이트)'
+    if failed_batches:
+        message += f' - 실패 배치 {failed_batches}개'
+    return True, message, len(tickers_info), len(changed_symbols)
+
+
+REFRESHERS = {
+    'KR': refresh_kr_stocks,
+    'US': refresh_us_stocks,
+}
+
+
+def run_refresh(market: str):
+    """
+    잠금을 잡고 시장 데이터 갱신 후 결과 기록
+    반환: (성공 여부, 메시지, 종목 수)
+    """
+    if not acquire_refresh_lock(market):
+        return False, '이미 갱신 중입니다.', 0
+
+    try:
+        success, message, count, changed = REFRESHERS[market]()
+    except Exception as e:
+        release_refresh_lock(
+            market, status='failed', failed_at=timezone.now(), message=f'갱신 오류: {str(e)}'[:200]
+        )
+        return False, f'갱신 오류: {str(e)}', 0
+
+    if success:
+        release_refresh_lock(
+            market, status='success', last_updated=timezone.now(), failed_at=None,
+            stock_count=count, changed_count=changed, message=message[:200],
+        )
+        try:
+            rebuild_search_index()
+        except Exception as e:
+            print(f"[STOCK REFRESH] 검색 인덱스 갱신 실패: {e}")
+    else:
+        release_refresh_lock(market, status='failed', failed_at=timezone.now(), message=message[:200])
+
+    print(f"[STOCK REFRESH] {market}: {message}")
+    return success, message, count
@@ -0,0 +1,160 @@
+"""
+stocks/scheduler.py
+주식 데이터 주기 갱신 스케줄러
+
+주요 기능:
+- 시장별 주기 갱신 (settings.STOCK_REFRESH_INTERVAL_KR / _US)
+- 수동 갱신 요청 큐 (StockDataUpdate.requested_at) : request_refresh
+- 갱신 대상 시장 계산 및 실행 : due_markets, run_pending
+- 데몬 루프 : StockRefreshScheduler (python manage.py run_stock_refresher)
+
+실행 방식 (settings.STOCK_REFRESH_BACKEND):
+- "thread": 갱신 요청 시 웹 프로세스의 백그라운드 스레드에서 바로 실행
+- "daemon": 요청은 큐에만 등록, run_stock_refresher 프로세스가 실행
+같은 시장이 동시에 갱신되지 않도록 refresh.run_refresh의 DB 잠금을 항상 거칩니다.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import StockDataUpdate
+from .refresh import run_refresh
+
+
+MARKETS = ('KR', 'US')
+
+
+def refresh_interval(market: str) -> int:
+    """시장별 주기 갱신 간격(초)"""
+    return getattr(settings, f'STOCK_REFRESH_INTERVAL_{market}', 1800)
+
+
+def retry_backoff(market: str) -> int:
+    """실패 후 주기 갱신 재시도까지 대기(초) - 갱신 간격보다 길지 않게"""
+    return min(getattr(settings, 'STOCK_REFRESH_RETRY_BACKOFF', 300), refresh_interval(market))
+
+
+def is_locked(record, now=None) -> bool:
+    now = now or timezone.now()
+    return record.locked_until is not None and record.locked_until >= now
+
+
+def due_markets(now=None) -> list:
+    """
+    지금 갱신해야 하는 시장 목록
+    - 수동 요청(requested_at)이 있거나
+    - 마지막 갱신 후 주기가 지났거나 (한 번도 갱신 안 했으면 바로)
+    - 다른 곳에서 갱신 중(잠금 유효)인 시장은 제외
+    - 최근 실패한 시장은 STOCK_REFRESH_RETRY_BACKOFF초 동안 주기 갱신 제외 (수동 요청은 실행)
+    """
+    now = now or timezone.now()
+    records = {r.market: r for r in StockDataUpdate.objects.all()}
+
+    due = []
+    for market in MARKETS:
+        record = records.get(market)
+        if record is None:
+            due.append(market)
+            continue
+        if is_locked(record, now):
+            continue
+        if record.requested_at is not None:
+            due.append(market)
+        elif record.failed_at and now - record.failed_at < timedelta(seconds=retry_backoff(market)):
+            continue
+        elif record.last_updated is None:
+            due.append(market)
+        elif now - record.last_updated >= timedelta(seconds=refresh_interval(market)):
+            due.append(market)
+    return due
+
+
+def run_pending(now=None) -> dict:
+    """갱신 대상 시장을 차례로 갱신, 반환: {market: (성공 여부, 메시지, 종목 수)}"""
+    return {market: run_refresh(market) for market in due_markets(now)}
+
+
+# ============================================================
+# 수동 갱신 요청 (HTTP 엔드포인트용)
+# ============================================================
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """시장별로 1개씩 돌 수 있도록 스레드 2개"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=len(MARKETS), thread_name_prefix='stock-refresh'
+                )
+    return _executor
+
+
+def _run_requested(market: str) -> None:
+    close_old_connections()
+    try:
+        # 그 사이 데몬/다른 스레드가 처리했으면 건너뜀
+        if StockDataUpdate.objects.filter(market=market, requested_at__isnull=False).exists():
+            run_refresh(market)
+    except Exception as e:
+        print(f"[STOCK REFRESH] {market} 갱신 실패: {e}")
+    finally:
+        close_old_connections()
+
+
+def request_refresh(market: str) -> StockDataUpdate:
+    """
+    갱신 요청 등록 (바로 반환)
+    - 이미 갱신 중이면 새로 등록하지 않음
+    - thread 백엔드면 백그라운드 스레드에 작업 전달
+    """
+    record, _ = StockDataUpdate.objects.get_or_create(market=market, defaults={'last_updated': None})
+    if is_locked(record):
+        return record
+
+    record.requested_at = timezone.now()
+    record.save(update_fields=['requested_at'])
+
+    if getattr(settings, 'STOCK_REFRESH_BACKEND', 'thread') == 'thread':
+        _get_executor().submit(_run_requested, market)
+    return record
+
+
+# ============================================================
+# 데몬 루프
+# ============================================================
+class StockRefreshScheduler:
+    """
+    tick초마다 갱신 대상 시장을 확인해서 실행
+    stop() 호출 시 다음 tick 전에 종료
+    """
+
+    def __init__(self, tick: float = 10.0):
+        self.tick = tick
+        self._stop = threading.Event()
+
+    def run_once(self) -> dict:
+        close_old_connections()
+        try:
+            return run_pending()
+        finally:
+            close_old_connections()
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"[STOCK SCHEDULER] 오류: {e}")
+            self._stop.wait(self.tick)
+
+    def stop(self) -> None:
+        self._stop.set()
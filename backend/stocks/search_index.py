@@ -0,0 +1,212 @@
+"""
+stocks/search_index.py
+종목 검색용 프로세스 내 인덱스 (Stock.name / code / symbol)
+
+주요 기능:
+- 접두/부분 일치 : 전체 키를 줄 단위로 이어붙인 문자열에서 str.find로 검색
+- 초성 검색 : "ㅅㅅㅈㅈ" → 삼성전자
+- 오타 허용 : 바이그램으로 후보를 추린 뒤 편집 거리(1~2) 확인
+- 정렬 : 일치 단계(정확 > 접두 > 부분 > 초성 > 오타) → 시가총액순
+- 주식 데이터 갱신(refresh.run_refresh) 후 다시 만들고,
+  다른 프로세스에서 갱신한 경우도 StockDataUpdate 기록을 주기적으로 비교해서 반영
+"""
+
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter
+
+from .models import Stock, StockDataUpdate
+
+
+# 다른 프로세스의 갱신 여부 확인 간격(초)
+VERSION_CHECK_INTERVAL = 30
+
+# 오타 허용 검색에서 편집 거리를 확인할 최대 후보 수
+TYPO_CANDIDATES = 100
+
+# 일치 단계 (작을수록 상위)
+EXACT, PREFIX, INFIX, CHOSUNG, TYPO = range(5)
+
+CHOSUNG_LIST = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+CHOSUNG_SET = set(CHOSUNG_LIST)
+
+
+def normalize(text: str) -> str:
+    return ''.join((text or '').lower().split())
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절 → 초성 (한글이 아닌 문자는 그대로)"""
+    chars = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        chars.append(CHOSUNG_LIST[code // 588] if 0 <= code < 11172 else ch)
+    return ''.join(chars)
+
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def prefix_distance(query: str, key: str, max_dist: int) -> int:
+    """query와 key 앞부분 사이의 최소 편집 거리 (max_dist 초과면 max_dist + 1)"""
+    prev = list(range(len(key) + 1))
+    for i, qc in enumerate(query, 1):
+        cur = [i] + [0] * len(key)
+        for j, kc in enumerate(key, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (qc != kc))
+        if min(cur) > max_dist:
+            return max_dist + 1
+        prev = cur
+    return min(prev)
+
+
+class StockSearchIndex:
+    """
+    종목 검색 인덱스 (만든 뒤에는 읽기 전용, 갱신은 새 인덱스로 교체)
+
+    entries: 시가총액 내림차순 (symbol, code, name, market)
+    키 종류: 이름, 코드, 심볼, 이름 초성
+    """
+
+    def __init__(self, rows, version=None):
+        self.version = version
+        self.entries = [(symbol, code, name, market) for symbol, code, name, market, _ in rows]
+
+        keys, owners, kinds = [], [], []
+        self._exact = {}
+        self._bigram_index = {}
+        for idx, (symbol, code, name, _) in enumerate(self.entries):
+            name_key = normalize(name)
+            chosung = to_chosung(name_key)
+            for kind, key in (('name', name_key), ('code', normalize(code)), ('symbol', normalize(symbol)),
+                              ('chosung', chosung if chosung != name_key else '')):
+                if key:
+                    keys.append(key)
+                    owners.append(idx)
+                    kinds.append(kind)
+                    if kind != 'chosung':
+                        self._exact.setdefault(key, []).append(idx)
+            for gram in _bigrams(name_key) | _bigrams(normalize(symbol)):
+                self._bigram_index.setdefault(gram, []).append(idx)
+
+        self._keys, self._owners, self._kinds = keys, owners, kinds
+        # 줄 시작 위치 (blob 위치 → 키 번호)
+        self._starts = []
+        pos = 0
+        for key in keys:
+            self._starts.append(pos)
+            pos += len(key) + 1
+        self._blob = '\n'.join(keys)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _substring_matches(self, q: str, chosung_only: bool, limit: int) -> dict:
+        """
+        {entry idx: 최고 단계} (정확/접두/부분 일치)
+        키가 시가총액순으로 이어져 있어서 접두 일치가 limit개 모이면 더 볼 필요 없음
+        """
+        best = {idx: EXACT for idx in self._exact.get(q, ())} if not chosung_only else {}
+        top = len(best)
+        blob, starts = self._blob, self._starts
+        pos = blob.find(q)
+        while pos != -1 and top < limit:
+            k = bisect_right(starts, pos) - 1
+            kind = self._kinds[k]
+            if (kind == 'chosung') == chosung_only:
+                at_start = pos == starts[k]
+                tier = CHOSUNG if kind == 'chosung' else (PREFIX if at_start else INFIX)
+                idx = self._owners[k]
+                prev = best.get(idx, TYPO + 1)
+                if tier < prev:
+                    best[idx] = tier
+                    if tier <= PREFIX or chosung_only:
+                        top += prev > PREFIX
+            pos = blob.find(q, pos + 1)
+        return best
+
+    def _typo_matches(self, q: str, exclude) -> dict:
+        max_dist = 1 if len(q) <= 5 else 2
+        grams = _bigrams(q)
+        need = max(1, len(grams) - 2 * max_dist)
+        counts = Counter(idx for gram in grams for idx in self._bigram_index.get(gram, ()))
+
+        found = {}
+        for idx, shared in counts.most_common(TYPO_CANDIDATES):
+            if shared < need:
+                break
+            if idx in exclude:
+                continue
+            symbol, _, name, _ = self.entries[idx]
+            for key in (normalize(name), normalize(symbol)):
+                if prefix_distance(q, key[:len(q) + max_dist], max_dist) <= max_dist:
+                    found[idx] = TYPO
+                    break
+        return found
+
+    def exact(self, text: str) -> list:
+        """이름/코드/심볼이 정확히 일치하는 종목 (symbol, code, name, market) 목록"""
+        return [self.entries[idx] for idx in self._exact.get(normalize(text), ())]
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """(symbol, code, name, market) 목록, 일치 단계 → 시가총액순"""
+        q = normalize(query)
+        if not q:
+            return []
+
+        chosung_only = all(ch in CHOSUNG_SET for ch in q)
+        matches = self._substring_matches(q, chosung_only, limit)
+        # 종목코드(숫자)는 오타 허용 안 함
+        if len(matches) < limit and len(q) >= 3 and not chosung_only and not q.isdigit():
+            matches.update(self._typo_matches(q, matches))
+
+        ranked = sorted(matches.items(), key=lambda item: (item[1], item[0]))[:limit]
+        return [self.entries[idx] for idx, _ in ranked]
+
+
+# ============================================================
+# 프로세스 싱글톤
+# ============================================================
+_index = None
+_checked_at = 0.0
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+
+def _data_version():
+    """주식 데이터 갱신 기록 (다른 프로세스에서 갱신했는지 비교용)"""
+    return tuple(StockDataUpdate.objects.order_by('market').values_list('market', 'last_updated', 'stock_count'))
+
+
+def rebuild_index() -> StockSearchIndex:
+    global _index, _checked_at
+    version = _data_version()
+    rows = Stock.objects.order_by('-market_cap').values_list('symbol', 'code', 'name', 'market', 'market_cap')
+    index = StockSearchIndex(rows, version=version)
+    with _lock:
+        _index, _checked_at = index, time.monotonic()
+    print(f"[STOCK SEARCH] 검색 인덱스 갱신 ({len(index)}개 종목)")
+    return index
+
+
+def get_index() -> StockSearchIndex:
+    """인덱스 반환 (처음이거나 다른 프로세스에서 데이터가 갱신됐으면 다시 만듦)"""
+    global _checked_at
+    index = _index
+    if index is None:
+        with _build_lock:
+            if _index is None:
+                rebuild_index()
+        return _index
+
+    if time.monotonic() - _checked_at >= VERSION_CHECK_INTERVAL:
+        _checked_at = time.monotonic()
+        if _data_version() != index.version:
+            return rebuild_index()
+    return index
+
+
+def search(query: str, limit: int = 10) -> list:
+    return get_index().search(query, limit)
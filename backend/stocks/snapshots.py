@@ -0,0 +1,213 @@
+"""
+stocks/snapshots.py
+종목 상세 정보 스냅샷 (yfinance info 캐시)
+
+주요 기능:
+- 상세/뉴스/검색/북마크 API가 같은 스냅샷(StockInfoSnapshot)을 공유
+- 필드 그룹별 유지 시간 (settings.STOCK_SNAPSHOT_TTL_*)
+  · price: 짧게 → 시세만 만료되면 quote API로 시세만 갱신 (info 호출 없음)
+  · fundamentals / profile: 길게 → 만료되면 yf.Ticker(symbol).info 1번으로 전체 갱신
+- upstream 조회 실패 시 만료된 스냅샷이라도 있으면 그대로 사용
+- 시장별 시가총액 상위 종목 스냅샷 일괄 갱신 (warm_snapshots)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import yfinance as yf
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import Stock, StockInfoSnapshot
+from .refresh import calculate_change_percent, fetch_us_quotes
+
+
+GROUPS = ('price', 'fundamentals', 'profile')
+
+PRICE_FIELDS = ['current_price', 'previous_close', 'open_price', 'day_high', 'day_low', 'volume', 'market_cap']
+
+# quote API 응답 키 (refresh.fetch_us_quotes) → 스냅샷 필드
+QUOTE_FIELDS = {
+    'price': 'current_price', 'previous_close': 'previous_close', 'open': 'open_price',
+    'day_high': 'day_high', 'day_low': 'day_low', 'volume': 'volume', 'market_cap': 'market_cap',
+}
+
+
+def _ttl(group: str) -> int:
+    defaults = {'price': 60, 'fundamentals': 86400, 'profile': 604800}
+    return getattr(settings, f'STOCK_SNAPSHOT_TTL_{group.upper()}', defaults[group])
+
+
+def stale_groups(snap, groups=GROUPS, now=None) -> list:
+    """만료된 필드 그룹 목록 (스냅샷이 없으면 전부)"""
+    if snap is None:
+        return list(groups)
+    now = now or timezone.now()
+    stale = []
+    for group in groups:
+        fetched_at = getattr(snap, f'{group}_fetched_at')
+        if fetched_at is None or (now - fetched_at).total_seconds() >= _ttl(group):
+            stale.append(group)
+    return stale
+
+
+def _values_from_info(info: dict, symbol: str, now) -> dict:
+    """yfinance info → 스냅샷 필드 (모든 그룹)"""
+    return {
+        'current_price': info.get('regularMarketPrice') or info.get('currentPrice'),
+        'previous_close': info.get('previousClose') or info.get('regularMarketPreviousClose'),
+        'open_price': info.get('open') or info.get('regularMarketOpen'),
+        'day_high': info.get('dayHigh') or info.get('regularMarketDayHigh'),
+        'day_low': info.get('dayLow') or info.get('regularMarketDayLow'),
+        'volume': info.get('volume') or info.get('regularMarketVolume'),
+        'market_cap': info.get('marketCap'),
+        'avg_volume': info.get('averageVolume'),
+        'fifty_two_week_high': info.get('fiftyTwoWeekHigh'),
+        'fifty_two_week_low': info.get('fiftyTwoWeekLow'),
+        'pe_ratio': info.get('trailingPE'),
+        'eps': info.get('trailingEps'),
+        'dividend_yield': info.get('dividendYield'),
+        'beta': info.get('beta'),
+        'name': (info.get('longName') or info.get('shortName') or symbol)[:200],
+        'currency': info.get('currency'),
+        'exchange': info.get('exchange'),
+        'sector': info.get('sector'),
+        'industry': info.get('industry'),
+        'description': info.get('longBusinessSummary'),
+        'website': info.get('website'),
+        'logo_url': info.get('logo_url'),
+        'price_fetched_at': now,
+        'fundamentals_fetched_at': now,
+        'profile_fetched_at': now,
+    }
+
+
+def _apply_quote(snap: StockInfoSnapshot, quote: dict, now) -> None:
+    for key, field in QUOTE_FIELDS.items():
+        value = quote.get(key)
+        if value is not None:
+            setattr(snap, field, value)
+    snap.price_fetched_at = now
+
+
+def refresh_snapshot(symbol: str):
+    """info 1번 조회로 전체 그룹 갱신, 없는 종목이면 None"""
+    info = yf.Ticker(symbol).info
+    if not info or info.get('regularMarketPrice') is None:
+        return None
+    snap, _ = StockInfoSnapshot.objects.update_or_create(
+        symbol=symbol, defaults=_values_from_info(info, symbol, timezone.now())
+    )
+    return snap
+
+
+def get_snapshot(symbol: str, groups=GROUPS):
+    """
+    요청한 필드 그룹이 모두 유효한 스냅샷 반환 (없는 종목이면 None)
+    - 만료된 그룹이 price뿐이면 시세만 갱신
+    - 그 외에는 info로 전체 갱신
+    """
+    snap = StockInfoSnapshot.objects.filter(symbol=symbol).first()
+    stale = stale_groups(snap, groups)
+    if not stale:
+        return snap
+
+    try:
+        if snap is not None and stale == ['price']:
+            quote = fetch_us_quotes([symbol]).get(symbol)
+            if quote:
+                _apply_quote(snap, quote, timezone.now())
+                snap.save(update_fields=PRICE_FIELDS + ['price_fetched_at'])
+                return snap
+        return refresh_snapshot(symbol) or snap
+    except Exception as e:
+        if snap is None:
+            raise
+        print(f"[STOCK SNAPSHOT] {symbol} 갱신 실패, 이전 스냅샷 사용: {e}")
+        return snap
+
+
+def snapshot_detail(snap: StockInfoSnapshot) -> dict:
+    """스냅샷 → StockDetailSerializer 입력"""
+    current_price, previous_close = snap.current_price, snap.previous_close
+    change = (current_price - previous_close) if current_price and previous_close else None
+    return {
+        'symbol': snap.symbol,
+        'name': snap.name or snap.symbol,
+        'currency': snap.currency,
+        'exchange': snap.exchange,
+        'market_cap': snap.market_cap,
+        'current_price': current_price,
+        'previous_close': previous_close,
+        'open_price': snap.open_price,
+        'day_high': snap.day_high,
+        'day_low': snap.day_low,
+        'volume': snap.volume,
+        'avg_volume': snap.avg_volume,
+        'fifty_two_week_high': snap.fifty_two_week_high,
+        'fifty_two_week_low': snap.fifty_two_week_low,
+        'pe_ratio': snap.pe_ratio,
+        'eps': snap.eps,
+        'dividend_yield': snap.dividend_yield,
+        'beta': snap.beta,
+        'sector': snap.sector,
+        'industry': snap.industry,
+        'description': snap.description,
+        'website': snap.website,
+        'logo_url': snap.logo_url,
+        'change': round(change, 2) if change else None,
+        'change_percent': calculate_change_percent(current_price, previous_close),
+    }
+
+
+# ============================================================
+# 일괄 갱신 (시가총액 상위 N개)
+# ============================================================
+def _refresh_in_thread(symbol: str) -> bool:
+    close_old_connections()
+    try:
+        return refresh_snapshot(symbol) is not None
+    except Exception as e:
+        print(f"[STOCK SNAPSHOT] {symbol} 워밍 실패: {e}")
+        return False
+    finally:
+        close_old_connections()
+
+
+def warm_snapshots(limit: int = 50) -> dict:
+    """
+    시장별 시가총액 상위 종목 스냅샷 갱신 (Stock.top_symbols)
+    - fundamentals/profile이 만료된 종목: info 조회 (STOCK_QUOTE_WORKERS개 스레드)
+    - 시세만 만료된 종목: quote API 배치 조회 후 bulk_update
+    반환: {'full': info로 갱신한 수, 'price': 시세만 갱신한 수}
+    """
+    symbols = Stock.top_symbols(limit)
+    existing = {s.symbol: s for s in StockInfoSnapshot.objects.filter(symbol__in=symbols)}
+    now = timezone.now()
+
+    full, price_only = [], []
+    for symbol in symbols:
+        stale = stale_groups(existing.get(symbol), now=now)
+        if stale == ['price']:
+            price_only.append(symbol)
+        elif stale:
+            full.append(symbol)
+
+    price_count = 0
+    if price_only:
+        quotes = fetch_us_quotes(price_only)
+        snaps = []
+        for symbol, quote in quotes.items():
+            if symbol in existing:
+                _apply_quote(existing[symbol], quote, now)
+                snaps.append(existing[symbol])
+        StockInfoSnapshot.objects.bulk_update(snaps, PRICE_FIELDS + ['price_fetched_at'], batch_size=200)
+        price_count = len(snaps)
+
+    full_count = 0
+    if full:
+        workers = getattr(settings, 'STOCK_QUOTE_WORKERS', 4)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='stock-snapshot') as ex:
+            full_count = sum(ex.map(_refresh_in_thread, full))
+
+    return {'full': full_count, 'price': price_count}
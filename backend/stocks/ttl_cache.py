@@ -0,0 +1,103 @@
+"""
+stocks/ttl_cache.py
+프로세스 내 TTL 캐시 + single-flight
+
+주요 기능:
+- 키별 값과 조회 시각 보관, TTL이 지나면 다시 조회
+- 같은 키를 동시에 요청하면 1번만 조회하고 나머지는 그 결과를 기다림 (single-flight)
+- 조회 실패 시 예외를 그대로 전달 (실패 결과는 캐시하지 않음)
+- max_entries를 주면 저장할 때 만료된 항목부터, 그래도 넘치면 오래된 항목부터 삭제
+"""
+
+import threading
+import time
+
+
+class _Flight:
+    """진행 중인 조회 1건"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class TTLCache:
+    def __init__(self, ttl: float, max_entries: int = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data = {}  # key -> (value, fetched_at), 저장 순서 = 조회 시각 순서
+        self._flights = {}  # key -> _Flight
+        self._lock = threading.Lock()
+
+    def peek(self, key):
+        """캐시된 (값, 경과 초) 또는 None (만료 여부와 상관없이)"""
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, fetched_at = entry
+        return value, time.time() - fetched_at
+
+    def get(self, key, fetch, ttl: float = None):
+        """
+        (값, 경과 초) 반환
+        - TTL 이내면 캐시 값
+        - 아니면 fetch() 호출 (같은 키의 동시 요청은 하나의 fetch를 공유)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and time.time() - entry[1] < ttl:
+                return entry[0], time.time() - entry[1]
+
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, 0.0
+
+        try:
+            flight.value = fetch()
+            with self._lock:
+                self._store(key, flight.value)
+            return flight.value, 0.0
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def set(self, key, value) -> None:
+        """이미 조회한 값을 직접 저장"""
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key, value) -> None:
+        """저장 (self._lock 안에서 호출), 다시 넣어서 순서를 최신으로"""
+        now = time.time()
+        self._data.pop(key, None)
+        self._data[key] = (value, now)
+        if self.max_entries is None:
+            return
+        # 앞쪽(오래된 순)부터 만료된 항목 정리, 그래도 넘치면 가장 오래된 항목 삭제
+        while self._data:
+            oldest, (_, fetched_at) = next(iter(self._data.items()))
+            if oldest == key or (now - fetched_at < self.ttl and len(self._data) <= self.max_entries):
+                break
+            del self._data[oldest]
+
+    def refresh(self, key, fetch):
+        """TTL과 상관없이 다시 조회 (워머용)"""
+        return self.get(key, fetch, ttl=0)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
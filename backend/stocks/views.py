@@ -3,29 +3,31 @@ stocks/views.py
 주식 관련 API 뷰
 
 주요 기능:
-- 국내/해외 주식 데이터 DB 저장 및 조회
-- 데이터 갱신 API (가격, 등락율 포함)
+- 국내/해외 주식 데이터 DB 조회 (갱신 로직은 refresh.py / scheduler.py)
+- 데이터 갱신 요청 API (백그라운드 처리, 진행률 조회)
 - 북마크 주식 관리
-- 주식 검색, 상세정보, 차트, 뉴스
+- 주식 검색, 상세정보, 차트, 뉴스 (yfinance info는 snapshots.py 스냅샷 공유)
 """
 
 import yfinance as yf
 import requests
-import pandas as pd
 from django.conf import settings
-from django.db.models import Q
-from django.utils import timezone
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework import status
-from datetime import datetime, timedelta
-from openai import OpenAI
 from html import unescape
 from django.utils.html import strip_tags
-from pykrx import stock as pykrx_stock
+
+from finance import llm_gateway
 
 from .models import Stock, StockDataUpdate, BookmarkedStock
+from .refresh import calculate_change_percent
+from .scheduler import request_refresh, is_locked
+from . import indices as market_indices
+from .candles import get_chart_data
+from .snapshots import get_snapshot, snapshot_detail
+from . import search_index
 from .serializers import StockDetailSerializer, StockNewsSerializer, PopularStockSerializer
 
 
@@ -35,24 +37,6 @@ from .serializers import StockDetailSerializer, StockNewsSerializer, PopularStoc
 PAGE_SIZE = 20
 
 
-# ============================================================
-# 헬퍼 함수
-# ============================================================
-def get_openai_client():
-    """OpenAI API 클라이언트 생성"""
-    return OpenAI(
-        api_key=settings.OPENAI_API_KEY,
-        base_url=getattr(settings, "OPENAI_BASE_URL", None),
-    )
-
-
-def calculate_change_percent(current: float, previous: float) -> float:
-    """등락률 계산"""
-    if current and previous and previous != 0:
-        return round(((current - previous) / previous) * 100, 2)
-    return 0.0
-
-
 # ============================================================
 # 주요 시장 지표 API
 # ============================================================
@@ -61,223 +45,18 @@ def calculate_change_percent(current: float, previous: float) -> float:
 def get_market_indices(request):
     """
     주요 시장 지표 조회 (나스닥, S&P500, 환율 등)
-    실시간 데이터를 yfinance에서 가져옴
-    """
-    period = request.GET.get('period', '5d')
-    
-    indices = {
-        '^IXIC': {'name': '나스닥', 'symbol': 'NASDAQ'},
-        '^GSPC': {'name': 'S&P 500', 'symbol': 'S&P500'},
-        '^DJI': {'name': '다우존스', 'symbol': 'DOW'},
-        '^KS11': {'name': '코스피', 'symbol': 'KOSPI'},
-        '^KQ11': {'name': '코스닥', 'symbol': 'KOSDAQ'},
-        'KRW=X': {'name': '원/달러', 'symbol': 'USD/KRW'},
-        'GC=F': {'name': '금', 'symbol': 'GOLD'},
-        'BTC-USD': {'name': '비트코인', 'symbol': 'BTC'},
-    }
-    
-    result = []
-    for ticker_symbol, info in indices.items():
-        try:
-            ticker = yf.Ticker(ticker_symbol)
-            hist = ticker.history(period=period)
-            
-            if len(hist) >= 1:
-                current = hist['Close'].iloc[-1]
-                previous = hist['Close'].iloc[0] if len(hist) >= 2 else current
-                change = current - previous
-                change_percent = (change / previous * 100) if previous else 0
-                
-                # 미니 차트용 데이터 (최근 데이터 포인트들)
-                chart_data = [round(float(price), 2) for price in hist['Close'].tolist()[-20:]]
-                
-                result.append({
-                    'symbol': info['symbol'],
-                    'name': info['name'],
-                    'current_price': round(current, 2),
-                    'value': round(current, 2),
-                    'change': round(change, 2),
-                    'change_percent': round(change_percent, 2),
-                    'chart_data': chart_data,
-                })
-        except Exception as e:
-            print(f"Error fetching {ticker_symbol}: {e}")
-            continue
-    
-    return Response({'indices': result})
-
-
-# ============================================================
-# 데이터 갱신 함수 (국내/해외)
-# ============================================================
-def refresh_kr_stocks():
-    """국내 주식 데이터 갱신 (pykrx)"""
-    try:
-        update_record, _ = StockDataUpdate.objects.get_or_create(market='KR')
-        update_record.status = 'in_progress'
-        update_record.save()
-
-        # 최근 유효 거래일 찾기
-        today = datetime.today()
-        date_str, df_cap = None, None
-
-        for i in range(14):
-            check_date = (today - timedelta(days=i)).strftime("%Y%m%d")
-            try:
-                df = pykrx_stock.get_market_cap_by_ticker(check_date, market="ALL")
-                if df is not None and not df.empty:
-                    df_valid = df[(df['시가총액'] > 0) & (df['종가'] > 0)]
-                    if len(df_valid) > 100:
-                        date_str, df_cap = check_date, df_valid
-                        break
-            except Exception:
-                continue
-
-        if df_cap is None or df_cap.empty:
-            update_record.status = 'failed'
-            update_record.save()
-            return False, '유효한 거래일을 찾을 수 없습니다.', 0
-
-        # OHLCV 데이터 (등락률)
-        try:
-            df_ohlcv = pykrx_stock.get_market_ohlcv_by_ticker(date_str, market="ALL")
-        except Exception:
-            df_ohlcv = None
-
-        # 시가총액순 정렬 및 상위 500개
-        df_cap = df_cap.sort_values('시가총액', ascending=False).head(500)
-
-        # 종목명 조회
-        ticker_names = {}
-        for ticker in df_cap.index:
-            try:
-                name = pykrx_stock.get_market_ticker_name(ticker)
-                if name:
-                    ticker_names[ticker] = name
-            except Exception:
-                continue
-
-        # DB 저장
-        count = 0
-        for ticker in df_cap.index:
-            name = ticker_names.get(ticker)
-            if not name:
-                continue
-
-            change_percent = 0.0
-            if df_ohlcv is not None and ticker in df_ohlcv.index:
-                try:
-                    change_percent = float(df_ohlcv.loc[ticker, '등락률'])
-                except Exception:
-                    pass
-
-            Stock.objects.update_or_create(
-                symbol=f"{ticker}.KS",
-                defaults={
-                    'code': ticker,
-                    'name': name,
-                    'market': 'KR',
-                    'current_price': int(df_cap.loc[ticker, '종가']),
-                    'change_percent': round(change_percent, 2),
-                    'market_cap': int(df_cap.loc[ticker, '시가총액']),
-                }
-            )
-            count += 1
-
-        # 갱신 완료
-        update_record.last_updated = timezone.now()
-        update_record.stock_count = count
-        update_record.status = 'success'
-        update_record.save()
-
-        return True, f'국내 주식 {count}개 갱신 완료', count
-
-    except Exception as e:
-        StockDataUpdate.objects.filter(market='KR').update(status='failed')
-        return False, f'갱신 오류: {str(e)}', 0
-
-
-def refresh_us_stocks():
-    """
-    해외 주식 데이터 갱신 (Wikipedia S&P 500 + yfinance)
-    모든 종목의 가격, 등락율을 업데이트
+    yfinance 조회 결과를 (심볼, 기간)별로 짧게 캐시 (indices.py)
+    data_age: 가장 오래된 지표의 경과 시간(초)
     """
-    try:
-        update_record, _ = StockDataUpdate.objects.get_or_create(market='US')
-        update_record.status = 'in_progress'
-        update_record.save()
-
-        # Wikipedia에서 S&P 500 종목 목록 가져오기
-        url = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        tables = pd.read_html(response.text)
-        sp500_df = tables[0]
-
-        # 종목 정보 수집
-        tickers_info = []
-        for _, row in sp500_df.iterrows():
-            symbol = row['Symbol'].replace('.', '-')  # BRK.B -> BRK-B
-            name = row['Security']
-            sector = row.get('GICS Sector', '')
-            tickers_info.append((symbol, name, sector))
-
-        # 1단계: 전체 종목 기본 정보 저장
-        for symbol, name, sector in tickers_info:
-            Stock.objects.update_or_create(
-                symbol=symbol,
-                defaults={
-                    'code': symbol,
-                    'name': name,
-                    'market': 'US',
-                    'sector': sector,
-                }
-            )
-
-        # 2단계: 모든 종목 가격/등락율 업데이트 (배치 처리)
-        all_symbols = [t[0] for t in tickers_info]
-        batch_size = 50
-        updated_count = 0
-
-        for i in range(0, len(all_symbols), batch_size):
-            batch = all_symbols[i:i + batch_size]
-            batch_str = ' '.join(batch)
-
-            try:
-                tickers = yf.Tickers(batch_str)
-                for symbol in batch:
-                    try:
-                        info = tickers.tickers[symbol].info
-                        current_price = info.get('regularMarketPrice') or info.get('currentPrice')
-                        previous_close = info.get('previousClose')
-                        market_cap = info.get('marketCap', 0)
-
-                        if current_price:
-                            Stock.objects.filter(symbol=symbol).update(
-                                current_price=round(current_price, 2),
-                                change_percent=calculate_change_percent(current_price, previous_close),
-                                market_cap=market_cap or 0,
-                            )
-                            updated_count += 1
-                    except Exception:
-                        continue
-            except Exception:
-                continue
-
-        # 갱신 완료
-        update_record.last_updated = timezone.now()
-        update_record.stock_count = len(tickers_info)
-        update_record.status = 'success'
-        update_record.save()
+    period = request.GET.get('period', market_indices.DEFAULT_PERIOD)
+    if period not in market_indices.VALID_PERIODS:
+        return Response({'error': '유효하지 않은 기간입니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        return True, f'해외 주식 {len(tickers_info)}개 갱신 완료 ({updated_count}개 가격 업데이트)', len(tickers_info)
+    market_indices.ensure_warmer()
+    result = market_indices.get_market_indices(period)
+    data_age = max((item['data_age'] for item in result), default=None)
 
-    except Exception as e:
-        StockDataUpdate.objects.filter(market='US').update(status='failed')
-        return False, f'갱신 오류: {str(e)}', 0
+    return Response({'indices': result, 'data_age': data_age})
 
 
 # ============================================================
@@ -317,7 +96,7 @@ def get_kr_stocks(request):
         'market': 'KR', 'count': len(stocks_data), 'total_count': total_count,
         'page': page, 'total_pages': (total_count + size - 1) // size,
         'stocks': stocks_data,
-        'last_updated': update_info.last_updated.isoformat() if update_info else None,
+        'last_updated': update_info.last_updated.isoformat() if update_info and update_info.last_updated else None,
     })
 
 
@@ -356,44 +135,66 @@ def get_us_stocks(request):
         'market': 'US', 'count': len(stocks_data), 'total_count': total_count,
         'page': page, 'total_pages': (total_count + size - 1) // size,
         'stocks': stocks_data,
-        'last_updated': update_info.last_updated.isoformat() if update_info else None,
+        'last_updated': update_info.last_updated.isoformat() if update_info and update_info.last_updated else None,
     })
 
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def refresh_stocks(request):
-    """주식 데이터 갱신 API"""
+    """
+    주식 데이터 갱신 요청 API
+    갱신은 백그라운드(스케줄러)에서 처리하고 바로 202 반환
+    → GET /api/stocks/update-status/ 로 진행률 확인
+    """
     market = request.data.get('market', '').upper()
 
     if market not in ['KR', 'US']:
         return Response({'error': 'market은 KR 또는 US여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
-    if market == 'KR':
-        success, message, count = refresh_kr_stocks()
+    record = request_refresh(market)
+    if is_locked(record):
+        message = '이미 갱신 중입니다.'
     else:
-        success, message, count = refresh_us_stocks()
+        message = '갱신 요청이 등록되었습니다.'
+
+    return Response(
+        {'success': True, 'queued': True, 'message': message, 'status': _update_status_data(record)},
+        status=status.HTTP_202_ACCEPTED,
+    )
+
 
-    if success:
-        return Response({'success': True, 'message': message, 'count': count})
+def _update_status_data(update_info):
+    """StockDataUpdate → 갱신 상태 응답"""
+    if update_info.requested_at and not is_locked(update_info):
+        state = 'queued'
     else:
-        return Response({'success': False, 'message': message}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        state = update_info.status
+
+    return {
+        'last_updated': update_info.last_updated.isoformat() if update_info.last_updated else None,
+        'stock_count': update_info.stock_count,
+        'status': state,
+        'progress': update_info.progress,
+        'total': update_info.total,
+        'changed_count': update_info.changed_count,
+        'message': update_info.message,
+        'requested_at': update_info.requested_at.isoformat() if update_info.requested_at else None,
+        'started_at': update_info.started_at.isoformat() if update_info.started_at else None,
+    }
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_update_status(request):
-    """데이터 갱신 상태 조회 API"""
+    """데이터 갱신 상태 조회 API (진행률 포함)"""
     result = {}
+    records = {r.market: r for r in StockDataUpdate.objects.all()}
 
     for market in ['KR', 'US']:
-        update_info = StockDataUpdate.objects.filter(market=market).first()
+        update_info = records.get(market)
         if update_info:
-            result[market] = {
-                'last_updated': update_info.last_updated.isoformat(),
-                'stock_count': update_info.stock_count,
-                'status': update_info.status,
-            }
+            result[market] = _update_status_data(update_info)
         else:
             result[market] = {'last_updated': None, 'stock_count': 0, 'status': 'never'}
 
@@ -408,31 +209,26 @@ def search_stocks(request):
     if not query:
         return Response({"error": "검색어를 입력해주세요."}, status=status.HTTP_400_BAD_REQUEST)
 
-    results = []
-
-    # DB에서 검색
-    db_results = Stock.objects.filter(
-        Q(name__icontains=query) | Q(code__icontains=query) | Q(symbol__icontains=query)
-    ).order_by('-market_cap')[:10]
-
-    for stock in db_results:
-        results.append({
-            "symbol": stock.symbol, "name": stock.name,
-            "exchange": "KRX" if stock.market == 'KR' else "NYSE/NASDAQ",
-            "type": "EQUITY", "market": stock.market,
-        })
+    # 프로세스 내 검색 인덱스 (접두/부분/초성/오타 허용, 시가총액순)
+    results = [
+        {
+            "symbol": symbol, "name": name,
+            "exchange": "KRX" if market == 'KR' else "NYSE/NASDAQ",
+            "type": "EQUITY", "market": market,
+        }
+        for symbol, _, name, market in search_index.search(query, limit=10)
+    ]
 
-    # DB에 없으면 yfinance 검색
+    # 인덱스에 없으면 yfinance 검색
     if len(results) < 5:
         if query.isdigit() and len(query) == 6:
             for suffix in [".KS", ".KQ"]:
                 try:
-                    info = yf.Ticker(f"{query}{suffix}").info
-                    if info.get("regularMarketPrice"):
+                    snap = get_snapshot(f"{query}{suffix}", groups=('profile',))
+                    if snap and snap.current_price:
                         results.append({
-                            "symbol": f"{query}{suffix}",
-                            "name": info.get("longName") or info.get("shortName"),
-                            "exchange": info.get("exchange", "KRX"), "type": "EQUITY",
+                            "symbol": snap.symbol, "name": snap.name,
+                            "exchange": snap.exchange or "KRX", "type": "EQUITY",
                         })
                         break
                 except Exception:
@@ -475,26 +271,19 @@ def bookmarked_stocks(request):
                 })
             else:
                 try:
-                    info = yf.Ticker(bookmark.symbol).info
-                    current_price = info.get('regularMarketPrice') or info.get('currentPrice')
-                    previous_close = info.get('previousClose')
-
-                    stocks.append({
-                        'symbol': bookmark.symbol,
-                        'code': bookmark.symbol.replace('.KS', '').replace('.KQ', ''),
-                        'name': bookmark.name, 'current_price': current_price,
-                        'change_percent': calculate_change_percent(current_price, previous_close),
-                        'market': 'KR' if '.KS' in bookmark.symbol or '.KQ' in bookmark.symbol else 'US',
-                        'bookmarked_at': bookmark.created_at.isoformat(),
-                    })
+                    snap = get_snapshot(bookmark.symbol, groups=('price',))
                 except Exception:
-                    stocks.append({
-                        'symbol': bookmark.symbol,
-                        'code': bookmark.symbol.replace('.KS', '').replace('.KQ', ''),
-                        'name': bookmark.name, 'current_price': None, 'change_percent': None,
-                        'market': 'KR' if '.KS' in bookmark.symbol or '.KQ' in bookmark.symbol else 'US',
-                        'bookmarked_at': bookmark.created_at.isoformat(),
-                    })
+                    snap = None
+
+                current_price = snap.current_price if snap else None
+                stocks.append({
+                    'symbol': bookmark.symbol,
+                    'code': bookmark.symbol.replace('.KS', '').replace('.KQ', ''),
+                    'name': bookmark.name, 'current_price': current_price,
+                    'change_percent': calculate_change_percent(current_price, snap.previous_close) if snap else None,
+                    'market': 'KR' if '.KS' in bookmark.symbol or '.KQ' in bookmark.symbol else 'US',
+                    'bookmarked_at': bookmark.created_at.isoformat(),
+                })
 
         return Response({'count': len(stocks), 'stocks': stocks})
 
@@ -514,8 +303,8 @@ def bookmarked_stocks(request):
                 name = db_stock.name
             else:
                 try:
-                    info = yf.Ticker(symbol).info
-                    name = info.get('longName') or info.get('shortName') or symbol
+                    snap = get_snapshot(symbol, groups=('profile',))
+                    name = (snap.name if snap else '') or symbol
                 except Exception:
                     name = symbol
 
@@ -635,44 +424,12 @@ def get_popular_stocks(request):
 def get_stock_detail(request, symbol):
     """주식 종목 상세 정보 조회"""
     try:
-        info = yf.Ticker(symbol).info
+        snap = get_snapshot(symbol)
 
-        if not info or info.get('regularMarketPrice') is None:
+        if snap is None or snap.current_price is None:
             return Response({'error': '종목을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
-        current_price = info.get('regularMarketPrice') or info.get('currentPrice')
-        previous_close = info.get('previousClose') or info.get('regularMarketPreviousClose')
-        change = (current_price - previous_close) if current_price and previous_close else None
-
-        data = {
-            'symbol': info.get('symbol', symbol),
-            'name': info.get('longName') or info.get('shortName', symbol),
-            'currency': info.get('currency'),
-            'exchange': info.get('exchange'),
-            'market_cap': info.get('marketCap'),
-            'current_price': current_price,
-            'previous_close': previous_close,
-            'open_price': info.get('open') or info.get('regularMarketOpen'),
-            'day_high': info.get('dayHigh') or info.get('regularMarketDayHigh'),
-            'day_low': info.get('dayLow') or info.get('regularMarketDayLow'),
-            'volume': info.get('volume') or info.get('regularMarketVolume'),
-            'avg_volume': info.get('averageVolume'),
-            'fifty_two_week_high': info.get('fiftyTwoWeekHigh'),
-            'fifty_two_week_low': info.get('fiftyTwoWeekLow'),
-            'pe_ratio': info.get('trailingPE'),
-            'eps': info.get('trailingEps'),
-            'dividend_yield': info.get('dividendYield'),
-            'beta': info.get('beta'),
-            'sector': info.get('sector'),
-            'industry': info.get('industry'),
-            'description': info.get('longBusinessSummary'),
-            'website': info.get('website'),
-            'logo_url': info.get('logo_url'),
-            'change': round(change, 2) if change else None,
-            'change_percent': calculate_change_percent(current_price, previous_close),
-        }
-
-        serializer = StockDetailSerializer(data)
+        serializer = StockDetailSerializer(snapshot_detail(snap))
         return Response(serializer.data)
 
     except Exception as e:
@@ -695,23 +452,12 @@ def get_stock_chart(request, symbol):
         return Response({'error': '유효하지 않은 간격입니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        hist = yf.Ticker(symbol).history(period=period, interval=interval)
+        # 일/주/월봉은 로컬 캔들 저장소에서 기간만 잘라서 응답 (candles.py)
+        chart_data = get_chart_data(symbol, period, interval)
 
-        if hist.empty:
+        if not chart_data:
             return Response({'error': '차트 데이터를 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
-        chart_data = [
-            {
-                'date': date.isoformat(),
-                'open': round(row['Open'], 2) if row['Open'] else None,
-                'high': round(row['High'], 2) if row['High'] else None,
-                'low': round(row['Low'], 2) if row['Low'] else None,
-                'close': round(row['Close'], 2) if row['Close'] else None,
-                'volume': int(row['Volume']) if row['Volume'] else 0,
-            }
-            for date, row in hist.iterrows()
-        ]
-
         return Response({'symbol': symbol, 'period': period, 'interval': interval, 'data': chart_data})
 
     except Exception as e:
@@ -723,15 +469,14 @@ def get_stock_chart(request, symbol):
 def get_stock_news(request, symbol):
     """주식 종목 관련 뉴스 조회"""
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        stock_name = info.get('longName') or info.get('shortName', symbol)
+        snap = get_snapshot(symbol, groups=('profile',))
+        stock_name = (snap.name if snap else '') or symbol
 
         naver_client_id = getattr(settings, 'NAVER_CLIENT_ID', None)
         naver_client_secret = getattr(settings, 'NAVER_CLIENT_SECRET', None)
 
         if not naver_client_id or not naver_client_secret:
-            news = ticker.news or []
+            news = yf.Ticker(symbol).news or []
             news_list = [
                 {
                     'title': item.get('title'),
@@ -780,10 +525,8 @@ def translate_description(request):
         return Response({'error': '번역할 텍스트가 없습니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        client = get_openai_client()
-
-        response = client.chat.completions.create(
-            model=getattr(settings, "OPENAI_MODEL", "gpt-4.1-mini"),
+        response = llm_gateway.chat_completion(
+            cache="translate_description",
             messages=[
                 {
                     "role": "system",
@@ -9,6 +9,7 @@
  * @API엔드포인트
  *   - GET /api/chatbot/suggestions/ : 추천 질문 목록
  *   - POST /api/chatbot/ : 챗봇 메시지 전송
+ *   - POST /api/chatbot/stream/ : 챗봇 메시지 전송 (Server-Sent Events 스트리밍)
  *   - POST /api/chatbot/bank-search/ : 위치 기반 은행 검색
  */
 
@@ -33,6 +34,9 @@ export const useChatbotStore = defineStore('chatbot', () => {
   /** @type {Ref<boolean>} AI 응답 대기 중 상태 */
   const isLoading = ref(false)
   
+  /** @type {Ref<boolean>} AI 응답 스트리밍 중 상태 (응답 말풍선이 이미 표시됨) */
+  const isStreaming = ref(false)
+  
   /** @type {Ref<Array>} 추천 질문 목록 */
   const suggestions = ref([])
   
@@ -79,9 +83,44 @@ export const useChatbotStore = defineStore('chatbot', () => {
     }
   }
   
+  /**
+   * SSE 응답 본문을 이벤트 단위로 읽기
+   * @param {Response} response - fetch 응답
+   * @returns {AsyncGenerator<{event: string, data: Object}>}
+   */
+  async function* readEvents(response) {
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ''
+    
+    while (true) {
+      const { done, value } = await reader.read()
+      if (done) break
+      buffer += decoder.decode(value, { stream: true })
+      
+      let boundary
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const block = buffer.slice(0, boundary)
+        buffer = buffer.slice(boundary + 2)
+        
+        let event = 'message'
+        let data = ''
+        for (const line of block.split('\n')) {
+          if (line.startsWith('event: ')) event = line.slice(7)
+          else if (line.startsWith('data: ')) data += line.slice(6)
+        }
+        // ':' 로 시작하는 주석(연결 확인용)은 data가 없으므로 건너뜀
+        if (data) yield { event, data: JSON.parse(data) }
+      }
+    }
+  }
+  
   /**
    * 메시지 전송
-   * @description 사용자 메시지를 전송하고 AI 응답을 받습니다
+   * @description 사용자 메시지를 전송하고 AI 응답을 스트리밍으로 받습니다
+   *   - context 이벤트: 응답 말풍선 표시 (뉴스/영상 등 검색 결과 먼저)
+   *   - token 이벤트: 응답 텍스트 이어 붙이기
+   *   - done 이벤트: 최종 응답으로 교체
    * @param {string} message - 사용자 입력 메시지
    * @param {Object|null} location - 위치 정보 (선택)
    */
@@ -97,6 +136,7 @@ export const useChatbotStore = defineStore('chatbot', () => {
     })
     
     isLoading.value = true
+    let botMessage = null
     
     try {
       const requestData = { message: message }
@@ -106,29 +146,57 @@ export const useChatbotStore = defineStore('chatbot', () => {
         requestData.location = location
       }
       
-      const response = await axios.post(`${API_URL}/api/chatbot/`, requestData)
-      
-      // AI 응답 추가
-      messages.value.push({
-        id: Date.now() + 1,
-        type: 'bot',
-        content: response.data.message,
-        data: response.data,
-        intent: response.data.intent,
-        timestamp: new Date()
+      const response = await fetch(`${API_URL}/api/chatbot/stream/`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(requestData)
       })
+      if (!response.ok || !response.body) {
+        throw new Error(`챗봇 응답 오류: ${response.status}`)
+      }
+      
+      for await (const { event, data } of readEvents(response)) {
+        if (event === 'context') {
+          // AI 응답 말풍선 추가 (반응형 객체로 다시 꺼내서 수정)
+          messages.value.push({
+            id: Date.now() + 1,
+            type: 'bot',
+            content: '',
+            data: data,
+            intent: data.intent,
+            timestamp: new Date()
+          })
+          botMessage = messages.value[messages.value.length - 1]
+          isStreaming.value = true
+        } else if (event === 'token' && botMessage) {
+          botMessage.content += data.delta
+        } else if (event === 'done' && botMessage) {
+          botMessage.content = data.message
+          botMessage.data = data
+          botMessage.intent = data.intent
+        } else if (event === 'error') {
+          throw new Error(data.error || data.message)
+        }
+      }
       
     } catch (error) {
       console.error('챗봇 오류:', error)
-      messages.value.push({
-        id: Date.now() + 1,
-        type: 'bot',
-        content: '죄송합니다. 일시적인 오류가 발생했어요. 다시 시도해 주세요. 🙏',
-        error: true,
-        timestamp: new Date()
-      })
+      const errorContent = '죄송합니다. 일시적인 오류가 발생했어요. 다시 시도해 주세요. 🙏'
+      if (botMessage && !botMessage.content) {
+        botMessage.content = errorContent
+        botMessage.error = true
+      } else if (!botMessage) {
+        messages.value.push({
+          id: Date.now() + 1,
+          type: 'bot',
+          content: errorContent,
+          error: true,
+          timestamp: new Date()
+        })
+      }
     } finally {
       isLoading.value = false
+      isStreaming.value = false
     }
   }
   
@@ -226,6 +294,7 @@ export const useChatbotStore = defineStore('chatbot', () => {
     isOpen,
     messages,
     isLoading,
+    isStreaming,
     suggestions,
     // UI 제어
     toggleChat,
@@ -62,6 +62,7 @@ export const useStocksStore = defineStore(
     const chartData = ref(null);
     const stockNews = ref([]);
     const marketIndices = ref([]);  // 주요 지표 (나스닥, S&P500, 환율)
+    const marketIndicesAge = ref(null);  // 주요 지표 데이터 경과 시간(초)
 
     // 로딩 상태
     const loading = ref(false);
@@ -129,9 +130,11 @@ export const useStocksStore = defineStore(
           params: { period }
         });
         marketIndices.value = response.data.indices || [];
+        marketIndicesAge.value = response.data.data_age ?? null;
       } catch (error) {
         console.error('주요 지표 로드 실패:', error);
         marketIndices.value = [];
+        marketIndicesAge.value = null;
       } finally {
         indicesLoading.value = false;
       }
@@ -219,6 +222,19 @@ export const useStocksStore = defineStore(
       }
     };
 
+    /**
+     * 백그라운드 갱신 완료 대기 (update-status 폴링, 최대 약 5분)
+     * @param {string} market - 시장 코드 (KR 또는 US)
+     */
+    const waitForRefresh = async (market) => {
+      for (let i = 0; i < 150; i++) {
+        await fetchUpdateStatus();
+        const state = updateStatus.value[market]?.status;
+        if (state !== 'queued' && state !== 'in_progress') return;
+        await new Promise((resolve) => setTimeout(resolve, 2000));
+      }
+    };
+
     /**
      * 주식 데이터 갱신 (30분 제한)
      * @param {string} market - 시장 코드 (KR 또는 US)
@@ -234,12 +250,18 @@ export const useStocksStore = defineStore(
         });
         
         if (response.data.success) {
+          // 갱신은 백그라운드에서 진행 → 상태가 끝날 때까지 확인
+          await waitForRefresh(market.toUpperCase());
           if (market === 'KR') {
             await fetchKrStocks(1, perPage.value);
           } else {
             await fetchUsStocks(1, perPage.value);
           }
-          await fetchUpdateStatus();
+          const final = updateStatus.value[market.toUpperCase()] || {};
+          return {
+            success: final.status !== 'failed',
+            message: final.message || response.data.message,
+          };
         }
         
         return response.data;
@@ -620,6 +642,7 @@ export const useStocksStore = defineStore(
       totalCount,
       perPage,
       marketIndices,
+      marketIndicesAge,
       indicesLoading,
       updateStatus,
 